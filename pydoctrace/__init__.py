@@ -0,0 +1,21 @@
+from pydoctrace.doctrace import (
+    trace,
+    trace_to_aggregated_component_puml,
+    trace_to_component_puml,
+    trace_to_puml,
+    trace_to_sequence_puml,
+)
+from pydoctrace.switch import arm_tracing, disable_tracing, enable_tracing, install_signal_trigger, is_tracing_enabled
+
+__all__ = (
+    'arm_tracing',
+    'disable_tracing',
+    'enable_tracing',
+    'install_signal_trigger',
+    'is_tracing_enabled',
+    'trace',
+    'trace_to_aggregated_component_puml',
+    'trace_to_component_puml',
+    'trace_to_puml',
+    'trace_to_sequence_puml',
+)
@@ -0,0 +1,6 @@
+from sys import exit
+
+from pydoctrace.cli import main
+
+if __name__ == '__main__':
+    exit(main())
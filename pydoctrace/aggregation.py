@@ -0,0 +1,76 @@
+"""
+Module dedicated to the aggregation of the component interactions traced during many executions of a function,
+to document the actual calls graph of a long-running program (a service, a worker, etc.) with little I/O.
+"""
+
+from atexit import register
+from threading import Lock
+from time import monotonic
+from typing import Type
+
+from pydoctrace.exporters.components import ComponentsAggregate, ComponentsExporter
+from pydoctrace.exporters.plantuml.component import PlantUMLAggregatedComponentExporter
+
+
+class ComponentsAccumulator:
+    """
+    Long-lived accumulator merging the component interactions traced during the executions of a function,
+    possibly in several threads, and exporting them in a single component diagram:
+    - periodically, when an execution ends more than flush_interval_seconds after the previous export
+      (None to disable the periodic exports)
+    - when the interpreter exits
+    - on demand, with flush()
+    """
+
+    def __init__(
+        self,
+        exporter_class: Type[PlantUMLAggregatedComponentExporter],
+        export_file_path: str,
+        start_module: str,
+        start_function_name: str,
+        flush_interval_seconds: float = None,
+    ):
+        self.exporter_class = exporter_class
+        self.export_file_path = export_file_path
+        self.start_module = start_module
+        self.start_function_name = start_function_name
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self.aggregate = ComponentsAggregate()
+        self.lock = Lock()
+        self.last_flush_time = monotonic()
+        self.has_pending_executions = False
+
+        register(self.flush)
+
+    def add_execution(self, components_exporter: ComponentsExporter):
+        """
+        Merges the interactions traced during an execution, and exports the diagram if the flush interval has elapsed.
+        """
+        with self.lock:
+            self.aggregate.add_execution(components_exporter)
+            self.has_pending_executions = True
+
+            if (
+                self.flush_interval_seconds is not None
+                and monotonic() - self.last_flush_time >= self.flush_interval_seconds
+            ):
+                self._export()
+
+    def flush(self):
+        """
+        Exports the diagram if executions were merged since the previous export.
+        """
+        with self.lock:
+            if self.has_pending_executions:
+                self._export()
+
+    def _export(self):
+        # the whole diagram is rewritten because the components structure must be declared before the interactions
+        with self.exporter_class.export_manager_factory(self.export_file_path) as exporter:
+            exporter.on_header(self.start_module, self.start_function_name)
+            exporter.set_aggregate(self.aggregate)
+            exporter.on_footer()
+
+        self.last_flush_time = monotonic()
+        self.has_pending_executions = False
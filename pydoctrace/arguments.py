@@ -0,0 +1,145 @@
+"""
+Module dedicated to the opt-in capture of the arguments of the traced calls, with a bounded cost:
+- the arguments are captured only for the traced calls selected by the presets of the capture policy;
+  the calls filtered out by the call filter of the tracing are not inspected at all
+- the arguments are captured by reference when the call starts, and rendered only by the exporters showing them
+  (their rendering thus reflects the state of the values at the rendering time)
+- the rendering is bounded: a maximum number of arguments, bounded values (see pydoctrace.exporters.values)
+  and a maximum length for the whole text
+- the rendered text may span several lines (str values): the exporters escape the line breaks if their format
+  requires it (the PlantUML notes are one-line statements)
+"""
+
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from types import CodeType
+from typing import Any, Dict, Iterable, NamedTuple, Tuple
+
+from pydoctrace.callfilter import CallFilter, call_filter_factory
+from pydoctrace.callfilter.presets import Preset
+from pydoctrace.domain.execution import FunctionDescriptor
+from pydoctrace.exporters.values import TRUNCATION_MARKER, ValueRenderer, ValueRenderingPolicy, truncate
+
+
+class ArgumentsCapturePolicy(NamedTuple):
+    """
+    Defines which arguments are captured and how they are rendered:
+    - presets: restricts the capture to the traced calls which are not excluded by these presets
+      (see pydoctrace.callfilter.presets); the arguments of all the traced calls are captured if empty
+    - max_arguments: the maximum number of arguments captured for each call
+    - max_length: the maximum length of the rendered arguments of a call, including the truncation marker
+    - value_rendering: the rendering policy of each argument value
+    - ignored_names: the names of the arguments which are not captured (the instance or the class of the methods)
+    """
+
+    presets: Iterable[Preset] = ()
+    max_arguments: int = 6
+    max_length: int = 120
+    value_rendering: ValueRenderingPolicy = ValueRenderingPolicy(max_length=40, max_items=3, max_level=1)
+    ignored_names: Tuple[str, ...] = ('self', 'cls')
+
+
+class ArgumentNames(NamedTuple):
+    """
+    The arguments of a function to capture:
+    - names: the names of the arguments, to retrieve their values in the frame locals
+    - labels: the labels of the arguments in the rendering (prefixed by * or ** for the variadic arguments)
+    - has_omitted_arguments: True if some arguments are not captured because of max_arguments
+    """
+
+    names: Tuple[str, ...]
+    labels: Tuple[str, ...]
+    has_omitted_arguments: bool
+
+
+class CapturedArguments:
+    """
+    The arguments of a traced call, rendered lazily (once, the first time the text is requested).
+    """
+
+    __slots__ = ('arguments_capture', 'argument_names', 'values', 'text')
+
+    def __init__(self, arguments_capture: 'ArgumentsCapture', argument_names: ArgumentNames, values: Tuple[Any, ...]):
+        self.arguments_capture = arguments_capture
+        self.argument_names = argument_names
+        self.values = values
+        self.text: str = None
+
+    def render(self) -> str:
+        if self.text is None:
+            self.text = self.arguments_capture.render(self)
+            # releases the references to the values once they are rendered
+            self.values = None
+
+        return self.text
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+class ArgumentsCapture:
+    """
+    Captures the arguments of the traced calls according to the given policy, at the 'call' event of the tracer.
+
+    The argument names are computed once per code object. It can be shared by several tracers.
+    """
+
+    def __init__(self, policy: ArgumentsCapturePolicy):
+        self.policy = policy
+        self.call_filter: CallFilter = call_filter_factory(tuple(policy.presets))
+        self.value_renderer = ValueRenderer(policy.value_rendering)
+        self.argument_names_by_code: Dict[CodeType, ArgumentNames] = {}
+
+    def should_capture(self, called: FunctionDescriptor, call_depth: int) -> bool:
+        return self.call_filter.should_trace_call(called.fq_module_tuple, called.function_name, call_depth)
+
+    def argument_names(self, code: CodeType) -> ArgumentNames:
+        """
+        Retrieves the names of the arguments of the given code object from the cache, or computes them and caches them.
+        The arguments are the first local variables of the code object: the positional ones, the keyword-only ones,
+        then the variadic positional and keyword ones (if any); they are labelled in the order of the signature.
+        """
+        argument_names = self.argument_names_by_code.get(code)
+        if argument_names is None:
+            positional_count, keyword_only_count = code.co_argcount, code.co_kwonlyargcount
+            variadic_index = positional_count + keyword_only_count
+            labels = list(code.co_varnames[:positional_count])
+            if code.co_flags & CO_VARARGS:
+                labels.append(f'*{code.co_varnames[variadic_index]}')
+                variadic_index += 1
+            labels.extend(code.co_varnames[positional_count : positional_count + keyword_only_count])
+            if code.co_flags & CO_VARKEYWORDS:
+                labels.append(f'**{code.co_varnames[variadic_index]}')
+
+            labels = [label for label in labels if label.lstrip('*') not in self.policy.ignored_names]
+            max_arguments = self.policy.max_arguments
+            captured_labels = tuple(labels[:max_arguments])
+            argument_names = ArgumentNames(
+                tuple(label.lstrip('*') for label in captured_labels),
+                captured_labels,
+                len(labels) > max_arguments,
+            )
+            self.argument_names_by_code[code] = argument_names
+
+        return argument_names
+
+    def capture(self, frame) -> CapturedArguments:
+        """
+        Captures the arguments of the call executed in the given frame, None if the function has no argument to capture.
+        """
+        argument_names = self.argument_names(frame.f_code)
+        if len(argument_names.labels) == 0 and not argument_names.has_omitted_arguments:
+            return None
+
+        frame_locals = frame.f_locals
+        return CapturedArguments(self, argument_names, tuple(frame_locals.get(name) for name in argument_names.names))
+
+    def render(self, captured_arguments: CapturedArguments) -> str:
+        argument_names = captured_arguments.argument_names
+        render_value = self.value_renderer.render
+        rendered_arguments = [
+            f'{label}={render_value(value)}' for label, value in zip(argument_names.labels, captured_arguments.values)
+        ]
+        if argument_names.has_omitted_arguments:
+            rendered_arguments.append(TRUNCATION_MARKER)
+
+        return truncate(', '.join(rendered_arguments), self.policy.max_length)
@@ -0,0 +1,124 @@
+"""
+Module dedicated to the export of many recorded traces in parallel, with a pool of processes.
+
+The export settings are given by name so that they can be sent to the worker processes: each worker resolves them
+once (in its initializer) and reuses the exporters, the filtering presets and the formatters for all its recordings.
+The exported files are named after the recordings; the recordings which would be exported in the same files as other
+recordings are not exported (they would be overwritten, or written concurrently by several workers) and reported as
+failures.
+"""
+
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from os.path import abspath
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Sequence
+
+from pydoctrace.callfilter import Preset
+from pydoctrace.exporters import ExportTarget
+from pydoctrace.replay import export_recording, recording_export_targets
+from pydoctrace.settings import ExportSettings, filter_presets_from_settings, recording_export_targets_from_settings
+
+
+class BatchExportResult(NamedTuple):
+    """
+    The outcome of the export of a recording: error describes the failure, None if the export succeeded.
+    """
+
+    recording_path: str
+    error: str = None
+
+
+# the export settings resolved once in each worker process
+_worker_export_targets: Sequence[ExportTarget] = None
+_worker_filter_presets: Sequence[Preset] = None
+
+
+def init_export_worker(export_settings: ExportSettings):
+    global _worker_export_targets, _worker_filter_presets
+    _worker_export_targets = recording_export_targets_from_settings(export_settings)
+    _worker_filter_presets = filter_presets_from_settings(export_settings)
+
+
+def export_recording_in_worker(recording_path: str) -> BatchExportResult:
+    """
+    Exports the recording with the settings of the worker, reports the failure instead of raising it.
+    """
+    try:
+        export_recording(recording_path, _worker_export_targets, _worker_filter_presets)
+    except Exception as error:
+        return BatchExportResult(recording_path, f'{error.__class__.__name__}: {error}')
+
+    return BatchExportResult(recording_path)
+
+
+def colliding_exports_errors(recording_paths: Sequence[str], export_targets: Sequence[ExportTarget]) -> Dict[int, str]:
+    """
+    Detects the recordings which would be exported in the same files as other recordings.
+    Returns the errors describing the collisions, by index of the recordings.
+    """
+    recording_indices_by_export_path: Dict[str, List[int]] = defaultdict(list)
+    for recording_index, recording_path in enumerate(recording_paths):
+        for _, export_file_path in recording_export_targets(recording_path, export_targets):
+            recording_indices_by_export_path[abspath(export_file_path)].append(recording_index)
+
+    errors_by_recording_index: Dict[int, str] = {}
+    for export_file_path, recording_indices in recording_indices_by_export_path.items():
+        if len(recording_indices) > 1:
+            colliding_paths = ', '.join(recording_paths[recording_index] for recording_index in recording_indices)
+            for recording_index in recording_indices:
+                errors_by_recording_index.setdefault(
+                    recording_index, f'ValueError: {export_file_path} would be exported by {colliding_paths}'
+                )
+
+    return errors_by_recording_index
+
+
+def batch_export_recordings(
+    recording_paths: Iterable[str],
+    export_settings: ExportSettings,
+    max_workers: int = None,
+    on_result: Callable[[BatchExportResult], None] = None,
+) -> List[BatchExportResult]:
+    """
+    Exports the recordings with a pool of max_workers processes (as many as the CPUs if None),
+    or in the current process if max_workers is 1.
+
+    The recordings which would be exported in the same files as other recordings are not exported, they fail.
+    The results are reported to on_result (if given) and returned in the order of the recordings.
+    """
+    recording_paths = list(recording_paths)
+    errors_by_recording_index = colliding_exports_errors(
+        recording_paths, recording_export_targets_from_settings(export_settings)
+    )
+    exported_recording_paths = [
+        recording_path
+        for recording_index, recording_path in enumerate(recording_paths)
+        if recording_index not in errors_by_recording_index
+    ]
+    results: List[BatchExportResult] = []
+
+    def collect_results(export_results: Iterator[BatchExportResult]):
+        # merges the results of the exports with the failures of the colliding recordings
+        for recording_index, recording_path in enumerate(recording_paths):
+            error = errors_by_recording_index.get(recording_index)
+            export_result = next(export_results) if error is None else BatchExportResult(recording_path, error)
+            results.append(export_result)
+            if on_result is not None:
+                on_result(export_result)
+
+    if max_workers == 1:
+        init_export_worker(export_settings)
+        collect_results(export_recording_in_worker(recording_path) for recording_path in exported_recording_paths)
+    else:
+        workers_count = max_workers or cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers_count, initializer=init_export_worker, initargs=(export_settings,)
+        ) as executor:
+            # sends the recordings by chunks to reduce the inter-process communications
+            chunk_size = max(1, len(exported_recording_paths) // (4 * workers_count))
+            collect_results(
+                iter(executor.map(export_recording_in_worker, exported_recording_paths, chunksize=chunk_size))
+            )
+
+    return results
@@ -0,0 +1,153 @@
+"""
+Benchmarks the tracing overhead on the workloads of the pydoctrace.bench.workloads module,
+per exporter and per set of filtering presets:
+
+python -m pydoctrace.bench --output report.json
+python -m pydoctrace.bench --compare baseline-report.json --threshold 0.2
+
+Benchmarks the throughput of the exporters with synthetic tracing events:
+
+python -m pydoctrace.bench exporters --depth 6 --fan-out 10
+"""
+
+import sys
+from argparse import ArgumentParser, Namespace
+from json import dump, load
+from typing import Any, Dict, Sequence
+
+from pydoctrace.bench.events import SyntheticTraceShape
+from pydoctrace.bench.throughput import THROUGHPUT_EXPORTERS_BY_NAME, run_throughput_benchmarks, throughput_report
+from pydoctrace.bench.tracing import PRESET_SETS_BY_NAME, benchmark_report, find_regressions, run_benchmarks
+from pydoctrace.bench.workloads import WORKLOADS_BY_NAME
+from pydoctrace.settings import EXPORT_TARGETS_BY_NAME
+
+
+def bench_parser_factory() -> ArgumentParser:
+    parser = ArgumentParser(prog='python -m pydoctrace.bench', description='Benchmarks the tracing overhead.')
+    parser.add_argument(
+        '-w',
+        '--workload',
+        dest='workload_names',
+        action='append',
+        choices=WORKLOADS_BY_NAME.keys(),
+        help='the workloads to benchmark (can be repeated, all by default)',
+    )
+    parser.add_argument(
+        '-e',
+        '--exporter',
+        dest='exporter_names',
+        action='append',
+        choices=EXPORT_TARGETS_BY_NAME.keys(),
+        help='the exporters to benchmark (can be repeated, all by default)',
+    )
+    parser.add_argument(
+        '-p',
+        '--preset-set',
+        dest='preset_set_names',
+        action='append',
+        choices=PRESET_SETS_BY_NAME.keys(),
+        help='the sets of filtering presets to benchmark (can be repeated, all by default)',
+    )
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='the executions per measure (default: %(default)s)')
+    parser.add_argument(
+        '-o', '--output', help='the path of the JSON report (written on the standard output if not set)'
+    )
+    parser.add_argument('--compare', help='the path of a baseline JSON report to detect regressions')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='the tolerated increase of the overhead per call, compared to the baseline (default: %(default)s for 10%%)',
+    )
+
+    return parser
+
+
+def throughput_parser_factory() -> ArgumentParser:
+    default_shape = SyntheticTraceShape()
+    parser = ArgumentParser(
+        prog='python -m pydoctrace.bench exporters',
+        description='Benchmarks the throughput of the exporters with synthetic tracing events.',
+    )
+    parser.add_argument(
+        '-e',
+        '--exporter',
+        dest='exporter_names',
+        action='append',
+        choices=THROUGHPUT_EXPORTERS_BY_NAME.keys(),
+        help='the exporters to benchmark (can be repeated, all by default)',
+    )
+    parser.add_argument('--depth', type=int, default=default_shape.depth, help='the depth of the calls tree')
+    parser.add_argument('--fan-out', type=int, default=default_shape.fan_out, help='the calls made by each function')
+    parser.add_argument('--modules', type=int, default=default_shape.modules_count, help='the number of modules')
+    parser.add_argument(
+        '--error-rate',
+        type=float,
+        default=default_shape.error_rate,
+        help='the probability for a call to raise an error',
+    )
+    parser.add_argument('--seed', type=int, default=default_shape.seed, help='the seed of the errors generation')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='the exports per measure (default: %(default)s)')
+    parser.add_argument(
+        '-o', '--output', help='the path of the JSON report (written on the standard output if not set)'
+    )
+
+    return parser
+
+
+def write_report(report: Dict[str, Any], output: str):
+    if output is None:
+        dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        with open(output, 'w', encoding='utf8') as report_file:
+            dump(report, report_file, indent=2)
+
+
+def benchmark_exporters(args: Namespace) -> int:
+    shape = SyntheticTraceShape(args.depth, args.fan_out, args.modules, args.error_rate, args.seed)
+    results = run_throughput_benchmarks(shape, args.exporter_names or THROUGHPUT_EXPORTERS_BY_NAME.keys(), args.repeat)
+    write_report(throughput_report(shape, results, args.repeat), args.output)
+
+    return 0
+
+
+def main(argv: Sequence[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ['exporters']:
+        return benchmark_exporters(throughput_parser_factory().parse_args(argv[1:]))
+
+    args = bench_parser_factory().parse_args(argv)
+
+    workloads_by_name = (
+        WORKLOADS_BY_NAME
+        if args.workload_names is None
+        else {workload_name: WORKLOADS_BY_NAME[workload_name] for workload_name in args.workload_names}
+    )
+    results = run_benchmarks(
+        workloads_by_name,
+        args.exporter_names or EXPORT_TARGETS_BY_NAME.keys(),
+        args.preset_set_names or PRESET_SETS_BY_NAME.keys(),
+        args.repeat,
+    )
+    report = benchmark_report(results, args.repeat)
+
+    write_report(report, args.output)
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare, encoding='utf8') as baseline_file:
+        regressions = find_regressions(load(baseline_file), report, args.threshold)
+    for regression in regressions:
+        print(
+            f'regression: {regression.workload} / {regression.exporter} / {regression.preset_set}: '
+            f'{regression.baseline_overhead_per_call_ns:.0f} -> {regression.overhead_per_call_ns:.0f} ns per call',
+            file=sys.stderr,
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
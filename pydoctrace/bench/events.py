@@ -0,0 +1,85 @@
+"""
+Module dedicated to the generation of synthetic tracing events, to benchmark the exporters independently of the tracer.
+
+The events are yielded lazily (so that streams of millions of events can be generated) as BufferedEvent tuples:
+the name of the exporter hook with its positional and keyword arguments.
+"""
+
+from random import Random
+from typing import Iterator, NamedTuple
+
+from pydoctrace.domain.execution import CallEnd, Error
+from pydoctrace.exporters.buffering import BufferedEvent
+
+SYNTHETIC_ROOT_MODULE = 'synthetic'
+
+# the line offsets of the calls and of the returns in the body of the synthetic functions
+CALL_LINE_OFFSET = 2
+RETURN_LINE_OFFSET = 3
+
+
+class SyntheticTraceShape(NamedTuple):
+    """
+    The shape of a synthetic traced execution, which is a tree of calls:
+    - depth: the number of levels of the calls tree (1 for a traced function calling nothing)
+    - fan_out: the number of calls made by each function which is not a leaf of the calls tree
+    - modules_count: the number of modules across which the functions are spread
+    - error_rate: the probability for a call to raise an error (handled by the caller), between 0 and 1
+    - seed: the seed of the random generator deciding which calls raise an error, for reproducible streams
+    """
+
+    depth: int = 5
+    fan_out: int = 5
+    modules_count: int = 10
+    error_rate: float = 0.05
+    seed: int = 0
+
+    def calls_count(self) -> int:
+        return sum(self.fan_out**level for level in range(self.depth))
+
+
+def synthetic_call_end(shape: SyntheticTraceShape, level: int, child_index: int) -> CallEnd:
+    """
+    Creates the called end of a synthetic function: the functions at the same position of the calls tree are the same,
+    so that the diagrams involve depth * fan_out functions whatever the number of calls.
+    """
+    function_index = level * shape.fan_out + child_index
+    module_name = f'module_{function_index % shape.modules_count}'
+
+    return CallEnd(
+        f'{SYNTHETIC_ROOT_MODULE}.{module_name}',
+        (SYNTHETIC_ROOT_MODULE, module_name),
+        f'function_{level}_{child_index}',
+        function_index * 10,
+    )
+
+
+def at_line(call_end: CallEnd, line_offset: int) -> CallEnd:
+    return call_end._replace(line_index=call_end.line_index + line_offset)
+
+
+def generate_events(shape: SyntheticTraceShape) -> Iterator[BufferedEvent]:
+    """
+    Yields the events of a synthetic traced execution, from the start of the tracing to its end.
+    """
+    random = Random(shape.seed)
+    traced = synthetic_call_end(shape, 0, 0)
+
+    def generate_calls(caller: CallEnd, level: int) -> Iterator[BufferedEvent]:
+        calling = at_line(caller, CALL_LINE_OFFSET)
+        for child_index in range(shape.fan_out):
+            called = synthetic_call_end(shape, level, child_index)
+            yield 'on_start_call', (calling, called), {}
+            if level + 1 < shape.depth:
+                yield from generate_calls(called, level + 1)
+
+            if random.random() < shape.error_rate:
+                error = Error('ValueError', f'synthetic error raised by {called.function_name}')
+                yield 'on_error_propagation', (at_line(called, RETURN_LINE_OFFSET), calling, error), {}
+            else:
+                yield 'on_return', (), {'called': at_line(called, RETURN_LINE_OFFSET), 'caller': calling, 'arg': level}
+
+    yield 'on_tracing_start', (traced,), {}
+    if shape.depth > 1:
+        yield from generate_calls(traced, 1)
+    yield 'on_tracing_end', (at_line(traced, RETURN_LINE_OFFSET), None), {}
@@ -0,0 +1,110 @@
+"""
+Module dedicated to the measurement of the throughput of the exporters: synthetic tracing events are pushed
+directly to the exporters, which write in memory, so that the costs of the formatting and of the aggregation
+are measured independently of the tracing costs.
+"""
+
+from io import StringIO
+from sys import version_info
+from time import perf_counter
+from tracemalloc import get_traced_memory, is_tracing
+from tracemalloc import start as start_tracemalloc
+from tracemalloc import stop as stop_tracemalloc
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Type
+
+# note: tracemalloc.reset_peak appeared in Python 3.9
+if version_info.major >= 3 and version_info.minor >= 9:
+    from tracemalloc import reset_peak
+else:
+    reset_peak = None
+
+from pydoctrace.bench.events import SYNTHETIC_ROOT_MODULE, SyntheticTraceShape, generate_events
+from pydoctrace.exporters import Exporter
+from pydoctrace.exporters.buffering import BufferedEvent
+from pydoctrace.exporters.plantuml.component import PlantUMLComponentExporter
+from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+
+THROUGHPUT_EXPORTERS_BY_NAME: Dict[str, Type[Exporter]] = {
+    'sequence': PlantUMLSequenceExporter,
+    'component': PlantUMLComponentExporter,
+}
+
+
+class ThroughputResult(NamedTuple):
+    exporter: str
+    events: int
+    seconds: float
+    # None if the peak cannot be measured (tracemalloc already running, without reset_peak)
+    peak_memory_bytes: int
+    exported_characters: int
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds > 0 else float('inf')
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self._asdict(), 'events_per_second': self.events_per_second}
+
+
+def export_events(exporter_class: Type[Exporter], events: Sequence[BufferedEvent]) -> StringIO:
+    io_sink = StringIO()
+    exporter = exporter_class(io_sink)
+    exporter.on_header(SYNTHETIC_ROOT_MODULE, 'function_0_0')
+    for hook_name, args, kwargs in events:
+        getattr(exporter, hook_name)(*args, **kwargs)
+    exporter.on_footer()
+
+    return io_sink
+
+
+def measure_throughput(exporter_name: str, events: Sequence[BufferedEvent], repeat: int) -> ThroughputResult:
+    """
+    Measures the fastest export of the events (a second export measures the peak of memory allocated while exporting,
+    tracemalloc slowing the allocations down).
+
+    If tracemalloc is already running, its peak is reset before the export so that it does not come from previous
+    allocations; the peak is not measured if it cannot be reset (Python 3.8).
+    """
+    exporter_class = THROUGHPUT_EXPORTERS_BY_NAME[exporter_name]
+    durations = []
+    for _ in range(repeat):
+        start = perf_counter()
+        io_sink = export_events(exporter_class, events)
+        durations.append(perf_counter() - start)
+    exported_characters = len(io_sink.getvalue())
+    del io_sink
+
+    peak_memory_bytes = None
+    was_tracing_memory = is_tracing()
+    if not was_tracing_memory or reset_peak is not None:
+        if was_tracing_memory:
+            reset_peak()
+        else:
+            start_tracemalloc()
+        try:
+            memory_before, _ = get_traced_memory()
+            export_events(exporter_class, events)
+            _, peak_memory = get_traced_memory()
+            peak_memory_bytes = peak_memory - memory_before
+        finally:
+            if not was_tracing_memory:
+                stop_tracemalloc()
+
+    return ThroughputResult(exporter_name, len(events), min(durations), peak_memory_bytes, exported_characters)
+
+
+def run_throughput_benchmarks(
+    shape: SyntheticTraceShape, exporter_names: Iterable[str], repeat: int
+) -> List[ThroughputResult]:
+    # the events are generated beforehand so that the generation costs are not measured
+    events = list(generate_events(shape))
+
+    return [measure_throughput(exporter_name, events, repeat) for exporter_name in exporter_names]
+
+
+def throughput_report(shape: SyntheticTraceShape, results: Iterable[ThroughputResult], repeat: int) -> Dict[str, Any]:
+    return {
+        'shape': shape._asdict(),
+        'repeat': repeat,
+        'results': [result.as_dict() for result in results],
+    }
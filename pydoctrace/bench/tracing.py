@@ -0,0 +1,183 @@
+"""
+Module dedicated to the measurement of the tracing overhead: each workload is executed without tracing,
+then traced with each exporter and each set of filtering presets (the exports being written in memory).
+
+The overhead is expressed per Python call made by the workload, because all the calls go through the tracer,
+whether they are filtered out or not.
+"""
+
+from io import BytesIO, StringIO
+from platform import platform, python_implementation, python_version
+from sys import getrecursionlimit, setrecursionlimit
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence, Type
+
+from pydoctrace.callfilter import Preset, call_filter_factory
+from pydoctrace.callfilter.presets import EXCLUDE_DEPTH_BELOW_5_PRESET, TRACE_ALL_PRESET
+from pydoctrace.doctrace import DEFAULT_FILTERS
+from pydoctrace.domain.execution import CallEnd
+from pydoctrace.exporters import Exporter
+from pydoctrace.settings import EXPORT_TARGETS_BY_NAME
+from pydoctrace.tracer import ExecutionTracer
+
+# the sets of filtering presets whose overhead is benchmarked
+PRESET_SETS_BY_NAME: Dict[str, Sequence[Preset]] = {
+    'trace-all': (TRACE_ALL_PRESET,),
+    'default': DEFAULT_FILTERS,
+    'exclude-depth-below-5': (EXCLUDE_DEPTH_BELOW_5_PRESET,),
+}
+
+# the deep workloads involve more nested calls when they are traced
+MIN_RECURSION_LIMIT = 5000
+
+
+class CallsCounter(Exporter):
+    """
+    Counts the calls going through the tracer, without exporting anything.
+    """
+
+    def __init__(self):
+        super().__init__(None)
+        self.calls_count = 0
+
+    def on_tracing_start(self, called: CallEnd):
+        self.calls_count += 1
+
+    def on_start_call(self, caller: CallEnd, called: CallEnd):
+        self.calls_count += 1
+
+    def on_error_propagation(self, *args, **kwargs):
+        pass
+
+    def on_return(self, **kwargs):
+        pass
+
+    def on_tracing_end(self, *args):
+        pass
+
+    def on_unhandled_error_end(self, *args):
+        pass
+
+
+class BenchmarkResult(NamedTuple):
+    workload: str
+    exporter: str
+    preset_set: str
+    calls: int
+    untraced_seconds: float
+    traced_seconds: float
+
+    @property
+    def overhead_per_call_ns(self) -> float:
+        return (self.traced_seconds - self.untraced_seconds) * 1_000_000_000 / max(self.calls, 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**self._asdict(), 'overhead_per_call_ns': self.overhead_per_call_ns}
+
+
+def best_duration(function: Callable[[], Any], repeat: int) -> float:
+    """
+    Returns the shortest duration of the given number of executions of the function, the least disturbed one.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+
+    return min(durations)
+
+
+def count_calls(workload_function: Callable, workload_args: Sequence[Any]) -> int:
+    calls_counter = CallsCounter()
+    ExecutionTracer(calls_counter, call_filter_factory((TRACE_ALL_PRESET,))).runfunc(workload_function, *workload_args)
+
+    return calls_counter.calls_count
+
+
+def traced_run_factory(
+    exporter_class: Type[Exporter], filter_presets: Sequence[Preset], workload_function: Callable, workload_args
+) -> Callable[[], Any]:
+    def traced_run():
+        exporter = exporter_class(BytesIO() if exporter_class.binary_export else StringIO())
+        exporter.on_header(workload_function.__module__, workload_function.__name__)
+        ExecutionTracer(exporter, call_filter_factory(filter_presets)).runfunc(workload_function, *workload_args)
+        exporter.on_footer()
+
+    return traced_run
+
+
+def run_benchmarks(
+    workloads_by_name: Dict[str, Any],
+    exporter_names: Iterable[str],
+    preset_set_names: Iterable[str],
+    repeat: int,
+) -> List[BenchmarkResult]:
+    exporter_names, preset_set_names = list(exporter_names), list(preset_set_names)
+    recursion_limit = getrecursionlimit()
+    setrecursionlimit(max(recursion_limit, MIN_RECURSION_LIMIT))
+    try:
+        results = []
+        for workload_name, (workload_function, workload_args) in workloads_by_name.items():
+            calls = count_calls(workload_function, workload_args)
+            untraced_seconds = best_duration(lambda: workload_function(*workload_args), repeat)  # noqa: B023
+            for exporter_name in exporter_names:
+                exporter_class = EXPORT_TARGETS_BY_NAME[exporter_name].exporter_class
+                for preset_set_name in preset_set_names:
+                    traced_run = traced_run_factory(
+                        exporter_class, PRESET_SETS_BY_NAME[preset_set_name], workload_function, workload_args
+                    )
+                    results.append(
+                        BenchmarkResult(
+                            workload_name,
+                            exporter_name,
+                            preset_set_name,
+                            calls,
+                            untraced_seconds,
+                            best_duration(traced_run, repeat),
+                        )
+                    )
+
+        return results
+    finally:
+        setrecursionlimit(recursion_limit)
+
+
+def benchmark_report(results: Iterable[BenchmarkResult], repeat: int) -> Dict[str, Any]:
+    return {
+        'environment': {
+            'python_implementation': python_implementation(),
+            'python_version': python_version(),
+            'platform': platform(),
+        },
+        'repeat': repeat,
+        'results': [result.as_dict() for result in results],
+    }
+
+
+class Regression(NamedTuple):
+    workload: str
+    exporter: str
+    preset_set: str
+    baseline_overhead_per_call_ns: float
+    overhead_per_call_ns: float
+
+
+def find_regressions(baseline_report: Dict[str, Any], report: Dict[str, Any], threshold: float) -> List[Regression]:
+    """
+    Compares the overheads per call of the report with the ones of the baseline report (for the same workload,
+    exporter and preset set): a regression is an overhead increased by more than the threshold (0.1 for 10%).
+    """
+
+    def by_key(report_to_index: Dict[str, Any]) -> Dict[tuple, float]:
+        return {
+            (result['workload'], result['exporter'], result['preset_set']): result['overhead_per_call_ns']
+            for result in report_to_index['results']
+        }
+
+    baseline_overheads = by_key(baseline_report)
+    return [
+        Regression(*key, baseline_overheads[key], overhead)
+        for key, overhead in by_key(report).items()
+        if key in baseline_overheads and overhead > baseline_overheads[key] * (1 + threshold)
+    ]
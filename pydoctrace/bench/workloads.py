@@ -0,0 +1,207 @@
+"""
+Module dedicated to the workloads of the tracing benchmarks. They are defined here rather than imported from the
+modules of the automated tests, which are not distributed with the package, and mimic them:
+- many short calls (a recursive Fibonacci suite)
+- a deep calls stack (a recursive factorial)
+- errors raised, propagated, wrapped and handled (a factorial with a value checker)
+- calls to several functions and builtins (the computation of an ecoindex, interpolating quantiles)
+- nested calls across depth thresholds
+"""
+
+from functools import reduce
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+
+
+def fibonacci(value: int) -> int:
+    if value <= 1:
+        return value
+
+    return fibonacci(value - 1) + fibonacci(value - 2)
+
+
+def factorial_recursive(value: int) -> int:
+    if value <= 1:
+        return value
+
+    return value * factorial_recursive(value - 1)
+
+
+class FactorialError(BaseException):
+    pass
+
+
+def is_positive_int(value: Any) -> bool:
+    if not (isinstance(value, int) and value >= 0):
+        raise_value_error(f'Value must be a positive integer, got {value}.')
+
+    return True
+
+
+def raise_value_error(message: str):
+    raise ValueError(message)
+
+
+def check_or_wrap_error(value_to_check: Any, validator: Callable) -> Any:
+    try:
+        if validator(value_to_check):
+            return value_to_check
+    except BaseException as base_exception:
+        raise FactorialError() from base_exception
+
+
+def log_factorial_error(factorial_error: FactorialError):
+    pass
+
+
+def factorial_reduce_multiply(value: int) -> int:
+    if value <= 1:
+        return value
+
+    def multiply(agg: int, value: int) -> int:
+        return agg * value
+
+    return reduce(multiply, range(1, value + 1), 1)
+
+
+def factorial_with_checker(value: int):
+    try:
+        return factorial_reduce_multiply(check_or_wrap_error(value, is_positive_int))
+    except FactorialError as factorial_error:
+        log_factorial_error(factorial_error)
+
+        return None
+
+
+# quantiles
+ELEMENTS_NB_QUANTILES = (
+    0,
+    47,
+    75,
+    159,
+    233,
+    298,
+    358,
+    417,
+    476,
+    537,
+    603,
+    674,
+    753,
+    843,
+    949,
+    1076,
+    1237,
+    1459,
+    1801,
+    2479,
+    594601,
+)
+REQUESTS_NB_QUANTILES = (0, 2, 15, 25, 34, 42, 49, 56, 63, 70, 78, 86, 95, 105, 117, 130, 147, 170, 205, 281, 3920)
+SIZES_KB_QUANTILES = (
+    0,
+    1.37,
+    144.7,
+    319.53,
+    479.46,
+    631.97,
+    783.38,
+    937.91,
+    1098.62,
+    1265.47,
+    1448.32,
+    1648.27,
+    1876.08,
+    2142.06,
+    2465.37,
+    2866.31,
+    3401.59,
+    4155.73,
+    5400.08,
+    8037.54,
+    223212.26,
+)
+
+
+def to_quantile_position(value: float, quantiles: tuple) -> float:
+    if value is None or value < 0:
+        raise ValueError('value must be a positive number')
+
+    for lower_index, upper_value in enumerate(quantiles[1:]):
+        if upper_value > value:
+            lower_value = quantiles[lower_index]
+            interpolated_position = lower_index + (value - lower_value) / (upper_value - lower_value)
+            break
+    else:
+        # value is above the max threshold -> returns the maximum note (20)
+        interpolated_position = len(quantiles) - 1
+
+    acknowledge_interpolation(interpolated_position, quantiles)
+    return interpolated_position
+
+
+def acknowledge_interpolation(interpolated_position: float, quantiles: tuple):
+    # assert and returns nothing
+    assert 0 <= interpolated_position <= len(quantiles)
+
+
+def ecoindex(dom_elements_nb: int, requests_nb: int, size_kb: float) -> float:
+    dom_quantile: float = to_quantile_position(dom_elements_nb, ELEMENTS_NB_QUANTILES)
+    requests_quantile: float = to_quantile_position(requests_nb, REQUESTS_NB_QUANTILES)
+    size_quantile: float = to_quantile_position(size_kb, SIZES_KB_QUANTILES)
+
+    return validate_ecoindex(100 - (5 * (3 * dom_quantile + 2 * requests_quantile + size_quantile) / 6))
+
+
+def validate_ecoindex(ecoscore: float) -> float:
+    assert 0 <= ecoscore <= 100
+    return ecoscore
+
+
+def depth_6():
+    return 6
+
+
+def depth_5():
+    return depth_6()
+
+
+def depth_4():
+    return depth_5()
+
+
+def depth_3():
+    return depth_4()
+
+
+def depth_2():
+    return depth_3()
+
+
+def depth_1():
+    return depth_2() + depth_4()
+
+
+class Workload(NamedTuple):
+    """
+    A function called with some arguments, whose tracing is benchmarked.
+    """
+
+    function: Callable
+    args: Tuple[Any, ...]
+
+    def run(self) -> Any:
+        return self.function(*self.args)
+
+
+WORKLOADS_BY_NAME: Dict[str, Workload] = {
+    # many short calls
+    'fibonacci': Workload(fibonacci, (15,)),
+    # a deep calls stack
+    'factorial-deep': Workload(factorial_recursive, (300,)),
+    # errors raised, propagated and handled
+    'factorial-errors': Workload(factorial_with_checker, (-1,)),
+    # calls to several functions and builtins
+    'ecoindex': Workload(ecoindex, (960, 70, 1500)),
+    # nested calls across depth thresholds
+    'call-depth': Workload(depth_1, ()),
+}
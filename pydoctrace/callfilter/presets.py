@@ -104,3 +104,12 @@ EXCLUDE_CALL_DEPTH_PRESET_FACTORY = _depth_preset_factory
 
 # excludes calls whose depth in the calls stack is below (greater than) 5
 EXCLUDE_DEPTH_BELOW_5_PRESET = EXCLUDE_CALL_DEPTH_PRESET_FACTORY(5)
+
+# the presets by name, to select them from the command line
+PRESETS_BY_NAME = {
+    'exclude-builtins': EXCLUDE_BUILTINS_PRESET,
+    'exclude-stdlib': EXCLUDE_STDLIB_PRESET,
+    'exclude-tests': EXCLUDE_TESTS_PRESET,
+    'exclude-depth-below-5': EXCLUDE_DEPTH_BELOW_5_PRESET,
+    'trace-all': TRACE_ALL_PRESET,
+}
@@ -0,0 +1,223 @@
+"""
+Command-line interface tracing the execution of a script or a module, without modifying its code
+(like the command-line interface of cProfile):
+
+python -m pydoctrace [--sequence] [--component] [--preset exclude-stdlib] [--max-depth 10] -m package.module [args...]
+python -m pydoctrace [options] script.py [args...]
+
+It also exports recorded traces (exported by the JSONLinesExporter) with other exporters or filtering presets:
+
+python -m pydoctrace export [--component] [--preset exclude-stdlib] [--max-depth 10] recording.jsonl [...]
+"""
+
+import sys
+from argparse import REMAINDER, ArgumentParser, Namespace
+from importlib.machinery import ModuleSpec
+from io import open_code
+from os.path import dirname, realpath
+from pathlib import Path
+from runpy import _get_module_details
+from typing import Any, Dict, Sequence, Tuple
+
+from pydoctrace.batch import BatchExportResult, batch_export_recordings
+from pydoctrace.callfilter.presets import PRESETS_BY_NAME
+from pydoctrace.doctrace import named_context_factory, tracing_context_factory
+from pydoctrace.settings import (
+    EXPORT_TARGETS_BY_NAME,
+    ExportSettings,
+    export_targets_from_settings,
+    filter_presets_from_settings,
+)
+from pydoctrace.stats import TracingStats
+
+# the module name of the traced script or module, as if it was run by the Python interpreter
+MAIN_MODULE_NAME = '__main__'
+
+
+def add_export_arguments(parser: ArgumentParser):
+    """
+    Adds the arguments selecting the exporters and the filtering presets.
+    """
+    parser.add_argument(
+        '--sequence',
+        dest='exporter_names',
+        action='append_const',
+        const='sequence',
+        help='exports a sequence diagram (default)',
+    )
+    parser.add_argument(
+        '--component',
+        dest='exporter_names',
+        action='append_const',
+        const='component',
+        help='exports a component diagram',
+    )
+    parser.add_argument(
+        '-e',
+        '--exporter',
+        dest='exporter_names',
+        action='append',
+        choices=EXPORT_TARGETS_BY_NAME.keys(),
+        help='exports the execution with the given exporter (can be repeated)',
+    )
+    parser.add_argument(
+        '-p',
+        '--preset',
+        dest='preset_names',
+        action='append',
+        choices=PRESETS_BY_NAME.keys(),
+        help='filters the traced calls with the given preset (can be repeated); '
+        'by default, excludes the calls to the standard library and to the tests modules',
+    )
+    parser.add_argument('--max-depth', type=int, help='does not trace the calls deeper than the given depth')
+    parser.add_argument(
+        '-o', '--output-dir', default='.', help='the directory where the files are exported (default: %(default)s)'
+    )
+
+
+def trace_parser_factory() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog='python -m pydoctrace',
+        description='Traces the execution of a script or a module and exports it as diagrams. '
+        "Use 'python -m pydoctrace export' to export recorded traces.",
+    )
+    add_export_arguments(parser)
+    parser.add_argument(
+        '--stats',
+        dest='tracing_stats',
+        action='store_true',
+        help='reports statistics about the tracing on the standard error output and in the PlantUML exports',
+    )
+    parser.add_argument('-m', dest='run_module', action='store_true', help='runs the target as a module')
+    parser.add_argument('target', help='the script path or the module name (with -m) to trace')
+    parser.add_argument('arguments', nargs=REMAINDER, help='the arguments passed to the script or module')
+
+    return parser
+
+
+def module_code_and_globals(module_name: str) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Loads the code of the module to run it as the main module (like 'python -m module_name' does).
+    """
+    _, module_spec, code = _get_module_details(module_name)
+    return code, {
+        '__name__': MAIN_MODULE_NAME,
+        '__file__': module_spec.origin,
+        '__package__': module_spec.parent,
+        '__loader__': module_spec.loader,
+        '__spec__': module_spec,
+        '__cached__': None,
+    }
+
+
+def script_code_and_globals(script_path: str) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Compiles the code of the script to run it as the main module (like 'python script_path' does).
+    """
+    with open_code(script_path) as script_file:
+        code = compile(script_file.read(), script_path, 'exec')
+
+    script_spec = ModuleSpec(name=MAIN_MODULE_NAME, loader=None, origin=script_path)
+    return code, {
+        '__name__': MAIN_MODULE_NAME,
+        '__file__': script_path,
+        '__package__': None,
+        '__spec__': script_spec,
+        '__cached__': None,
+    }
+
+
+def trace_target(args: Namespace):
+    """
+    Runs the script or the module given in the arguments in a tracing context.
+
+    The exported files are named after the script or the module; the errors raised by the traced code,
+    including SystemExit, are propagated once the diagrams are exported.
+    """
+    if args.run_module:
+        code, code_globals = module_code_and_globals(args.target)
+        target_name = args.target
+        main_path = None
+    else:
+        code, code_globals = script_code_and_globals(args.target)
+        target_name = Path(args.target).stem
+        main_path = dirname(realpath(args.target))
+
+    filter_presets = filter_presets_from_settings(args)
+    contexts = [
+        named_context_factory(MAIN_MODULE_NAME, target_name, exporter_class, export_file_path_tpl, filter_presets)
+        for exporter_class, export_file_path_tpl in export_targets_from_settings(args)
+    ]
+
+    # the traced code sees its own arguments and, for scripts, its directory as the first import path
+    original_argv, original_path = sys.argv, sys.path[:]
+    sys.argv = [args.target, *args.arguments]
+    if main_path is not None:
+        sys.path.insert(0, main_path)
+    tracing_stats = TracingStats() if args.tracing_stats else None
+    try:
+        with tracing_context_factory(*contexts, tracing_stats=tracing_stats) as execution_tracer:
+            execution_tracer.runfunc(exec, code, code_globals)
+    finally:
+        sys.argv, sys.path[:] = original_argv, original_path
+        if tracing_stats is not None:
+            print('\n'.join(('tracing statistics:', *tracing_stats.summary_lines())), file=sys.stderr)
+
+
+def export_parser_factory() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog='python -m pydoctrace export',
+        description='Exports traces recorded in the JSON Lines format with other exporters and filtering presets, '
+        'without running the traced code again.',
+    )
+    add_export_arguments(parser)
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='the number of processes exporting the recordings in parallel (default: the number of CPUs)',
+    )
+    parser.add_argument(
+        'recordings', nargs='+', help="the paths of the recorded traces (.jsonl files, or '.jsonl.gz' compressed ones)"
+    )
+
+    return parser
+
+
+def export_recordings(args: Namespace) -> int:
+    """
+    Exports the recordings in parallel, reports the progress and the failures on the standard error output.
+    Returns the exit code of the command: 1 if some exports failed, 0 otherwise.
+    """
+    recordings_count = len(args.recordings)
+    exported_count = 0
+
+    def report_result(export_result: BatchExportResult):
+        nonlocal exported_count
+        exported_count += 1
+        status = 'ok' if export_result.error is None else f'failed ({export_result.error})'
+        print(f'[{exported_count}/{recordings_count}] {export_result.recording_path}: {status}', file=sys.stderr)
+
+    export_results = batch_export_recordings(
+        args.recordings,
+        ExportSettings(args.exporter_names, args.preset_names, args.max_depth, args.output_dir),
+        args.jobs,
+        report_result,
+    )
+
+    failed_results = [export_result for export_result in export_results if export_result.error is not None]
+    print(f'{recordings_count - len(failed_results)} exported, {len(failed_results)} failed', file=sys.stderr)
+    for failed_result in failed_results:
+        print(f'- {failed_result.recording_path}: {failed_result.error}', file=sys.stderr)
+
+    return 1 if failed_results else 0
+
+
+def main(argv: Sequence[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ['export']:
+        return export_recordings(export_parser_factory().parse_args(argv[1:]))
+
+    trace_target(trace_parser_factory().parse_args(argv))
+
+    return 0
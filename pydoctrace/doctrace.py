@@ -1,31 +1,82 @@
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager, suppress
 from functools import wraps
 from string import Template
-from typing import Callable, Iterable, Iterator, Type
+from sys import _getframe, gettrace, settrace
+from typing import Callable, ContextManager, Hashable, Iterable, Iterator, List, Type
 
+from pydoctrace.aggregation import ComponentsAccumulator
+from pydoctrace.arguments import ArgumentsCapture, ArgumentsCapturePolicy
 from pydoctrace.callfilter import Preset, call_filter_factory
 from pydoctrace.callfilter.presets import EXCLUDE_STDLIB_PRESET, EXCLUDE_TESTS_PRESET
-from pydoctrace.exporters import Context, Exporter
-from pydoctrace.exporters.plantuml.component import PlantUMLComponentExporter
+from pydoctrace.exporters import Context, Exporter, ExportTarget
+from pydoctrace.exporters.buffering import AnomalyTrigger, BufferingExporter
+from pydoctrace.exporters.components import ComponentsExporter
+from pydoctrace.exporters.fanout import FanOutExporter
+from pydoctrace.exporters.plantuml.component import PlantUMLAggregatedComponentExporter, PlantUMLComponentExporter
 from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+from pydoctrace.memo import ExportedKeysMemo
+from pydoctrace.retention import ExportedFilesIndex, RetentionPolicy
+from pydoctrace.stats import TracingStats
+from pydoctrace.switch import TRACING_SWITCH
 from pydoctrace.tracer import ExecutionTracer
 
 # default filters used to remove calls from the execution tracing
 DEFAULT_FILTERS = EXCLUDE_STDLIB_PRESET, EXCLUDE_TESTS_PRESET
 
+# default exports of the trace_to_puml decorator: a sequence diagram and a component diagram
+DEFAULT_EXPORT_TARGETS = (
+    ExportTarget(PlantUMLSequenceExporter, '${function_name}-sequence.puml'),
+    ExportTarget(PlantUMLComponentExporter, '${function_name}-component.puml'),
+)
+
 
 @contextmanager
-def tracing_context_factory(context: Context) -> Iterator[ExecutionTracer]:
-    with context.exporter_class.export_manager_factory(context.export_file_path) as exporter:
-        # initializes the diagram file
-        exporter.on_header(context.start_module, context.start_function_name)
+def tracing_context_factory(
+    context: Context,
+    *other_contexts: Context,
+    tracing_stats: TracingStats = None,
+    arguments_capture: ArgumentsCapture = None,
+) -> Iterator[ExecutionTracer]:
+    """
+    Creates the tracer which pushes the tracing events to the exporter of the given context.
 
-        tracer = ExecutionTracer(exporter, context.call_filter)
-        try:
-            yield tracer
-        finally:
-            # finalizes the sequence diagram file
-            exporter.on_footer()
+    When other contexts are given, their exporters receive the same events (through a fan-out exporter),
+    with the call filter of the first context.
+
+    When tracing statistics are given, the tracer collects them and they are written before the footer of the exports.
+    When an arguments capture is given, the tracer captures the arguments of the calls it selects.
+    """
+    contexts = (context, *other_contexts)
+    exporters: List[Exporter] = []
+    try:
+        with ExitStack() as exports_stack:
+            for export_context in contexts:
+                exporters.append(
+                    exports_stack.enter_context(
+                        export_context.exporter_class.export_manager_factory(export_context.export_file_path)
+                    )
+                )
+            exporter = exporters[0] if len(exporters) == 1 else FanOutExporter(exporters)
+
+            # initializes the diagram file
+            exporter.on_header(context.start_module, context.start_function_name)
+
+            tracer = ExecutionTracer(exporter, context.call_filter, tracing_stats, arguments_capture)
+            try:
+                yield tracer
+            finally:
+                if tracing_stats is not None:
+                    exporter.on_tracing_stats(tracing_stats)
+
+                # finalizes the sequence diagram file
+                exporter.on_footer()
+    finally:
+        # indexes the closed export files to enforce their retention policy
+        for export_context, exporter in zip(contexts, exporters):
+            if export_context.exported_files_index is not None and exporter.export_file_path is not None:
+                # the retention is enforced on a best-effort basis: it must not mask the outcome of the traced function
+                with suppress(OSError):
+                    export_context.exported_files_index.add_exported_file(exporter.export_file_path)
 
 
 def context_factory(
@@ -36,6 +87,17 @@ def context_factory(
 ) -> Context:
     function_module = getattr(function_to_trace, '__module__', '__root__')
     function_name = getattr(function_to_trace, '__name__', '__main__')
+
+    return named_context_factory(function_module, function_name, exporter_class, export_file_path_tpl, filter_presets)
+
+
+def named_context_factory(
+    function_module: str,
+    function_name: str,
+    exporter_class: Type[Exporter],
+    export_file_path_tpl: str,
+    filter_presets: Iterable[Preset] = None,
+) -> Context:
     export_file_path = Template(export_file_path_tpl).safe_substitute(
         function_name=function_name, function_module=function_module
     )
@@ -46,39 +108,185 @@ def context_factory(
     )
 
 
-def trace_to_sequence_puml(
+def trace_to_puml(
     function_to_decorate: Callable = None,
     /,
     *,
-    export_file_path_tpl: str = '${function_name}-sequence.puml',
+    exporters: Iterable[ExportTarget] = DEFAULT_EXPORT_TARGETS,
     filter_presets: Iterable[Preset] = None,
+    retention_policy: RetentionPolicy = None,
+    anomaly_trigger: AnomalyTrigger = None,
+    trace_if: Callable[..., bool] = None,
+    memo_key: Callable[..., Hashable] = None,
+    memo_max_size: int = 1024,
+    tracing_stats: bool = False,
+    capture_arguments: ArgumentsCapturePolicy = None,
 ):
     """
-    Decorates a function in order to trace its execution as a sequence diagram.
+    Decorates a function in order to trace its execution once and to export it with several exporters.
+    - exporters: the exporter classes associated with the templates of their export file paths.
+      By default, exports a sequence diagram and a component diagram.
+      The templates can include placeholders like '${function_module}', '${function_name}', ${datetime_millis}'.
+
     - filter_presets: enable to remove specific calls from the execution tracing. Use provided presets or design yours.
       By defaults (if None), filters out calls to the tests related modules and standard library modules.
       Set to an empty iterable to disable call filtering.
 
-    - export_file_path_tpl: customizes the file path where the output will be written to.
-      It can include placeholders like '${function_module}', '${function_name}', ${datetime_millis}'.
+    - retention_policy: limits the number, the total size or the age of the files exported with each exporter,
+      the oldest files being removed first. Useful with the ${datetime_millis}' placeholder. No limit by default.
+
+    - anomaly_trigger: if set, the tracing events are buffered in memory and exported only if the execution
+      is anomalous (it ended with an unhandled error or lasted longer than a duration).
+      All executions are exported by default.
+
+    - trace_if: a predicate called with the arguments of each call, telling whether the call must be traced.
+      The other calls are executed without being traced. All calls are traced by default.
+
+    - memo_key: a function called with the arguments of each call, returning a hashable key identifying the call.
+      The calls whose key was already exported are executed without being traced. The keys of the last exported calls
+      are memoized (memo_max_size keys at most). All calls are traced by default.
+
+    - tracing_stats: if True, collects statistics about the tracing of each execution (the numbers of tracing events
+      and of filtered calls, the time spent in the tracer, the filter and the exporter) and writes them
+      as a comment in the PlantUML exports. Slows the tracing down, disabled by default.
+
+    - capture_arguments: if set, captures the arguments of the traced calls and shows them in the sequence diagrams,
+      according to the given policy (which calls, how many arguments, bounded renderings). Disabled by default.
     """
+    export_targets = tuple(ExportTarget(*export_target) for export_target in exporters)
+    if len(export_targets) == 0:
+        raise ValueError('at least one exporter must be given')
+
+    def puml_decorator(function_to_trace: Callable):
+        # leaves the function unchanged when the tracing is switched off
+        if not TRACING_SWITCH.decorates:
+            return function_to_trace
+
+        # initializes the tracing contexts once, they are shared by the executions of the decorated function;
+        # the files exported by each exporter are indexed across the executions to enforce the retention policy
+        contexts = [
+            context_factory(function_to_trace, exporter_class, export_file_path_tpl, filter_presets)._replace(
+                exported_files_index=None if retention_policy is None else ExportedFilesIndex(retention_policy)
+            )
+            for exporter_class, export_file_path_tpl in export_targets
+        ]
+
+        # the keys of the exported calls, if the exports are memoized
+        exported_keys_memo = None if memo_key is None else ExportedKeysMemo(memo_max_size)
+
+        # captures the arguments of the calls, the names of the arguments being cached across the executions
+        arguments_capture = None if capture_arguments is None else ArgumentsCapture(capture_arguments)
 
-    def sequence_puml_decorator(function_to_trace: Callable):
         @wraps(function_to_trace)
         def traceable_func(*args, **kwargs):
-            # initializes the tracing context
-            context = context_factory(function_to_trace, PlantUMLSequenceExporter, export_file_path_tpl, filter_presets)
+            # the armed invocations are consumed only by the calls matching the trace_if predicate
+            # and which were not exported yet
+            if not (
+                TRACING_SWITCH.enabled
+                and (trace_if is None or trace_if(*args, **kwargs))
+                and (exported_keys_memo is None or (call_key := memo_key(*args, **kwargs)) not in exported_keys_memo)
+                and TRACING_SWITCH.consume_invocation()
+            ):
+                return function_to_trace(*args, **kwargs)
+
+            execution_stats = TracingStats() if tracing_stats else None
 
             # runs the decorated function in a tracing context
-            with tracing_context_factory(context) as execution_tracer:
-                return execution_tracer.runfunc(function_to_trace, *args, **kwargs)
+            if anomaly_trigger is None:
+                try:
+                    with tracing_context_factory(
+                        *contexts, tracing_stats=execution_stats, arguments_capture=arguments_capture
+                    ) as execution_tracer:
+                        return execution_tracer.runfunc(function_to_trace, *args, **kwargs)
+                finally:
+                    if exported_keys_memo is not None:
+                        exported_keys_memo.add(call_key)
+
+            # runs the decorated function with a buffered tracing, exported only if the execution is anomalous
+            buffering_exporter = BufferingExporter(anomaly_trigger)
+            try:
+                return ExecutionTracer(
+                    buffering_exporter, contexts[0].call_filter, execution_stats, arguments_capture
+                ).runfunc(function_to_trace, *args, **kwargs)
+            finally:
+                if buffering_exporter.is_anomalous():
+                    with tracing_context_factory(*contexts) as execution_tracer:
+                        buffering_exporter.replay(execution_tracer.exporter)
+                        # the statistics are the ones of the buffered tracing, not of the replay
+                        if execution_stats is not None:
+                            execution_tracer.exporter.on_tracing_stats(execution_stats)
+                    if exported_keys_memo is not None:
+                        exported_keys_memo.add(call_key)
 
         return traceable_func
 
     if function_to_decorate:
-        return sequence_puml_decorator(function_to_decorate)
+        return puml_decorator(function_to_decorate)
     else:
-        return sequence_puml_decorator
+        return puml_decorator
+
+
+def trace_to_sequence_puml(
+    function_to_decorate: Callable = None,
+    /,
+    *,
+    export_file_path_tpl: str = '${function_name}-sequence.puml',
+    filter_presets: Iterable[Preset] = None,
+    exporter_class: Type[Exporter] = PlantUMLSequenceExporter,
+    retention_policy: RetentionPolicy = None,
+    anomaly_trigger: AnomalyTrigger = None,
+    trace_if: Callable[..., bool] = None,
+    memo_key: Callable[..., Hashable] = None,
+    memo_max_size: int = 1024,
+    tracing_stats: bool = False,
+    capture_arguments: ArgumentsCapturePolicy = None,
+):
+    """
+    Decorates a function in order to trace its execution as a sequence diagram.
+    - filter_presets: enable to remove specific calls from the execution tracing. Use provided presets or design yours.
+      By defaults (if None), filters out calls to the tests related modules and standard library modules.
+      Set to an empty iterable to disable call filtering.
+
+    - export_file_path_tpl: customizes the file path where the output will be written to.
+      It can include placeholders like '${function_module}', '${function_name}', ${datetime_millis}'.
+
+    - exporter_class: the exporter writing the tracing events, PlantUML by default.
+      Use JSONLinesExporter to export the events in a structured format (adapt export_file_path_tpl accordingly).
+
+    - retention_policy: limits the number, the total size or the age of the exported files,
+      the oldest files being removed first. Useful with the ${datetime_millis}' placeholder. No limit by default.
+
+    - anomaly_trigger: if set, the tracing events are buffered in memory and exported only if the execution
+      is anomalous (it ended with an unhandled error or lasted longer than a duration).
+      All executions are exported by default.
+
+    - trace_if: a predicate called with the arguments of each call, telling whether the call must be traced.
+      The other calls are executed without being traced. All calls are traced by default.
+
+    - memo_key: a function called with the arguments of each call, returning a hashable key identifying the call.
+      The calls whose key was already exported are executed without being traced. The keys of the last exported calls
+      are memoized (memo_max_size keys at most). All calls are traced by default.
+
+    - tracing_stats: if True, collects statistics about the tracing of each execution (the numbers of tracing events
+      and of filtered calls, the time spent in the tracer, the filter and the exporter) and writes them
+      as a comment in the PlantUML exports. Slows the tracing down, disabled by default.
+
+    - capture_arguments: if set, captures the arguments of the traced calls and shows them in the sequence diagrams,
+      according to the given policy (which calls, how many arguments, bounded renderings). Disabled by default.
+    """
+
+    return trace_to_puml(
+        function_to_decorate,
+        exporters=(ExportTarget(exporter_class, export_file_path_tpl),),
+        filter_presets=filter_presets,
+        retention_policy=retention_policy,
+        anomaly_trigger=anomaly_trigger,
+        trace_if=trace_if,
+        memo_key=memo_key,
+        memo_max_size=memo_max_size,
+        tracing_stats=tracing_stats,
+        capture_arguments=capture_arguments,
+    )
 
 
 def trace_to_component_puml(
@@ -87,6 +295,13 @@ def trace_to_component_puml(
     *,
     export_file_path_tpl: str = '${function_name}-component.puml',
     filter_presets: Iterable[Preset] = None,
+    exporter_class: Type[Exporter] = PlantUMLComponentExporter,
+    retention_policy: RetentionPolicy = None,
+    anomaly_trigger: AnomalyTrigger = None,
+    trace_if: Callable[..., bool] = None,
+    memo_key: Callable[..., Hashable] = None,
+    memo_max_size: int = 1024,
+    tracing_stats: bool = False,
 ):
     """
     Decorates a function in order to trace its execution as a component diagram.
@@ -96,23 +311,240 @@ def trace_to_component_puml(
 
     - export_file_path_tpl: customizes the file path where the output will be written to.
       It can include placeholders like '${function_module}', '${function_name}', ${datetime_millis}'.
+
+    - exporter_class: the exporter writing the tracing events, PlantUML by default.
+      Use JSONLinesExporter to export the events in a structured format (adapt export_file_path_tpl accordingly).
+
+    - retention_policy: limits the number, the total size or the age of the exported files,
+      the oldest files being removed first. Useful with the ${datetime_millis}' placeholder. No limit by default.
+
+    - anomaly_trigger: if set, the tracing events are buffered in memory and exported only if the execution
+      is anomalous (it ended with an unhandled error or lasted longer than a duration).
+      All executions are exported by default.
+
+    - trace_if: a predicate called with the arguments of each call, telling whether the call must be traced.
+      The other calls are executed without being traced. All calls are traced by default.
+
+    - memo_key: a function called with the arguments of each call, returning a hashable key identifying the call.
+      The calls whose key was already exported are executed without being traced. The keys of the last exported calls
+      are memoized (memo_max_size keys at most). All calls are traced by default.
+
+    - tracing_stats: if True, collects statistics about the tracing of each execution (the numbers of tracing events
+      and of filtered calls, the time spent in the tracer, the filter and the exporter) and writes them
+      as a comment in the PlantUML exports. Slows the tracing down, disabled by default.
+    """
+
+    return trace_to_puml(
+        function_to_decorate,
+        exporters=(ExportTarget(exporter_class, export_file_path_tpl),),
+        filter_presets=filter_presets,
+        retention_policy=retention_policy,
+        anomaly_trigger=anomaly_trigger,
+        trace_if=trace_if,
+        memo_key=memo_key,
+        memo_max_size=memo_max_size,
+        tracing_stats=tracing_stats,
+    )
+
+
+def trace_to_aggregated_component_puml(
+    function_to_decorate: Callable = None,
+    /,
+    *,
+    export_file_path_tpl: str = '${function_name}-component.puml',
+    filter_presets: Iterable[Preset] = None,
+    flush_interval_seconds: float = 60,
+    exporter_class: Type[PlantUMLAggregatedComponentExporter] = PlantUMLAggregatedComponentExporter,
+    trace_if: Callable[..., bool] = None,
+):
+    """
+    Decorates a function in order to trace all its executions and to merge them in a single component diagram,
+    whose arrows are labelled with the numbers of interactions. The diagram is written:
+    - periodically, when an execution ends more than flush_interval_seconds after the previous export
+      (None to write it only at exit)
+    - when the interpreter exits
+    - on demand, by calling the flush() method of the components_accumulator attribute of the decorated function
+
+    - filter_presets: enable to remove specific calls from the execution tracing. Use provided presets or design yours.
+      By defaults (if None), filters out calls to the tests related modules and standard library modules.
+      Set to an empty iterable to disable call filtering.
+
+    - export_file_path_tpl: customizes the file path where the output will be written to.
+      It can include placeholders like '${function_module}', '${function_name}', ${datetime_millis}'.
+
+    - trace_if: a predicate called with the arguments of each call, telling whether the call must be traced.
+      The other calls are executed without being traced. All calls are traced by default.
     """
 
-    def component_puml_decorator(function_to_trace: Callable):
+    def aggregated_puml_decorator(function_to_trace: Callable):
+        # leaves the function unchanged when the tracing is switched off
+        if not TRACING_SWITCH.decorates:
+            return function_to_trace
+
+        context = context_factory(function_to_trace, exporter_class, export_file_path_tpl, filter_presets)
+        components_accumulator = ComponentsAccumulator(
+            exporter_class,
+            context.export_file_path,
+            context.start_module,
+            context.start_function_name,
+            flush_interval_seconds,
+        )
+
         @wraps(function_to_trace)
         def traceable_func(*args, **kwargs):
-            # initializes the tracing context
-            context = context_factory(
-                function_to_trace, PlantUMLComponentExporter, export_file_path_tpl, filter_presets
-            )
+            # the armed invocations are consumed only by the calls matching the trace_if predicate
+            if not (
+                TRACING_SWITCH.enabled
+                and (trace_if is None or trace_if(*args, **kwargs))
+                and TRACING_SWITCH.consume_invocation()
+            ):
+                return function_to_trace(*args, **kwargs)
 
-            # runs the decorated function in a tracing context
-            with tracing_context_factory(context) as execution_tracer:
-                return execution_tracer.runfunc(function_to_trace, *args, **kwargs)
+            # collects the interactions of this execution, then merges them in the accumulator
+            components_exporter = ComponentsExporter(None)
+            try:
+                return ExecutionTracer(components_exporter, context.call_filter).runfunc(
+                    function_to_trace, *args, **kwargs
+                )
+            finally:
+                components_accumulator.add_execution(components_exporter)
+
+        traceable_func.components_accumulator = components_accumulator
 
         return traceable_func
 
     if function_to_decorate:
-        return component_puml_decorator(function_to_decorate)
+        return aggregated_puml_decorator(function_to_decorate)
     else:
-        return component_puml_decorator
+        return aggregated_puml_decorator
+
+
+# the module of the tracing block, whose exit must not be traced
+TRACING_BLOCK_MODULE_PARTS = tuple(__name__.split('.'))
+
+# excludes the call to TracingBlock.__exit__ from the tracing: it happens before the tracing function can be uninstalled
+TRACING_BLOCK_EXIT_PRESET = Preset(
+    exclude_call=lambda module_parts, function_name, *args: (
+        function_name == '__exit__' and module_parts == TRACING_BLOCK_MODULE_PARTS
+    )
+)
+
+
+class TracingBlock:
+    """
+    Context manager tracing the execution of the code block it wraps, in the function where it is used.
+
+    Entering the block starts the tracing of the current frame (the one of the function using the block)
+    and installs the global tracing function to trace the callees; exiting the block stops the tracing.
+    The code block is not traced if the tracing is disabled when entering it (see pydoctrace.switch).
+    """
+
+    def __init__(
+        self,
+        export_targets: Iterable[ExportTarget],
+        filter_presets: Iterable[Preset],
+        tracing_stats: bool = False,
+        capture_arguments: ArgumentsCapturePolicy = None,
+    ):
+        self.export_targets = tuple(ExportTarget(*export_target) for export_target in export_targets)
+        if len(self.export_targets) == 0:
+            raise ValueError('at least one exporter must be given')
+        filter_presets = DEFAULT_FILTERS if filter_presets is None else filter_presets
+        self.filter_presets = (TRACING_BLOCK_EXIT_PRESET, *filter_presets)
+        self.tracing_stats = tracing_stats
+        self.arguments_capture = None if capture_arguments is None else ArgumentsCapture(capture_arguments)
+
+        self.tracing_context: ContextManager[ExecutionTracer] = None
+        self.execution_tracer: ExecutionTracer = None
+        self.frame = None
+        self.previous_frame_tracing_function: Callable = None
+        self.previous_tracing_function: Callable = None
+
+    def __enter__(self) -> ExecutionTracer:
+        if self.frame is not None:
+            raise RuntimeError('a tracing block cannot be entered while it is already tracing')
+
+        # the code block is executed without being traced
+        if not (TRACING_SWITCH.enabled and TRACING_SWITCH.consume_invocation()):
+            return None
+
+        # the frame of the function where the tracing block is used
+        frame = _getframe(1)
+        function_module = frame.f_globals.get('__name__', '__root__')
+        function_name = frame.f_code.co_name
+        contexts = [
+            named_context_factory(
+                function_module, function_name, exporter_class, export_file_path_tpl, self.filter_presets
+            )
+            for exporter_class, export_file_path_tpl in self.export_targets
+        ]
+        self.tracing_context = tracing_context_factory(
+            *contexts,
+            tracing_stats=TracingStats() if self.tracing_stats else None,
+            arguments_capture=self.arguments_capture,
+        )
+        self.execution_tracer = self.tracing_context.__enter__()
+
+        self.frame = frame
+        self.previous_frame_tracing_function = frame.f_trace
+        self.execution_tracer.trace_running_frame(frame)
+
+        # installs the global tracing function last, so that no call of this method is traced
+        self.previous_tracing_function = gettrace()
+        settrace(self.execution_tracer.globaltrace)
+
+        return self.execution_tracer
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        # the code block was not traced
+        if self.frame is None:
+            return False
+
+        # uninstalls the global tracing function first, so that the following calls are not traced
+        settrace(self.previous_tracing_function)
+
+        frame = self.frame
+        self.frame = None
+        try:
+            self.execution_tracer.untrace_running_frame(frame, exc_value)
+            frame.f_trace = self.previous_frame_tracing_function
+        finally:
+            # finalizes the exports
+            self.tracing_context.__exit__(exc_type, exc_value, traceback)
+            self.tracing_context = None
+            self.execution_tracer = None
+            self.previous_frame_tracing_function = None
+            self.previous_tracing_function = None
+
+        # lets the exception propagate, if any
+        return False
+
+
+def trace(
+    *,
+    exporters: Iterable[ExportTarget] = (ExportTarget(PlantUMLSequenceExporter, '${function_name}-sequence.puml'),),
+    filter_presets: Iterable[Preset] = None,
+    tracing_stats: bool = False,
+    capture_arguments: ArgumentsCapturePolicy = None,
+) -> TracingBlock:
+    """
+    Creates a context manager tracing the execution of a code block, instead of a whole function:
+
+    with trace():
+        result = do_something(parameter)
+
+    - exporters: the exporter classes associated with the templates of their export file paths.
+      By default, exports a sequence diagram. The '${function_name}' placeholder is the name of the function
+      in which the code block is.
+
+    - filter_presets: enable to remove specific calls from the execution tracing. Use provided presets or design yours.
+      By defaults (if None), filters out calls to the tests related modules and standard library modules.
+      Set to an empty iterable to disable call filtering.
+
+    - tracing_stats: if True, collects statistics about the tracing of the code block (available in the stats attribute
+      of the tracer returned by the context manager) and writes them as a comment in the PlantUML exports.
+
+    - capture_arguments: if set, captures the arguments of the calls traced in the code block and shows them
+      in the sequence diagrams, according to the given policy. Disabled by default.
+    """
+    return TracingBlock(exporters, filter_presets, tracing_stats, capture_arguments)
@@ -19,6 +19,23 @@ class CallEnd(NamedTuple):
     line_index: int
 
 
+class FunctionDescriptor(NamedTuple):
+    """
+    Describes a function (or any executed block of code) independently of the line being executed in it.
+
+    The tracer creates one descriptor per code object and passes it with the line numbers to the exporters,
+    instead of creating a CallEnd per event. Its fields are the first ones of CallEnd: a CallEnd can be used
+    where a FunctionDescriptor is expected.
+    """
+
+    fq_module_text: str
+    fq_module_tuple: Tuple[str]
+    function_name: str
+
+    def at_line(self, line_index: int) -> CallEnd:
+        return CallEnd(self.fq_module_text, self.fq_module_tuple, self.function_name, line_index)
+
+
 class Error(NamedTuple):
     """
     Represents an error or an exception that is raised during the code execution.
@@ -1,22 +1,76 @@
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from io import TextIOBase
+from os.path import dirname
 from pathlib import Path
 from string import Template
-from typing import Any, Iterator, NamedTuple, Type
+from threading import local
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Type
 
 from pydoctrace.callfilter import CallFilter
-from pydoctrace.domain.execution import CallEnd, Error
+from pydoctrace.domain.execution import CallEnd, Error, FunctionDescriptor
+from pydoctrace.exporters.values import DEFAULT_VALUE_RENDERER, ValueRenderer
+from pydoctrace.retention import ExportedFilesIndex
+
+if TYPE_CHECKING:
+    from pydoctrace.arguments import CapturedArguments
+    from pydoctrace.stats import TracingStats
+
+# marks the placeholders of the export file path templates
+DYNAMIC_TAG_MARKER = '$'
+
+
+class EventClock(local):
+    """
+    The clock read by the time-based exporters (timelines, profiles) when they handle a tracing event:
+    - the current time when the events are pushed by the tracer
+    - the time at which the events were traced when they are replayed after the execution (see BufferingExporter)
+
+    The replayed time is set per thread, the tracer being bound to the thread executing the traced function.
+    """
+
+    replayed_event_ns: int = None
+
+    def event_ns(self) -> int:
+        replayed_event_ns = self.replayed_event_ns
+        return perf_counter_ns() if replayed_event_ns is None else replayed_event_ns
+
+
+EVENT_CLOCK = EventClock()
+
+
+@lru_cache(maxsize=256)
+def make_directories(directory_path: str):
+    """
+    Creates the directory and its parents if they do not exist yet.
+    The calls are cached so that the directories of the export files are created once.
+    """
+    if directory_path:
+        Path(directory_path).mkdir(parents=True, exist_ok=True)
 
 
 class Exporter:
     """
     Base class for sequence diagram exporters.
     Extend it to to support various export formats.
+
+    Set binary_export to True in the sub-classes writing bytes instead of text in the export file.
+    The value_renderer renders the values included in the exports (see pydoctrace.exporters.values.with_value_rendering).
+    The export_file_path is the resolved path of the export file, set by export_manager_factory.
+
+    The tracer pushes the events through the hooks suffixed by '_at', which receive the descriptors of the functions
+    and the line numbers separately. By default, they create the corresponding CallEnds and call the hooks
+    receiving CallEnds: extend FunctionDescriptorExporter to handle the descriptors without creating CallEnds.
     """
 
+    binary_export: bool = False
+    value_renderer: ValueRenderer = DEFAULT_VALUE_RENDERER
+
     def __init__(self, io_sink: TextIOBase):
         self.io_sink = io_sink
+        self.export_file_path: str = None
 
     def on_header(self, start_module: str, start_func_name: str):
         """
@@ -82,6 +136,50 @@ class Exporter:
         """
         raise NotImplementedError()
 
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.on_tracing_start(called.at_line(called_line))
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.on_start_call(caller.at_line(caller_line), called.at_line(called_line))
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        self.on_error_propagation(
+            error_called.at_line(error_called_line), error_caller.at_line(error_caller_line), error
+        )
+
+    def on_return_at(
+        self, *, called: FunctionDescriptor, called_line: int, caller: FunctionDescriptor, caller_line: int, arg: Any
+    ):
+        self.on_return(called=called.at_line(called_line), caller=caller.at_line(caller_line), arg=arg)
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        self.on_tracing_end(called.at_line(called_line), arg)
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        self.on_unhandled_error_end(called.at_line(called_line), error)
+
+    def on_call_arguments_at(self, called: FunctionDescriptor, called_line: int, arguments: 'CapturedArguments'):
+        """
+        Writes the arguments captured at the start of the call (or of the tracing) which has just been exported,
+        when the capture of the arguments is enabled (see pydoctrace.arguments).
+        This is a no-operation by default; the arguments are rendered lazily, by calling arguments.render().
+        """
+
+    def on_tracing_stats(self, tracing_stats: 'TracingStats'):
+        """
+        Writes the statistics of the tracing (see pydoctrace.stats), before the footer.
+        This is a no-operation by default, the exporters write them only if their format supports comments.
+        """
+
     def on_footer(self):
         """
         Writes the footer of the sequence diagram file.
@@ -107,18 +205,89 @@ class Exporter:
         the end of the context.
         """
 
-        # hydrates datetime markers in the file name template
-        export_file_path = exporter_class._template_dynamic_tags(export_file_path, datetime.utcnow())
+        # hydrates datetime markers in the file name template, if any (the other placeholders are resolved beforehand)
+        if DYNAMIC_TAG_MARKER in export_file_path:
+            export_file_path = exporter_class._template_dynamic_tags(export_file_path, datetime.utcnow())
 
-        # creates the directories leading to the file
-        Path(export_file_path).parent.mkdir(parents=True, exist_ok=True)
+        # creates the directories leading to the file, once
+        export_directory_path = dirname(export_file_path)
+        make_directories(export_directory_path)
 
         # opens the contents file in write mode and yields the exporter that can write into it
-        with open(export_file_path, 'w', encoding='utf8') as diagram_file:
+        open_mode, encoding = ('wb', None) if exporter_class.binary_export else ('w', 'utf8')
+        try:
+            diagram_file = open(export_file_path, open_mode, encoding=encoding)  # noqa: SIM115
+        # the directories may have been removed since they were created
+        except FileNotFoundError:
+            make_directories.cache_clear()
+            make_directories(export_directory_path)
+            diagram_file = open(export_file_path, open_mode, encoding=encoding)  # noqa: SIM115
+
+        with diagram_file:
             exporter = exporter_class(diagram_file)
+            exporter.export_file_path = export_file_path
             yield exporter
 
 
+class FunctionDescriptorExporter(Exporter):
+    """
+    Base class of the exporters handling the descriptors of the functions and the line numbers separately,
+    in the hooks suffixed by '_at' (a CallEnd being a valid FunctionDescriptor, the hooks receiving CallEnds
+    delegate to them).
+    """
+
+    def on_tracing_start(self, called: CallEnd):
+        self.on_tracing_start_at(called, called.line_index)
+
+    def on_start_call(self, caller: CallEnd, called: CallEnd):
+        self.on_start_call_at(caller, caller.line_index, called, called.line_index)
+
+    def on_error_propagation(self, error_called: CallEnd, error_caller: CallEnd, error: Error):
+        self.on_error_propagation_at(
+            error_called, error_called.line_index, error_caller, error_caller.line_index, error
+        )
+
+    def on_return(self, *, called: CallEnd, caller: CallEnd, arg: Any):
+        self.on_return_at(
+            called=called, called_line=called.line_index, caller=caller, caller_line=caller.line_index, arg=arg
+        )
+
+    def on_tracing_end(self, called: CallEnd, arg: Any):
+        self.on_tracing_end_at(called, called.line_index, arg)
+
+    def on_unhandled_error_end(self, called: CallEnd, error: Error):
+        self.on_unhandled_error_end_at(called, called.line_index, error)
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        raise NotImplementedError()
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        raise NotImplementedError()
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        raise NotImplementedError()
+
+    def on_return_at(
+        self, *, called: FunctionDescriptor, called_line: int, caller: FunctionDescriptor, caller_line: int, arg: Any
+    ):
+        raise NotImplementedError()
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        raise NotImplementedError()
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        raise NotImplementedError()
+
+
 class Context(NamedTuple):
     """
     Stores information about the tracing process.
@@ -130,3 +299,14 @@ class Context(NamedTuple):
     start_module: str
     start_function_name: str
     call_filter: CallFilter
+    # enforces the retention policy of the exported files, if any
+    exported_files_index: ExportedFilesIndex = None
+
+
+class ExportTarget(NamedTuple):
+    """
+    Associates an exporter class with the template of the file path where it writes its output.
+    """
+
+    exporter_class: Type[Exporter]
+    export_file_path_tpl: str
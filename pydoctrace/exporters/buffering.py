@@ -0,0 +1,138 @@
+"""
+Module dedicated to the retroactive export of the traced executions: the tracing events are buffered in memory,
+and exported only if the execution is anomalous (it raised an unhandled error or lasted too long).
+The I/O and formatting costs are thus paid only for the interesting executions.
+
+The time at which each event is traced is buffered along with the event, and restored in the EVENT_CLOCK
+when the event is replayed: the time-based exporters (timelines, profiles) thus export the durations of the execution,
+not the ones of the replay.
+"""
+
+from time import perf_counter_ns
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from pydoctrace.arguments import CapturedArguments
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import EVENT_CLOCK, Exporter, FunctionDescriptorExporter
+
+NANOSECONDS_IN_A_SECOND = 1_000_000_000
+
+
+class AnomalyTrigger(NamedTuple):
+    """
+    Defines the anomalous executions that must be exported:
+    - on_unhandled_error: the executions ending with an unhandled error
+    - min_duration_seconds: the executions lasting at least this duration (None to ignore the duration)
+    """
+
+    on_unhandled_error: bool = True
+    min_duration_seconds: float = None
+
+
+# a buffered tracing event: the name of the exporter hook with its positional and keyword arguments
+BufferedEvent = Tuple[str, Tuple, Dict[str, Any]]
+
+
+class BufferingExporter(FunctionDescriptorExporter):
+    """
+    Buffers the tracing events in memory, to replay them into an actual exporter if the execution is anomalous.
+
+    The returned values and the captured arguments are buffered by reference and rendered when they are replayed,
+    so that the executions which are not exported do not pay the rendering: a value mutated after being buffered
+    is exported in its mutated state.
+    """
+
+    def __init__(self, anomaly_trigger: AnomalyTrigger):
+        super().__init__(None)
+        self.anomaly_trigger = anomaly_trigger
+        self.events: List[BufferedEvent] = []
+        # the time at which each event was traced, by event index
+        self.events_ns: List[int] = []
+        self.start_ns: int = None
+        self.end_ns: int = None
+        self.ended_with_unhandled_error = False
+
+    def buffer_event(self, hook_name: str, args: Tuple, kwargs: Dict[str, Any]) -> int:
+        """
+        Buffers the event with the time at which it is traced, and returns this time.
+        """
+        event_ns = perf_counter_ns()
+        self.events.append((hook_name, args, kwargs))
+        self.events_ns.append(event_ns)
+
+        return event_ns
+
+    def on_header(self, start_module: str, start_func_name: str):
+        pass
+
+    def on_raw_content(self, raw_content: str):
+        self.buffer_event('on_raw_content', (raw_content,), {})
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.start_ns = self.buffer_event('on_tracing_start_at', (called, called_line), {})
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.buffer_event('on_start_call_at', (caller, caller_line, called, called_line), {})
+
+    def on_call_arguments_at(self, called: FunctionDescriptor, called_line: int, arguments: CapturedArguments):
+        self.buffer_event('on_call_arguments_at', (called, called_line, arguments), {})
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        self.buffer_event(
+            'on_error_propagation_at', (error_called, error_called_line, error_caller, error_caller_line, error), {}
+        )
+
+    def on_return_at(
+        self, *, called: FunctionDescriptor, called_line: int, caller: FunctionDescriptor, caller_line: int, arg: Any
+    ):
+        self.buffer_event(
+            'on_return_at',
+            (),
+            {'called': called, 'called_line': called_line, 'caller': caller, 'caller_line': caller_line, 'arg': arg},
+        )
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        self.end_ns = self.buffer_event('on_tracing_end_at', (called, called_line, arg), {})
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        self.end_ns = self.buffer_event('on_unhandled_error_end_at', (called, called_line, error), {})
+        self.ended_with_unhandled_error = True
+
+    def on_footer(self):
+        pass
+
+    def is_anomalous(self) -> bool:
+        """
+        Tells whether the buffered execution must be exported, according to the anomaly trigger.
+        """
+        on_unhandled_error, min_duration_seconds = self.anomaly_trigger
+        if on_unhandled_error and self.ended_with_unhandled_error:
+            return True
+
+        return (
+            min_duration_seconds is not None
+            and self.start_ns is not None
+            and self.end_ns is not None
+            and (self.end_ns - self.start_ns) >= min_duration_seconds * NANOSECONDS_IN_A_SECOND
+        )
+
+    def replay(self, exporter: Exporter):
+        """
+        Pushes the buffered events to the given exporter, whose header must have been written beforehand,
+        with the times at which they were traced.
+        """
+        try:
+            for (hook_name, args, kwargs), event_ns in zip(self.events, self.events_ns):
+                EVENT_CLOCK.replayed_event_ns = event_ns
+                getattr(exporter, hook_name)(*args, **kwargs)
+        finally:
+            EVENT_CLOCK.replayed_event_ns = None
@@ -0,0 +1,104 @@
+"""
+Module dedicated to the export of the tracing events in the Chrome Trace Event format, so that traced executions
+can be opened as timelines in viewers such as https://ui.perfetto.dev/ or chrome://tracing.
+
+Bibliography:
+- https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU: the Trace Event format
+
+The timestamps are read from the EVENT_CLOCK when the tracer notifies the exporter (at trace time, or restored
+when buffered events are replayed), and the events are written
+in a streaming fashion in the JSON array format: the memory footprint does not grow with the number of events.
+"""
+
+from io import TextIOBase
+from json.encoder import encode_basestring
+from os import getpid
+from threading import get_ident
+from typing import Any
+
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import EVENT_CLOCK, FunctionDescriptorExporter
+
+# the process metadata event opens the JSON array so that all the following events can be prefixed by a comma
+HEADER_TPL = '[\n{"name":"process_name","ph":"M","pid":%d,"tid":%d,"args":{"name":%s}}'
+BEGIN_TPL = ',\n{"name":%s,"cat":%s,"ph":"B","ts":%.3f,"pid":%d,"tid":%d,"args":{"line":%d}}'
+END_TPL = ',\n{"ph":"E","ts":%.3f,"pid":%d,"tid":%d}'
+ERROR_END_TPL = ',\n{"ph":"E","ts":%.3f,"pid":%d,"tid":%d,"args":{"error":%s}}'
+FOOTER_TPL = '\n]\n'
+
+
+class ChromeTraceExporter(FunctionDescriptorExporter):
+    """
+    Exports the traced execution as duration events (B and E phases) in the Chrome Trace Event format.
+
+    The timestamps are expressed in microseconds, relatively to the first traced event.
+    """
+
+    def __init__(self, io_sink: TextIOBase):
+        super().__init__(io_sink)
+        self.pid = getpid()
+        # the tracer is bound to the thread which executes the traced function
+        self.tid = get_ident()
+        self.origin_ns: int = None
+
+    def timestamp(self) -> float:
+        """
+        Elapsed time in microseconds since the first traced event.
+        """
+        event_ns = EVENT_CLOCK.event_ns()
+        if self.origin_ns is None:
+            self.origin_ns = event_ns
+
+        return (event_ns - self.origin_ns) / 1000
+
+    def write_begin(self, called: FunctionDescriptor, called_line: int, timestamp: float):
+        self.io_sink.write(
+            BEGIN_TPL
+            % (
+                encode_basestring(called.function_name),
+                encode_basestring(called.fq_module_text),
+                timestamp,
+                self.pid,
+                self.tid,
+                called_line,
+            )
+        )
+
+    def write_end(self, timestamp: float):
+        self.io_sink.write(END_TPL % (timestamp, self.pid, self.tid))
+
+    def write_error_end(self, error: Error, timestamp: float):
+        self.io_sink.write(ERROR_END_TPL % (timestamp, self.pid, self.tid, encode_basestring(error.class_name)))
+
+    def on_header(self, start_module: str, start_func_name: str):
+        self.io_sink.write(HEADER_TPL % (self.pid, self.tid, encode_basestring(f'{start_module}.{start_func_name}')))
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.write_begin(called, called_line, self.timestamp())
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.write_begin(called, called_line, self.timestamp())
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        self.write_error_end(error, self.timestamp())
+
+    def on_return_at(self, **kwargs):
+        self.write_end(self.timestamp())
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        self.write_end(self.timestamp())
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        self.write_error_end(error, self.timestamp())
+
+    def on_footer(self):
+        self.io_sink.write(FOOTER_TPL)
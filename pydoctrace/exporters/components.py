@@ -0,0 +1,181 @@
+"""
+Module dedicated to the aggregation of the traced calls for the export of component diagrams, whatever their syntax.
+
+The domain modeling involves NamedTuples because they are used as dictionary keys (thus need to be hashable and immutable).
+"""
+
+from collections import defaultdict, deque
+from io import TextIOBase
+from itertools import count
+from typing import Any, Dict, Iterable, Tuple
+
+from pydoctrace.domain.diagram import Call, Function, Interactions, Module, Raised, Return
+from pydoctrace.domain.execution import CallEnd, Error, FunctionDescriptor
+from pydoctrace.exporters import FunctionDescriptorExporter
+
+
+class ComponentsExporter(FunctionDescriptorExporter):
+    """
+    Base class of the component diagram exporters.
+
+    The syntaxes of component diagrams expect the components structure to be declared before the arrows
+    representing the calls. Therefore, this exporter stores all the traced calls before exporting the diagram
+    in order to build the components structure from the traced calls, then to export the arrows representing the calls.
+
+    The sub-classes write the diagram in a given syntax when the tracing ends.
+    """
+
+    def __init__(self, io_sink: TextIOBase):
+        super().__init__(io_sink)
+        self.interactions_by_call: Dict[Tuple[Function, Function], Interactions] = defaultdict(
+            lambda: Interactions(deque(), deque())
+        )
+        self.interaction_rank_iter = count(1, step=1)
+        self.traced_function: Function = None
+        self.functions: Dict[Tuple[str], Function] = {}
+        self.functions_by_descriptor: Dict[FunctionDescriptor, Function] = {}
+        self.unhandled_error_class_name: str = None
+
+    def next_interaction_rank(self) -> int:
+        return next(self.interaction_rank_iter)
+
+    def function_from_call(self, caller: CallEnd) -> Function:
+        """
+        Retrieves the Function from the cache, or creates it from the given Call and caches it.
+        """
+        function_key = caller.fq_module_tuple + (caller.function_name,)
+        function = self.functions.get(function_key)
+        if function is None:
+            function = Function(caller.function_name, caller.fq_module_tuple)
+            self.functions[function_key] = function
+
+        return function
+
+    def function_from_descriptor(self, function_descriptor: FunctionDescriptor) -> Function:
+        """
+        Retrieves the Function of the given descriptor, without building the key of the function at each event.
+        """
+        function = self.functions_by_descriptor.get(function_descriptor)
+        if function is None:
+            function = self.functions_by_descriptor[function_descriptor] = self.function_from_call(function_descriptor)
+
+        return function
+
+    def add_call_interaction(self, caller: Function, called: Function):
+        (self.interactions_by_call[caller, called]).calls.append(Call(self.next_interaction_rank()))
+
+    def add_return_interaction(self, called: Function, caller: Function):
+        (self.interactions_by_call[caller, called]).responses.append(Return(self.next_interaction_rank()))
+
+    def add_raised_interaction(self, called: Function, caller: Function, error_class_name: str):
+        (self.interactions_by_call[caller, called]).responses.append(
+            Raised(self.next_interaction_rank(), error_class_name)
+        )
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.traced_function = self.function_from_descriptor(called)
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.add_call_interaction(self.function_from_descriptor(caller), self.function_from_descriptor(called))
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        self.add_raised_interaction(
+            self.function_from_descriptor(error_called), self.function_from_descriptor(error_caller), error.class_name
+        )
+
+    def on_return_at(self, *, called: FunctionDescriptor, caller: FunctionDescriptor, **kwargs):
+        self.add_return_interaction(self.function_from_descriptor(called), self.function_from_descriptor(caller))
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        pass
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        self.unhandled_error_class_name = error.class_name
+
+    def build_components_structure(self, functions: Iterable[Function]) -> Module:
+        """
+        Creates the modules hierarchy with their functions from the calls
+        traced during the execution.
+        """
+        root_module = Module(None, {}, {})
+
+        for function in functions:
+            # creates or finds the modules hierarchy holding the function
+            parent_module = root_module
+            for module_name in function.module_path:
+                sub_module = parent_module.sub_modules.get(module_name)
+                if sub_module is None:
+                    sub_module = Module(module_name, {}, {})
+                    parent_module.sub_modules[module_name] = sub_module
+                parent_module = sub_module
+
+            # adds the function in the module
+            sub_module.functions[function.name] = function
+
+        return root_module
+
+
+class InteractionsCounts:
+    """
+    The numbers of interactions between a caller function and a called function, aggregated across several executions:
+    - calls: the number of calls
+    - returns: the number of normal returns
+    - raised_by_error: the number of raised errors, by error class name
+    """
+
+    __slots__ = ('calls', 'returns', 'raised_by_error')
+
+    def __init__(self):
+        self.calls = 0
+        self.returns = 0
+        self.raised_by_error: Dict[str, int] = {}
+
+
+class ComponentsAggregate:
+    """
+    Merges the interactions traced by ComponentsExporters during several executions of the same traced function,
+    by counting them (the ranks of the interactions are meaningless across executions).
+
+    It is not thread-safe: the concurrent merges must be synchronized by the caller.
+    """
+
+    def __init__(self):
+        self.executions_count = 0
+        self.traced_function: Function = None
+        self.functions: Dict[Tuple[str], Function] = {}
+        self.interactions_counts: Dict[Tuple[Function, Function], InteractionsCounts] = {}
+        self.unhandled_errors_counts: Dict[str, int] = {}
+
+    def add_execution(self, components_exporter: ComponentsExporter):
+        self.executions_count += 1
+        if self.traced_function is None:
+            self.traced_function = components_exporter.traced_function
+
+        for function_key, function in components_exporter.functions.items():
+            self.functions.setdefault(function_key, function)
+
+        for interaction_key, (calls, responses) in components_exporter.interactions_by_call.items():
+            interactions_counts = self.interactions_counts.get(interaction_key)
+            if interactions_counts is None:
+                interactions_counts = self.interactions_counts[interaction_key] = InteractionsCounts()
+
+            interactions_counts.calls += len(calls)
+            for response in responses:
+                if isinstance(response, Raised):
+                    raised_by_error = interactions_counts.raised_by_error
+                    raised_by_error[response.error] = raised_by_error.get(response.error, 0) + 1
+                else:
+                    interactions_counts.returns += 1
+
+        error_class_name = components_exporter.unhandled_error_class_name
+        if error_class_name is not None:
+            self.unhandled_errors_counts[error_class_name] = self.unhandled_errors_counts.get(error_class_name, 0) + 1
@@ -0,0 +1,80 @@
+"""
+Module dedicated to the export of a single traced execution by several exporters at once
+(a sequence diagram and a component diagram, for example).
+"""
+
+from typing import Any, Sequence
+
+from pydoctrace.arguments import CapturedArguments
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import Exporter, FunctionDescriptorExporter
+from pydoctrace.stats import TracingStats
+
+
+class FanOutExporter(FunctionDescriptorExporter):
+    """
+    Forwards each tracing event to all the given exporters, in their order.
+
+    It has no sink of its own: each exporter writes in its own sink.
+    """
+
+    def __init__(self, exporters: Sequence[Exporter]):
+        super().__init__(None)
+        self.exporters = tuple(exporters)
+
+    def on_header(self, start_module: str, start_func_name: str):
+        for exporter in self.exporters:
+            exporter.on_header(start_module, start_func_name)
+
+    def on_raw_content(self, raw_content: str):
+        for exporter in self.exporters:
+            exporter.on_raw_content(raw_content)
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        for exporter in self.exporters:
+            exporter.on_tracing_start_at(called, called_line)
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        for exporter in self.exporters:
+            exporter.on_start_call_at(caller, caller_line, called, called_line)
+
+    def on_call_arguments_at(self, called: FunctionDescriptor, called_line: int, arguments: CapturedArguments):
+        for exporter in self.exporters:
+            exporter.on_call_arguments_at(called, called_line, arguments)
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        for exporter in self.exporters:
+            exporter.on_error_propagation_at(error_called, error_called_line, error_caller, error_caller_line, error)
+
+    def on_return_at(
+        self, *, called: FunctionDescriptor, called_line: int, caller: FunctionDescriptor, caller_line: int, arg: Any
+    ):
+        for exporter in self.exporters:
+            exporter.on_return_at(
+                called=called, called_line=called_line, caller=caller, caller_line=caller_line, arg=arg
+            )
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        for exporter in self.exporters:
+            exporter.on_tracing_end_at(called, called_line, arg)
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        for exporter in self.exporters:
+            exporter.on_unhandled_error_end_at(called, called_line, error)
+
+    def on_tracing_stats(self, tracing_stats: TracingStats):
+        for exporter in self.exporters:
+            exporter.on_tracing_stats(tracing_stats)
+
+    def on_footer(self):
+        for exporter in self.exporters:
+            exporter.on_footer()
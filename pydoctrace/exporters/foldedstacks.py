@@ -0,0 +1,116 @@
+"""
+Module dedicated to the export of the traced calls stacks in the folded-stacks format, which is the input format
+of flame graph tools (https://github.com/brendangregg/FlameGraph, https://www.speedscope.app/, etc.).
+
+Each line of the export is a calls stack (functions separated by ';', from the traced function to the called one)
+followed by its weight: 'module.traced_function;module.called_function;other_module.sub_called_function 3'.
+
+The calls stacks are aggregated as the execution goes, in a dictionary keyed by the stacks (tuples of functions):
+the memory footprint depends on the number of distinct stacks, not on the number of traced calls.
+"""
+
+from collections import defaultdict
+from io import TextIOBase
+from typing import Any, Dict, List, Tuple
+
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import EVENT_CLOCK, FunctionDescriptorExporter
+
+STACK_SEPARATOR = ';'
+
+
+class StackFrame:
+    """
+    A function being executed in the calls stack, with the timing information used to compute its self time.
+    """
+
+    __slots__ = ('stack', 'start_ns', 'children_ns')
+
+    def __init__(self, stack: Tuple[str], start_ns: int):
+        self.stack = stack
+        self.start_ns = start_ns
+        self.children_ns = 0
+
+
+class FoldedStacksExporter(FunctionDescriptorExporter):
+    """
+    Exports the calls stacks weighted by the number of calls.
+
+    The flame graph tools add the weights of the sub-stacks to the weight of their parent stack:
+    the width of a function in the flame graph then represents the number of calls it made (including itself).
+    """
+
+    def __init__(self, io_sink: TextIOBase):
+        super().__init__(io_sink)
+        self.weights_by_stack: Dict[Tuple[str], int] = defaultdict(int)
+        self.frames: List[StackFrame] = []
+
+    def push_call(self, called: FunctionDescriptor):
+        parent_stack = self.frames[-1].stack if self.frames else ()
+        frame = StackFrame(parent_stack + (f'{called.fq_module_text}.{called.function_name}',), 0)
+        self.frames.append(frame)
+        self.weights_by_stack[frame.stack] += 1
+
+    def pop_call(self):
+        self.frames.pop()
+
+    def on_header(self, start_module: str, start_func_name: str):
+        pass
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.push_call(called)
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.push_call(called)
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        self.pop_call()
+
+    def on_return_at(self, **kwargs):
+        self.pop_call()
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        self.pop_call()
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        self.pop_call()
+
+    def on_footer(self):
+        for stack, weight in sorted(self.weights_by_stack.items()):
+            self.io_sink.write(f'{STACK_SEPARATOR.join(stack)} {weight}\n')
+
+
+class FoldedStacksTimeExporter(FoldedStacksExporter):
+    """
+    Exports the calls stacks weighted by the time spent in the functions, in microseconds.
+
+    The weight of each stack is the self time of its last function (its inclusive time minus the inclusive time of
+    its callees): the flame graph tools add the weights of the sub-stacks to the weight of their parent stack,
+    the width of a function in the flame graph then represents its inclusive time.
+    """
+
+    def push_call(self, called: FunctionDescriptor):
+        parent_stack = self.frames[-1].stack if self.frames else ()
+        self.frames.append(
+            StackFrame(parent_stack + (f'{called.fq_module_text}.{called.function_name}',), EVENT_CLOCK.event_ns())
+        )
+
+    def pop_call(self):
+        frame = self.frames.pop()
+        inclusive_ns = EVENT_CLOCK.event_ns() - frame.start_ns
+        self.weights_by_stack[frame.stack] += inclusive_ns - frame.children_ns
+        if self.frames:
+            self.frames[-1].children_ns += inclusive_ns
+
+    def on_footer(self):
+        for stack, weight_ns in sorted(self.weights_by_stack.items()):
+            self.io_sink.write(f'{STACK_SEPARATOR.join(stack)} {weight_ns // 1000}\n')
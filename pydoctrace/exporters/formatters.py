@@ -35,6 +35,8 @@ AROBASE_IN_UNICODE: str = '<U+0040>'
 
 DUNDER_REPLACE_PATTERN: Pattern = re_compile('__')
 
+DOUBLE_QUOTE_REPLACE_PATTERN: Pattern = re_compile(r'(["\\])')
+
 
 def replace_arobase_by_unicode(value: Any, format_spec: str) -> Tuple[Any, str]:
     """
@@ -46,6 +48,17 @@ def replace_arobase_by_unicode(value: Any, format_spec: str) -> Tuple[Any, str]:
     return value, format_spec
 
 
+def escape_line_breaks(value: Any, format_spec: str) -> Tuple[Any, str]:
+    """
+    Escapes the carriage returns and the line feeds (as '\\r' and '\\n'),
+    which would end the one-line statements of the diagram syntax
+    """
+    if value is not None and isinstance(value, str):
+        value = value.replace('\r', r'\r').replace('\n', r'\n')
+
+    return value, format_spec
+
+
 def escape_dunder_with_tilde(value: Any, format_spec: str) -> Tuple[Any, str]:
     if format_spec == 'dunder':
         # escapes each text part of the given str value (splitted on '.') with '~' when format_spec is 'dunder'
@@ -59,6 +72,19 @@ def escape_dunder_with_tilde(value: Any, format_spec: str) -> Tuple[Any, str]:
     return value, format_spec
 
 
+def escape_double_quotes(value: Any, format_spec: str) -> Tuple[Any, str]:
+    if format_spec == 'quoted':
+        # escapes the double quotes (and the backslashes) with a backslash when format_spec is 'quoted'
+        # so that the value can be used in a double-quoted string
+        if isinstance(value, str):
+            value = DOUBLE_QUOTE_REPLACE_PATTERN.sub(r'\\\1', value)
+
+        # escaping is done, cancel it for parent formatting
+        format_spec = ''
+
+    return value, format_spec
+
+
 def formatter_factory(formatter_class_name: str, *formatters: Callable[[Any, str], Tuple[Any, str]]) -> Formatter:
     """
     Creates a custom string.Formatter with the given formatters as components.
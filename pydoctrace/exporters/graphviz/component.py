@@ -0,0 +1,206 @@
+"""
+Module dedicated to the export of component diagrams in the DOT syntax of Graphviz,
+which renders large graphs much faster than PlantUML.
+
+Bibliography:
+- https://graphviz.org/doc/info/lang.html: the DOT language
+- https://graphviz.org/docs/attrs/weight/: edge weights
+- https://graphviz.org/Gallery/directed/cluster.html: clusters (used to represent the modules hierarchy)
+"""
+
+from itertools import count
+from string import Formatter
+from typing import Iterable, Iterator, Tuple
+
+from pydoctrace.domain.diagram import Function, Module, Raised
+from pydoctrace.exporters.components import ComponentsExporter
+from pydoctrace.exporters.formatters import escape_double_quotes, formatter_factory
+
+GRAPHVIZ_COMPONENT_FORMATTER: Formatter = formatter_factory('GraphvizComponentFormatter', escape_double_quotes)
+
+HEADER_TPL = r"""digraph "{diagram_name:quoted}" {{
+  node [shape=box, style=rounded, fontname=Helvetica]
+  edge [fontname=Helvetica, fontsize=10]
+
+"""
+
+CLUSTER_OPEN_TPL = r"""{indentation}subgraph cluster_{cluster_id} {{
+{indentation}  label="{cluster_name:quoted}"
+{indentation}  style={cluster_style}
+"""
+
+CLUSTER_CLOSE_TPL = r"""{indentation}}}
+"""
+
+COMPONENT_TPL = r"""{indentation}"{function.fqn:quoted}" [label="{function.name:quoted}"{styling}]
+"""
+
+UNHANDLED_ERROR_NODE_TPL = r"""{indentation}"{fq_error_class_name:quoted}" [label="{error_class_name:quoted}", shape=plaintext, fontcolor=darkred]
+"""
+
+INTERACTION_CALL_TPL = r"""  "{caller_function.fqn:quoted}" -> "{called_function.fqn:quoted}" [label="{calls_count}", weight={calls_count}, penwidth={penwidth}]
+"""
+
+INTERACTION_RAISED_TPL = r"""  "{called_function.fqn:quoted}" -> "{caller_function.fqn:quoted}" [label="{errors_label:quoted}", style=dashed, color=darkred, fontcolor=darkred, constraint=false]
+"""
+
+UNHANDLED_ERROR_INTERACTION_TPL = r"""  "{traced_function.fqn:quoted}" -> "{fq_error_class_name:quoted}" [style=dashed, color=darkred]
+"""
+
+FOOTER_TPL = r"""}
+"""
+
+INDENT = '  '
+
+# the thickness of the call arrows grows with the number of calls, up to a limit
+MAX_PENWIDTH = 5
+
+
+class DotModuleStructureVisitor:
+    """
+    Recursively produces the DOT syntax of the components structure using a visitor pattern on the root module:
+    modules are represented as nested clusters, functions as nodes.
+    """
+
+    fmt: Formatter = GRAPHVIZ_COMPONENT_FORMATTER
+
+    def __init__(self, traced_function: Function, unhandled_error_class_name: str):
+        self.traced_function = traced_function
+        self.unhandled_error_class_name = unhandled_error_class_name
+        self.cluster_ids: Iterator[int] = count(1)
+
+    def visit_module(self, module: Module, parent_module_path: Tuple[str], indentation_level: int) -> Iterable[str]:
+        """
+        Yields the DOT code dedicated to package or modules hierarchy.
+        """
+        has_functions = len(module.functions) > 0
+
+        # groups the module name with the parent ones if the module contains no function and only one sub-module
+        if not has_functions and len(module.sub_modules) == 1:
+            sub_module = list(module.sub_modules.values())[0]
+
+            # skips the wrapping module if it has no name (root module)
+            sub_module_parent_path = parent_module_path if module.name is None else parent_module_path + (module.name,)
+
+            yield from self.visit_module(sub_module, sub_module_parent_path, indentation_level)
+
+        # the root module is not drawn, its sub-modules are
+        elif module.name is None:
+            for sub_module in module.sub_modules.values():
+                yield from self.visit_module(sub_module, (), indentation_level)
+
+        # writes the module (prefixed by the names of its parents without function) with its functions and sub-modules
+        else:
+            indentation = indentation_level * INDENT
+            yield self.fmt.format(
+                CLUSTER_OPEN_TPL,
+                indentation=indentation,
+                cluster_id=next(self.cluster_ids),
+                cluster_name='.'.join(parent_module_path + (module.name,)),
+                # modules with functions are drawn with solid borders, packages with dashed borders
+                cluster_style='solid' if has_functions else 'dashed',
+            )
+
+            if has_functions:
+                yield from self.visit_functions(module.functions.values(), indentation_level + 1)
+
+            for sub_module in module.sub_modules.values():
+                yield from self.visit_module(sub_module, (), indentation_level + 1)
+
+            yield self.fmt.format(CLUSTER_CLOSE_TPL, indentation=indentation)
+
+    def visit_functions(self, functions: Iterable[Function], indentation_level: int) -> Iterable[str]:
+        """
+        Yields the DOT code dedicated to the functions of a module.
+        """
+        indentation = indentation_level * INDENT
+
+        for function in functions:
+            is_traced_function = function == self.traced_function
+
+            # adds the node representing the error that bubbles up from the traced execution
+            if is_traced_function and self.unhandled_error_class_name is not None:
+                yield self.fmt.format(
+                    UNHANDLED_ERROR_NODE_TPL,
+                    indentation=indentation,
+                    fq_error_class_name='.'.join([*self.traced_function.module_path, self.unhandled_error_class_name]),
+                    error_class_name=self.unhandled_error_class_name,
+                )
+
+            yield self.fmt.format(
+                COMPONENT_TPL,
+                indentation=indentation,
+                function=function,
+                styling=', style="rounded,bold", xlabel="@trace"' if is_traced_function else '',
+            )
+
+
+class GraphvizComponentExporter(ComponentsExporter):
+    """
+    Exports the component diagram in the DOT syntax of Graphviz.
+
+    The call arrows are labelled and weighted by the number of calls (instead of the ranks of the calls in the
+    PlantUML diagram) so that large graphs stay legible; the returns are not drawn, the raised errors are.
+    """
+
+    fmt: Formatter = GRAPHVIZ_COMPONENT_FORMATTER
+
+    def on_header(self, start_module: str, start_func_name: str):
+        diagram_name = f'{start_module}.{start_func_name}-component'
+        self.io_sink.write(self.fmt.format(HEADER_TPL, diagram_name=diagram_name))
+
+    def on_footer(self):
+        root_module = self.build_components_structure(self.functions.values())
+
+        for component_line in DotModuleStructureVisitor(
+            self.traced_function, self.unhandled_error_class_name
+        ).visit_module(root_module, (), 1):
+            self.io_sink.write(component_line)
+
+        self.io_sink.write('\n')
+        self.write_unhandled_error_exit_interaction()
+        self.write_components_interactions()
+
+        self.io_sink.write(FOOTER_TPL)
+
+    def write_unhandled_error_exit_interaction(self):
+        if self.unhandled_error_class_name is not None:
+            self.io_sink.write(
+                self.fmt.format(
+                    UNHANDLED_ERROR_INTERACTION_TPL,
+                    traced_function=self.traced_function,
+                    fq_error_class_name='.'.join([*self.traced_function.module_path, self.unhandled_error_class_name]),
+                )
+            )
+
+    def write_components_interactions(self):
+        for (caller_function, called_function), (calls, responses) in self.interactions_by_call.items():
+            calls_count = len(calls)
+            if calls_count > 0:
+                self.io_sink.write(
+                    self.fmt.format(
+                        INTERACTION_CALL_TPL,
+                        caller_function=caller_function,
+                        called_function=called_function,
+                        calls_count=calls_count,
+                        penwidth=min(calls_count, MAX_PENWIDTH),
+                    )
+                )
+
+            # counts the raised errors by class name
+            raised_counts = {}
+            for response in responses:
+                if isinstance(response, Raised):
+                    raised_counts[response.error] = raised_counts.get(response.error, 0) + 1
+            if raised_counts:
+                self.io_sink.write(
+                    self.fmt.format(
+                        INTERACTION_RAISED_TPL,
+                        caller_function=caller_function,
+                        called_function=called_function,
+                        errors_label=', '.join(
+                            error if error_count == 1 else f'{error} x{error_count}'
+                            for error, error_count in raised_counts.items()
+                        ),
+                    )
+                )
@@ -0,0 +1,146 @@
+"""
+Module dedicated to the export of the tracing events in the JSON Lines format (https://jsonlines.org/):
+one compact JSON object per line and per tracer event, so that traces can be streamed into analysis tools.
+
+The functions involved in the trace are interned: the first time a function appears in an event, a 'function'
+declaration line is written with a numeric id, which is then used by the events to refer to the function.
+
+The events have fixed shapes, their JSON templates are thus precomputed: only the string values are encoded
+(with the C-accelerated string encoder of the json module) instead of calling json.dumps for each event.
+
+The tracing events hold the time at which they were traced ('ts', in nanoseconds from an arbitrary origin, read from
+the EVENT_CLOCK) so that the time-based exporters can export the durations of the recorded execution when it is replayed.
+"""
+
+from io import TextIOBase
+from json.encoder import encode_basestring
+from typing import Any, Dict, Tuple
+
+from pydoctrace.arguments import CapturedArguments
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import EVENT_CLOCK, FunctionDescriptorExporter
+
+HEADER_TPL = '{"event":"header","module":%s,"function":%s}\n'
+FUNCTION_TPL = '{"event":"function","id":%d,"module":%s,"name":%s}\n'
+TRACING_START_TPL = '{"event":"start","ts":%d,"called":%d,"called_line":%d}\n'
+CALL_START_TPL = '{"event":"call","ts":%d,"caller":%d,"caller_line":%d,"called":%d,"called_line":%d}\n'
+CALL_ARGUMENTS_TPL = '{"event":"arguments","ts":%d,"called":%d,"called_line":%d,"arguments":%s}\n'
+CALL_END_TPL = '{"event":"return","ts":%d,"called":%d,"called_line":%d,"caller":%d,"caller_line":%d,"value":%s}\n'
+ERROR_PROPAGATION_TPL = (
+    '{"event":"error","ts":%d,"called":%d,"called_line":%d,"caller":%d,"caller_line":%d,"class":%s,"message":%s}\n'
+)
+TRACING_END_TPL = '{"event":"end","ts":%d,"called":%d,"called_line":%d,"value":%s}\n'
+UNHANDLED_ERROR_END_TPL = '{"event":"unhandled_error","ts":%d,"called":%d,"called_line":%d,"class":%s,"message":%s}\n'
+FOOTER_TPL = '{"event":"footer"}\n'
+
+JSON_NULL = 'null'
+
+
+class JSONLinesExporter(FunctionDescriptorExporter):
+    """
+    Exports the tracing events in the JSON Lines format, in a streaming fashion.
+
+    Values (returned values, error messages) are exported as strings, or null for None.
+    """
+
+    def __init__(self, io_sink: TextIOBase):
+        super().__init__(io_sink)
+        self.function_ids: Dict[Tuple[str, str], int] = {}
+
+    def function_id(self, function: FunctionDescriptor) -> int:
+        """
+        Retrieves the id of the given function.
+        Declares the function in the export the first time it is encountered.
+        """
+        function_key = (function.fq_module_text, function.function_name)
+        function_id = self.function_ids.get(function_key)
+        if function_id is None:
+            function_id = len(self.function_ids)
+            self.function_ids[function_key] = function_id
+            self.io_sink.write(
+                FUNCTION_TPL
+                % (function_id, encode_basestring(function.fq_module_text), encode_basestring(function.function_name))
+            )
+
+        return function_id
+
+    def format_arg_value(self, arg: Any) -> str:
+        if arg is None:
+            return JSON_NULL
+
+        return encode_basestring(self.value_renderer.render(arg))
+
+    def on_header(self, start_module: str, start_func_name: str):
+        self.io_sink.write(HEADER_TPL % (encode_basestring(start_module), encode_basestring(start_func_name)))
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        called_id = self.function_id(called)
+        self.io_sink.write(TRACING_START_TPL % (EVENT_CLOCK.event_ns(), called_id, called_line))
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        caller_id = self.function_id(caller)
+        called_id = self.function_id(called)
+        self.io_sink.write(CALL_START_TPL % (EVENT_CLOCK.event_ns(), caller_id, caller_line, called_id, called_line))
+
+    def on_call_arguments_at(self, called: FunctionDescriptor, called_line: int, arguments: CapturedArguments):
+        called_id = self.function_id(called)
+        self.io_sink.write(
+            CALL_ARGUMENTS_TPL % (EVENT_CLOCK.event_ns(), called_id, called_line, encode_basestring(arguments.render()))
+        )
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        called_id = self.function_id(error_called)
+        caller_id = self.function_id(error_caller)
+        self.io_sink.write(
+            ERROR_PROPAGATION_TPL
+            % (
+                EVENT_CLOCK.event_ns(),
+                called_id,
+                error_called_line,
+                caller_id,
+                error_caller_line,
+                encode_basestring(error.class_name),
+                self.format_arg_value(error.message),
+            )
+        )
+
+    def on_return_at(
+        self, *, called: FunctionDescriptor, called_line: int, caller: FunctionDescriptor, caller_line: int, arg: Any
+    ):
+        called_id = self.function_id(called)
+        caller_id = self.function_id(caller)
+        self.io_sink.write(
+            CALL_END_TPL
+            % (EVENT_CLOCK.event_ns(), called_id, called_line, caller_id, caller_line, self.format_arg_value(arg))
+        )
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        called_id = self.function_id(called)
+        self.io_sink.write(
+            TRACING_END_TPL % (EVENT_CLOCK.event_ns(), called_id, called_line, self.format_arg_value(arg))
+        )
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        called_id = self.function_id(called)
+        self.io_sink.write(
+            UNHANDLED_ERROR_END_TPL
+            % (
+                EVENT_CLOCK.event_ns(),
+                called_id,
+                called_line,
+                encode_basestring(error.class_name),
+                self.format_arg_value(error.message),
+            )
+        )
+
+    def on_footer(self):
+        self.io_sink.write(FOOTER_TPL)
@@ -1,5 +1,22 @@
+from typing import Iterable
+
 # Mutualized footer for all PlantUML diagrams
 FOOTER_TPL = r"""
 footer Generated by //pydoctrace//
 @enduml
 """
+
+# the title of the comment block holding the statistics of the tracing
+TRACING_STATS_TITLE = 'tracing statistics'
+
+
+def comment_block(title: str, lines: Iterable[str]) -> str:
+    """
+    Creates a block comment, ignored by PlantUML when rendering the diagram.
+    """
+    comment_lines = '\n'.join(lines)
+    return f"""
+/' {title}
+{comment_lines}
+'/
+"""
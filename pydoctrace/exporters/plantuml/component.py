@@ -6,17 +6,15 @@ Bibliography:
 The domain modeling involves NamedTuples because they are used as dictionary keys (thus need to be hashable and immutable).
 """
 
-from collections import defaultdict, deque
 from io import TextIOBase
-from itertools import count
 from string import Formatter
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
-from pydoctrace.domain.diagram import Call, Function, Interactions, Module, Raised, Return
-from pydoctrace.domain.execution import CallEnd, Error
-from pydoctrace.exporters import Exporter
+from pydoctrace.domain.diagram import Function, Module, Raised, Return
+from pydoctrace.exporters.components import ComponentsAggregate, ComponentsExporter
 from pydoctrace.exporters.formatters import escape_dunder_with_tilde, formatter_factory
-from pydoctrace.exporters.plantuml import FOOTER_TPL
+from pydoctrace.exporters.plantuml import FOOTER_TPL, TRACING_STATS_TITLE, comment_block
+from pydoctrace.stats import TracingStats
 
 PLANTUML_COMPONENT_FORMATTER: Formatter = formatter_factory('PlantUMLComponentFormatter', escape_dunder_with_tilde)
 
@@ -153,7 +151,7 @@ class ModuleStructureVisitor:
             )
 
 
-class PlantUMLComponentExporter(Exporter):
+class PlantUMLComponentExporter(ComponentsExporter):
     """
     Exports the component diagram in the PlantUML format.
 
@@ -167,63 +165,15 @@ class PlantUMLComponentExporter(Exporter):
 
     def __init__(self, io_sink: TextIOBase):
         super().__init__(io_sink)
-        self.interactions_by_call: Dict[Tuple[Function, Function], Interactions] = defaultdict(
-            lambda: Interactions(deque(), deque())
-        )
-        self.interaction_rank_iter = count(1, step=1)
-        self.traced_function: Function = None
-        self.functions: Dict[Tuple[str], Function] = {}
-        self.unhandled_error_class_name: str = None
-
-    def next_interaction_rank(self) -> int:
-        return next(self.interaction_rank_iter)
-
-    def function_from_call(self, caller: CallEnd) -> Function:
-        """
-        Retrieves the Function from the cache, or creates it from the given Call and caches it.
-        """
-        function_key = caller.fq_module_tuple + (caller.function_name,)
-        function = self.functions.get(function_key)
-        if function is None:
-            function = Function(caller.function_name, caller.fq_module_tuple)
-            self.functions[function_key] = function
-
-        return function
-
-    def add_call_interaction(self, caller: Function, called: Function):
-        (self.interactions_by_call[caller, called]).calls.append(Call(self.next_interaction_rank()))
-
-    def add_return_interaction(self, called: Function, caller: Function):
-        (self.interactions_by_call[caller, called]).responses.append(Return(self.next_interaction_rank()))
-
-    def add_raised_interaction(self, called: Function, caller: Function, error_class_name: str):
-        (self.interactions_by_call[caller, called]).responses.append(
-            Raised(self.next_interaction_rank(), error_class_name)
-        )
+        self.tracing_stats_lines: List[str] = None
 
     def on_header(self, start_module: str, start_func_name: str):
         diagram_name = f'{start_module}.{start_func_name}-component'
         self.io_sink.write(self.fmt.format(HEADER_TPL, diagram_name=diagram_name))
 
-    def on_tracing_start(self, called: CallEnd):
-        self.traced_function = self.function_from_call(called)
-
-    def on_start_call(self, caller: CallEnd, called: CallEnd):
-        self.add_call_interaction(self.function_from_call(caller), self.function_from_call(called))
-
-    def on_error_propagation(self, error_called: CallEnd, error_caller: CallEnd, error: Error):
-        self.add_raised_interaction(
-            self.function_from_call(error_called), self.function_from_call(error_caller), error.class_name
-        )
-
-    def on_return(self, called: CallEnd, caller: CallEnd, **kwargs):
-        self.add_return_interaction(self.function_from_call(called), self.function_from_call(caller))
-
-    def on_tracing_end(self, called: CallEnd, arg: Any):
-        pass
-
-    def on_unhandled_error_end(self, called: CallEnd, error: Error):
-        self.unhandled_error_class_name = error.class_name
+    def on_tracing_stats(self, tracing_stats: TracingStats):
+        # the statistics are written with the diagram contents, in the footer
+        self.tracing_stats_lines = tracing_stats.summary_lines()
 
     def on_footer(self):
         """
@@ -241,31 +191,13 @@ class PlantUMLComponentExporter(Exporter):
         # writes interactions
         self.write_components_interactions()
 
+        # writes the statistics of the tracing, if any
+        if self.tracing_stats_lines is not None:
+            self.io_sink.write(comment_block(TRACING_STATS_TITLE, self.tracing_stats_lines))
+
         # writes the file footer
         self.io_sink.write(FOOTER_TPL)
 
-    def build_components_structure(self, functions: Iterable[Function]) -> Module:
-        """
-        Creates the modules hierarchy with their functions from the calls
-        traced during the execution.
-        """
-        root_module = Module(None, {}, {})
-
-        for function in functions:
-            # creates or finds the modules hierarchy holding the function
-            parent_module = root_module
-            for module_name in function.module_path:
-                sub_module = parent_module.sub_modules.get(module_name)
-                if sub_module is None:
-                    sub_module = Module(module_name, {}, {})
-                    parent_module.sub_modules[module_name] = sub_module
-                parent_module = sub_module
-
-            # adds the function in the module
-            sub_module.functions[function.name] = function
-
-        return root_module
-
     def write_components_structure(self, root_module: Module):
         """
         Writes the 1st part of the PlantUML component diagram describing the structure of
@@ -303,50 +235,118 @@ class PlantUMLComponentExporter(Exporter):
         the functions as arrows between the components.
         """
         for (caller_function, called_function), (calls, responses) in self.interactions_by_call.items():
-            is_recursive_call = caller_function == called_function
-            are_in_same_module = caller_function.module_path == called_function.module_path
+            returns = [response for response in responses if isinstance(response, Return)]
+            raiseds = [response for response in responses if isinstance(response, Raised)]
+            self.write_interaction_arrows(
+                caller_function,
+                called_function,
+                self.build_arrow_label_ranks([call.rank for call in calls]),
+                self.build_arrow_label_ranks([exit_return.rank for exit_return in returns]) if returns else None,
+                self.build_arrow_label_ranks([f'{exit_raised.rank}:{exit_raised.error}' for exit_raised in raiseds])
+                if raiseds
+                else None,
+            )
+
+    def write_interaction_arrows(
+        self,
+        caller_function: Function,
+        called_function: Function,
+        calls_label: str,
+        returns_label: str,
+        raiseds_label: str,
+    ):
+        """
+        Writes the arrows between a caller and a called functions: the calls, the returns and the raised errors
+        (the returns and raised errors arrows are not written if their label is None).
+        """
+        is_recursive_call = caller_function == called_function
+        are_in_same_module = caller_function.module_path == called_function.module_path
+
+        # call arrows between functions have a different direction whether they are in the same module or not
+        call_arrow = '->' if is_recursive_call or not are_in_same_module else '-->'
+        self.io_sink.write(
+            self.fmt.format(
+                INTERACTION_CALL_TPL,
+                caller_function=caller_function,
+                arrow=call_arrow,
+                called_function=called_function,
+                arrow_label=f' : {calls_label}',
+            )
+        )
 
-            # call arrows between functions have a different direction whether they are in the same module or not
-            call_arrow = '->' if is_recursive_call or not are_in_same_module else '-->'
+        # returns are not drawn for recursive calls to improve readability
+        if not is_recursive_call and returns_label is not None:
+            returns_arrow = '<..' if are_in_same_module else '<.'
+            self.io_sink.write(
+                self.fmt.format(
+                    INTERACTION_CALL_TPL,
+                    caller_function=caller_function,
+                    arrow=returns_arrow,
+                    called_function=called_function,
+                    arrow_label=f' : {returns_label}',
+                )
+            )
 
-            call_label = f' : {self.build_arrow_label_ranks([call.rank for call in calls])}'
+        if raiseds_label is not None:
+            raiseds_arrow = f'{"<.." if are_in_same_module else "<."}[thickness=2]'
             self.io_sink.write(
                 self.fmt.format(
                     INTERACTION_CALL_TPL,
                     caller_function=caller_function,
-                    arrow=call_arrow,
+                    arrow=raiseds_arrow,
                     called_function=called_function,
-                    arrow_label=call_label,
+                    arrow_label=f' #line:darkred;text:darkred : {raiseds_label}',
                 )
             )
 
-            # returns are not drawn for recursive calls to improve readability
-            if not is_recursive_call:
-                returns = [response for response in responses if isinstance(response, Return)]
-                if returns:
-                    returns_arrow = '<..' if are_in_same_module else '<.'
-                    returns_label = f' : {self.build_arrow_label_ranks([exit_return.rank for exit_return in returns])}'
-                    self.io_sink.write(
-                        self.fmt.format(
-                            INTERACTION_CALL_TPL,
-                            caller_function=caller_function,
-                            arrow=returns_arrow,
-                            called_function=called_function,
-                            arrow_label=returns_label,
-                        )
-                    )
 
-            raiseds = [response for response in responses if isinstance(response, Raised)]
-            if raiseds:
-                raiseds_arrow = f'{"<.." if are_in_same_module else "<."}[thickness=2]'
-                raiseds_label = f' #line:darkred;text:darkred : {self.build_arrow_label_ranks([f"{exit_raised.rank}:{exit_raised.error}" for exit_raised in raiseds])}'
-
-                self.io_sink.write(
-                    self.fmt.format(
-                        INTERACTION_CALL_TPL,
-                        caller_function=caller_function,
-                        arrow=raiseds_arrow,
-                        called_function=called_function,
-                        arrow_label=raiseds_label,
-                    )
+AGGREGATED_HEADER_TPL = r"""' aggregation of {executions_count} traced executions
+"""
+
+# identifies the label representing the unhandled errors of the aggregated executions
+UNHANDLED_ERRORS_LABEL_NAME = 'UnhandledErrors'
+
+
+class PlantUMLAggregatedComponentExporter(PlantUMLComponentExporter):
+    """
+    Exports the component diagram of the interactions merged from several executions of the traced function
+    (see ComponentsAccumulator): the arrows are labelled with the numbers of interactions instead of their ranks.
+
+    The aggregate to export must be given with set_aggregate(...) before writing the footer.
+    """
+
+    def set_aggregate(self, aggregate: ComponentsAggregate):
+        self.aggregate = aggregate
+        self.traced_function = aggregate.traced_function
+        self.functions = aggregate.functions
+        self.unhandled_error_class_name = UNHANDLED_ERRORS_LABEL_NAME if aggregate.unhandled_errors_counts else None
+        self.io_sink.write(self.fmt.format(AGGREGATED_HEADER_TPL, executions_count=aggregate.executions_count))
+
+    @staticmethod
+    def build_errors_counts_label(errors_counts: Dict[str, int]) -> str:
+        return ', '.join(
+            error if error_count == 1 else f'{error} x{error_count}' for error, error_count in errors_counts.items()
+        )
+
+    def write_unhandled_error_exit_interaction(self):
+        if self.unhandled_error_class_name is not None:
+            self.io_sink.write(
+                self.fmt.format(
+                    UNHANDLED_ERROR_INTERACTION_TPL,
+                    traced_function=self.traced_function,
+                    fq_error_class_name='.'.join([*self.traced_function.module_path, self.unhandled_error_class_name]),
+                    error_class_name=self.build_errors_counts_label(self.aggregate.unhandled_errors_counts),
                 )
+            )
+
+    def write_components_interactions(self):
+        for (caller_function, called_function), interactions_counts in self.aggregate.interactions_counts.items():
+            self.write_interaction_arrows(
+                caller_function,
+                called_function,
+                f'x{interactions_counts.calls}',
+                f'x{interactions_counts.returns}' if interactions_counts.returns > 0 else None,
+                self.build_errors_counts_label(interactions_counts.raised_by_error)
+                if interactions_counts.raised_by_error
+                else None,
+            )
@@ -11,13 +11,20 @@ Bibliography:
 from string import Formatter
 from typing import Any
 
-from pydoctrace.domain.execution import CallEnd, Error
-from pydoctrace.exporters import Exporter
-from pydoctrace.exporters.formatters import escape_dunder_with_tilde, formatter_factory, replace_arobase_by_unicode
-from pydoctrace.exporters.plantuml import FOOTER_TPL
+from pydoctrace.arguments import CapturedArguments
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import FunctionDescriptorExporter
+from pydoctrace.exporters.formatters import (
+    escape_dunder_with_tilde,
+    escape_line_breaks,
+    formatter_factory,
+    replace_arobase_by_unicode,
+)
+from pydoctrace.exporters.plantuml import FOOTER_TPL, TRACING_STATS_TITLE, comment_block
+from pydoctrace.stats import TracingStats
 
 PLANTUML_SEQUENCE_FORMATTER: Formatter = formatter_factory(
-    'PlantUMLSequenceFormatter', replace_arobase_by_unicode, escape_dunder_with_tilde
+    'PlantUMLSequenceFormatter', replace_arobase_by_unicode, escape_line_breaks, escape_dunder_with_tilde
 )
 
 HEADER_TPL = r"""@startuml {diagram_name}
@@ -30,40 +37,43 @@ hide footbox
 
 TRACING_START_TPL = r"""
 [o-> "{called.fq_module_text:dunder}\n{called.function_name:dunder}"
-note right: line {called.line_index}
+note right: line {called_line}
 """
 
 CALL_START_TPL = r"""
 "{caller.fq_module_text:dunder}\n{caller.function_name:dunder}" -> "{called.fq_module_text:dunder}\n{called.function_name:dunder}" ++
-note left: line {caller.line_index}
-note right: line {called.line_index}
+note left: line {caller_line}
+note right: line {called_line}
+"""
+
+CALL_ARGUMENTS_TPL = r"""note right: {arguments:dunder}
 """
 
 CALL_END_TPL = r"""
 return {arg:dunder}
-note right: line {called.line_index}
+note right: line {called_line}
 |||
 """
 
 ERROR_PROPAGATION_TPL = r"""
 "{error_caller.fq_module_text:dunder}\n{error_caller.function_name:dunder}" o<--x "{error_called.fq_module_text:dunder}\n{error_called.function_name:dunder}": ""{error.class_name}""\n{error.message}
 deactivate "{error_called.fq_module_text:dunder}\n{error_called.function_name:dunder}"
-note right: line {error_called.line_index}
-note left: line {error_caller.line_index}
+note right: line {error_called_line}
+note left: line {error_caller_line}
 """
 
 TRACING_END_TPL = r"""
 [<-- "{called.fq_module_text:dunder}\n{called.function_name:dunder}": {arg:dunder}
-note right: line {called.line_index}
+note right: line {called_line}
 """
 
 UNHANDLED_ERROR_END_TPL = r"""
 [<-->x "{called.fq_module_text:dunder}\n{called.function_name:dunder}": ""{error.class_name}""\n{error.message}
-note right: line {called.line_index}
+note right: line {called_line}
 """
 
 
-class PlantUMLSequenceExporter(Exporter):
+class PlantUMLSequenceExporter(FunctionDescriptorExporter):
     """
     Exports the sequence diagram in the PlantUML format.
 
@@ -81,30 +91,60 @@ class PlantUMLSequenceExporter(Exporter):
         diagram_name = f'{start_module}.{start_func_name}-sequence'
         self.io_sink.write(self.fmt.format(HEADER_TPL, diagram_name=diagram_name))
 
-    def on_tracing_start(self, called: CallEnd):
-        self.io_sink.write(self.fmt.format(TRACING_START_TPL, called=called))
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.io_sink.write(self.fmt.format(TRACING_START_TPL, called=called, called_line=called_line))
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.io_sink.write(
+            self.fmt.format(
+                CALL_START_TPL, caller=caller, caller_line=caller_line, called=called, called_line=called_line
+            )
+        )
 
-    def on_start_call(self, caller: CallEnd, called: CallEnd):
-        self.io_sink.write(self.fmt.format(CALL_START_TPL, caller=caller, called=called))
+    def on_call_arguments_at(self, called: FunctionDescriptor, called_line: int, arguments: CapturedArguments):
+        self.io_sink.write(self.fmt.format(CALL_ARGUMENTS_TPL, arguments=arguments.render()))
 
-    def format_arg_value(self, arg: Any) -> Any:
+    def format_arg_value(self, arg: Any) -> str:
         if arg is None:
             return ''
-        return arg
-
-    def on_error_propagation(self, error_called: CallEnd, error_caller: CallEnd, error: Error):
+        return self.value_renderer.render(arg)
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
         self.io_sink.write(
-            self.fmt.format(ERROR_PROPAGATION_TPL, error_called=error_called, error_caller=error_caller, error=error)
+            self.fmt.format(
+                ERROR_PROPAGATION_TPL,
+                error_called=error_called,
+                error_called_line=error_called_line,
+                error_caller=error_caller,
+                error_caller_line=error_caller_line,
+                error=error,
+            )
         )
 
-    def on_return(self, *, called: CallEnd, arg: Any, **kwargs):
-        self.io_sink.write(self.fmt.format(CALL_END_TPL, called=called, arg=self.format_arg_value(arg)))
+    def on_return_at(self, *, called: FunctionDescriptor, called_line: int, arg: Any, **kwargs):
+        self.io_sink.write(self.fmt.format(CALL_END_TPL, called_line=called_line, arg=self.format_arg_value(arg)))
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        self.io_sink.write(
+            self.fmt.format(TRACING_END_TPL, called=called, called_line=called_line, arg=self.format_arg_value(arg))
+        )
 
-    def on_tracing_end(self, called: CallEnd, arg: Any):
-        self.io_sink.write(self.fmt.format(TRACING_END_TPL, called=called, arg=self.format_arg_value(arg)))
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        self.io_sink.write(
+            self.fmt.format(UNHANDLED_ERROR_END_TPL, called=called, called_line=called_line, error=error)
+        )
 
-    def on_unhandled_error_end(self, called: CallEnd, error: Error):
-        self.io_sink.write(self.fmt.format(UNHANDLED_ERROR_END_TPL, called=called, error=error))
+    def on_tracing_stats(self, tracing_stats: TracingStats):
+        self.io_sink.write(comment_block(TRACING_STATS_TITLE, tracing_stats.summary_lines()))
 
     def on_footer(self):
         self.io_sink.write(FOOTER_TPL)
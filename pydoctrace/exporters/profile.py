@@ -0,0 +1,243 @@
+"""
+Module dedicated to the export of the traced execution as profiling data, so that it can be explored with the
+existing profile viewers. Unlike cProfile, the profiled calls are the ones selected by the filter presets.
+
+Bibliography:
+- https://docs.python.org/3/library/profile.html#pstats.Stats: the statistics loaded by the pstats module
+- https://valgrind.org/docs/manual/cl-format.html: the callgrind format (used by KCachegrind, QCachegrind, etc.)
+
+The exporters aggregate the same events as the PlantUMLComponentExporter (calls between functions and their exits),
+adding the number of calls and the time spent in the functions and in the interactions between them.
+"""
+
+from io import TextIOBase
+from marshal import dump
+from typing import Any, Dict, List, Tuple
+
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import EVENT_CLOCK, FunctionDescriptorExporter
+
+# identifies a function like the pstats module does: (file name, first line number, function name);
+# the module name is used as the file name
+FunctionKey = Tuple[str, int, str]
+
+NANOSECONDS_IN_A_SECOND = 1_000_000_000
+
+
+class CallStats:
+    """
+    Aggregated statistics of the calls made to a function, or between a caller and a called function:
+    - calls: the total number of calls
+    - primitive_calls: the number of calls that were not induced by a recursion
+    - self_ns: the time spent in the function, excluding the time spent in its callees
+    - cumulative_ns: the time spent in the function and its callees, counted for the primitive calls only
+    - inclusive_ns: the time spent in the function and its callees, counted for all calls
+    - call_line: the line at which the first call was made (for interactions between functions)
+    """
+
+    __slots__ = ('calls', 'primitive_calls', 'self_ns', 'cumulative_ns', 'inclusive_ns', 'call_line')
+
+    def __init__(self, call_line: int = None):
+        self.calls = 0
+        self.primitive_calls = 0
+        self.self_ns = 0
+        self.cumulative_ns = 0
+        self.inclusive_ns = 0
+        self.call_line = call_line
+
+    def add_call(self, self_ns: int, inclusive_ns: int, is_primitive_call: bool):
+        self.calls += 1
+        self.self_ns += self_ns
+        self.inclusive_ns += inclusive_ns
+        if is_primitive_call:
+            self.primitive_calls += 1
+            self.cumulative_ns += inclusive_ns
+
+
+class ProfileFrame:
+    """
+    A function being executed in the calls stack, with the timing information used to compute its self time.
+    """
+
+    __slots__ = ('function_key', 'caller_key', 'call_line', 'start_ns', 'children_ns')
+
+    def __init__(self, function_key: FunctionKey, caller_key: FunctionKey, call_line: int):
+        self.function_key = function_key
+        self.caller_key = caller_key
+        self.call_line = call_line
+        self.children_ns = 0
+        self.start_ns = EVENT_CLOCK.event_ns()
+
+
+class ProfileExporter(FunctionDescriptorExporter):
+    """
+    Base class of the profile exporters: aggregates the calls statistics by function and by interaction.
+    The sub-classes write the statistics in a given format when the tracing ends.
+    """
+
+    def __init__(self, io_sink: TextIOBase):
+        super().__init__(io_sink)
+        self.stats_by_function: Dict[FunctionKey, CallStats] = {}
+        self.stats_by_interaction: Dict[Tuple[FunctionKey, FunctionKey], CallStats] = {}
+        self.frames: List[ProfileFrame] = []
+        # counts the active calls of each function to detect recursive calls
+        self.active_calls_by_function: Dict[FunctionKey, int] = {}
+
+    def push_call(self, called: FunctionDescriptor, called_line: int, call_line: int):
+        # the line of the called function is the one of its definition when the call starts
+        function_key = (called.fq_module_text, called_line, called.function_name)
+        caller_key = self.frames[-1].function_key if self.frames else None
+        self.active_calls_by_function[function_key] = self.active_calls_by_function.get(function_key, 0) + 1
+        self.frames.append(ProfileFrame(function_key, caller_key, call_line))
+
+    def pop_call(self):
+        frame = self.frames.pop()
+        inclusive_ns = EVENT_CLOCK.event_ns() - frame.start_ns
+        self_ns = inclusive_ns - frame.children_ns
+        if self.frames:
+            self.frames[-1].children_ns += inclusive_ns
+
+        # a call is primitive (not recursive) if there is no other active call of the same function
+        function_key = frame.function_key
+        active_calls = self.active_calls_by_function[function_key] - 1
+        self.active_calls_by_function[function_key] = active_calls
+        is_primitive_call = active_calls == 0
+
+        function_stats = self.stats_by_function.get(function_key)
+        if function_stats is None:
+            function_stats = self.stats_by_function[function_key] = CallStats()
+        function_stats.add_call(self_ns, inclusive_ns, is_primitive_call)
+
+        if frame.caller_key is not None:
+            interaction_key = (frame.caller_key, function_key)
+            interaction_stats = self.stats_by_interaction.get(interaction_key)
+            if interaction_stats is None:
+                interaction_stats = self.stats_by_interaction[interaction_key] = CallStats(frame.call_line)
+            interaction_stats.add_call(self_ns, inclusive_ns, is_primitive_call)
+
+    def on_header(self, start_module: str, start_func_name: str):
+        pass
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.push_call(called, called_line, None)
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.push_call(called, called_line, caller_line)
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        self.pop_call()
+
+    def on_return_at(self, **kwargs):
+        self.pop_call()
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        self.pop_call()
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        self.pop_call()
+
+    def on_footer(self):
+        raise NotImplementedError()
+
+
+class PStatsExporter(ProfileExporter):
+    """
+    Exports the profile statistics in the marshal format loadable by pstats.Stats(export_file_path),
+    thus viewable with tools like snakeviz or tuna.
+    """
+
+    binary_export = True
+
+    def build_stats(self) -> Dict[FunctionKey, Tuple[int, int, float, float, Dict[FunctionKey, Tuple]]]:
+        """
+        Builds the statistics with the structure of cProfile.Profile.stats (times are in seconds):
+        {function: (primitive calls, calls, self time, cumulative time, {caller: (calls, primitive calls, self time, cumulative time)})}
+        """
+        callers_by_function: Dict[FunctionKey, Dict[FunctionKey, Tuple]] = {
+            function_key: {} for function_key in self.stats_by_function
+        }
+        for (caller_key, called_key), interaction_stats in self.stats_by_interaction.items():
+            callers_by_function[called_key][caller_key] = (
+                interaction_stats.calls,
+                interaction_stats.primitive_calls,
+                interaction_stats.self_ns / NANOSECONDS_IN_A_SECOND,
+                interaction_stats.cumulative_ns / NANOSECONDS_IN_A_SECOND,
+            )
+
+        return {
+            function_key: (
+                function_stats.primitive_calls,
+                function_stats.calls,
+                function_stats.self_ns / NANOSECONDS_IN_A_SECOND,
+                function_stats.cumulative_ns / NANOSECONDS_IN_A_SECOND,
+                callers_by_function[function_key],
+            )
+            for function_key, function_stats in self.stats_by_function.items()
+        }
+
+    def on_footer(self):
+        dump(self.build_stats(), self.io_sink)
+
+
+CALLGRIND_HEADER = """# callgrind format
+version: 1
+creator: pydoctrace
+positions: line
+events: Nanoseconds
+"""
+
+
+class CallgrindExporter(ProfileExporter):
+    """
+    Exports the profile statistics in the callgrind format, viewable with tools like KCachegrind or QCachegrind.
+
+    The costs are expressed in nanoseconds: self costs for the functions, inclusive costs for the calls.
+    """
+
+    def __init__(self, io_sink: TextIOBase):
+        super().__init__(io_sink)
+        # callgrind name compression: the names are written once, then referred to by their id
+        self.compressed_names: Dict[str, Dict[str, int]] = {'fl': {}, 'fn': {}}
+
+    def compressed_name(self, specification: str, name: str) -> str:
+        # the called specifications share the ids of their caller counterparts: cfl with fl, cfn with fn
+        name_ids = self.compressed_names[specification[-2:]]
+        name_id = name_ids.get(name)
+        if name_id is None:
+            name_id = name_ids[name] = len(name_ids) + 1
+            return f'{specification}=({name_id}) {name}'
+
+        return f'{specification}=({name_id})'
+
+    def on_footer(self):
+        self.io_sink.write(CALLGRIND_HEADER)
+
+        calls_by_caller: Dict[FunctionKey, List[Tuple[FunctionKey, CallStats]]] = {}
+        for (caller_key, called_key), interaction_stats in self.stats_by_interaction.items():
+            calls_by_caller.setdefault(caller_key, []).append((called_key, interaction_stats))
+
+        for function_key, function_stats in self.stats_by_function.items():
+            module_name, line_index, function_name = function_key
+            self.io_sink.write(
+                f'\n{self.compressed_name("fl", module_name)}\n'
+                f'{self.compressed_name("fn", f"{module_name}.{function_name}")}\n'
+                f'{line_index} {function_stats.self_ns}\n'
+            )
+            for (called_module_name, called_line_index, called_function_name), interaction_stats in calls_by_caller.get(
+                function_key, ()
+            ):
+                self.io_sink.write(
+                    f'{self.compressed_name("cfl", called_module_name)}\n'
+                    f'{self.compressed_name("cfn", f"{called_module_name}.{called_function_name}")}\n'
+                    f'calls={interaction_stats.calls} {called_line_index}\n'
+                    f'{interaction_stats.call_line} {interaction_stats.inclusive_ns}\n'
+                )
@@ -0,0 +1,168 @@
+"""
+Module dedicated to the rendering of the values included in the exports (the values returned by the traced functions),
+so that a large value (a data frame, a long list, a bytes blob) does not dominate the tracing time and the export size.
+
+The values are rendered according to a ValueRenderingPolicy:
+- the texts are truncated to a maximum length
+- the containers (including their sub-classes) are rendered with the limits of reprlib
+  (https://docs.python.org/3/library/reprlib.html), which do not iterate over all their items
+- the other values are rendered with their repr() truncated by reprlib; their str() conversion is not used because
+  it can build a text of any size (a data frame, for example)
+- the rendering can be customized per type, or limited to the type names
+- the errors raised while rendering a value are caught, the value being rendered by its type name
+"""
+
+from reprlib import Repr
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Type, TypeVar
+
+# the text appended to the truncated values
+TRUNCATION_MARKER = '...'
+
+ExporterClass = TypeVar('ExporterClass', bound=Type)
+
+
+class ValueRenderingPolicy(NamedTuple):
+    """
+    Defines how the values are rendered in the exports:
+    - max_length: the maximum length of a rendered value, including the truncation marker
+    - max_items: the maximum number of items rendered for each container (list, tuple, dict, set, deque, etc.)
+    - max_level: the maximum nesting level of the containers being rendered
+    - repr_limits: limits specific to some container types, named after the attributes of reprlib.Repr
+      (like {'maxdict': 2, 'maxlist': 10}); they override max_items
+    - type_name_only: if True, the values are rendered by their type name only, without inspecting them
+    - renderers: rendering functions by type, matched along the class hierarchy of the values
+      (like {DataFrame: lambda data_frame: f'DataFrame{data_frame.shape}'})
+    """
+
+    max_length: int = 200
+    max_items: int = 6
+    max_level: int = 2
+    repr_limits: Mapping[str, int] = None
+    type_name_only: bool = False
+    renderers: Mapping[Type, Callable[[Any], str]] = None
+
+
+class BoundedRepr(Repr):
+    """
+    A reprlib.Repr which also bounds the rendering of bytes and bytearrays, without representing them entirely.
+    """
+
+    def repr_bytes(self, value: bytes, level: int) -> str:
+        if len(value) <= self.maxstring:
+            return repr(value)
+
+        return f'{value[: self.maxstring]!r}{TRUNCATION_MARKER}'
+
+    def repr_bytearray(self, value: bytearray, level: int) -> str:
+        return f'bytearray({self.repr_bytes(bytes(value[: self.maxstring + 1]), level)})'
+
+
+def type_name(value: Any) -> str:
+    return type(value).__qualname__
+
+
+def truncate(text: str, max_length: int) -> str:
+    """
+    Truncates the text to the given maximum length, including the truncation marker.
+    """
+    if len(text) <= max_length:
+        return text
+
+    return text[: max(max_length - len(TRUNCATION_MARKER), 0)] + TRUNCATION_MARKER
+
+
+class ValueRenderer:
+    """
+    Renders the values as texts according to the given policy.
+    """
+
+    def __init__(self, policy: ValueRenderingPolicy):
+        self.policy = policy
+        self.value_repr = BoundedRepr()
+        for repr_limit in ('maxtuple', 'maxlist', 'maxarray', 'maxdict', 'maxset', 'maxfrozenset', 'maxdeque'):
+            setattr(self.value_repr, repr_limit, policy.max_items)
+        self.value_repr.maxlevel = policy.max_level
+        self.value_repr.maxstring = policy.max_length
+        self.value_repr.maxother = policy.max_length
+        for repr_limit, limit_value in (policy.repr_limits or {}).items():
+            setattr(self.value_repr, repr_limit, limit_value)
+
+        # caches the renderer of each rendered type (None if the type has no specific renderer)
+        self.renderers_by_type: Dict[Type, Callable[[Any], str]] = {}
+        # caches the bounded rendering of each rendered type
+        self.bounded_reprs_by_type: Dict[Type, Callable[[Any], str]] = {}
+
+    def renderer_for(self, value_type: Type) -> Callable[[Any], str]:
+        if value_type in self.renderers_by_type:
+            return self.renderers_by_type[value_type]
+
+        renderers = self.policy.renderers or {}
+        renderer = next(
+            (renderers[parent_type] for parent_type in value_type.__mro__ if parent_type in renderers),
+            None,
+        )
+        self.renderers_by_type[value_type] = renderer
+
+        return renderer
+
+    def bounded_repr_for(self, value_type: Type) -> Callable[[Any], str]:
+        """
+        Retrieves the bounded rendering of the given type: the reprlib method of the type or of its closest parent type
+        supported by reprlib (so that the sub-classes of the containers are rendered with bounds),
+        the reprlib rendering of the other objects otherwise.
+        """
+        bounded_repr = self.bounded_reprs_by_type.get(value_type)
+        if bounded_repr is None:
+            value_repr = self.value_repr
+            repr_method = next(
+                (
+                    getattr(value_repr, f'repr_{parent_type.__name__}')
+                    for parent_type in value_type.__mro__
+                    if hasattr(value_repr, f'repr_{parent_type.__name__}')
+                ),
+                None,
+            )
+            if repr_method is None:
+                bounded_repr = value_repr.repr
+            else:
+
+                def bounded_repr(value: Any) -> str:
+                    return repr_method(value, value_repr.maxlevel)
+
+            self.bounded_reprs_by_type[value_type] = bounded_repr
+
+        return bounded_repr
+
+    def render(self, value: Any) -> str:
+        """
+        Renders the value as a text: the strings are rendered as is (truncated),
+        the other values with the reprlib limits.
+        """
+        if self.policy.type_name_only:
+            return type_name(value)
+
+        try:
+            renderer = self.renderer_for(type(value))
+            if renderer is not None:
+                text = renderer(value)
+            elif isinstance(value, str):
+                text = value
+            else:
+                text = self.bounded_repr_for(type(value))(value)
+        except Exception as error:
+            text = f'<{type_name(value)} not rendered: {type_name(error)}>'
+
+        return truncate(text, self.policy.max_length)
+
+
+DEFAULT_VALUE_RENDERER = ValueRenderer(ValueRenderingPolicy())
+
+
+def with_value_rendering(exporter_class: ExporterClass, policy: ValueRenderingPolicy) -> ExporterClass:
+    """
+    Creates a sub-class of the given exporter class rendering the values according to the given policy;
+    it can be used wherever an exporter class is expected:
+
+    @trace_to_sequence_puml(exporter_class=with_value_rendering(PlantUMLSequenceExporter, ValueRenderingPolicy(max_length=50)))
+    """
+    return type(exporter_class.__name__, (exporter_class,), {'value_renderer': ValueRenderer(policy)})
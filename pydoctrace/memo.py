@@ -0,0 +1,41 @@
+"""
+Module dedicated to the memoization of the exports, to avoid tracing again the calls made with the same arguments
+as a call which was already exported (in parametrized tests or deterministic pipelines, for example).
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable
+
+
+class ExportedKeysMemo:
+    """
+    Thread-safe and bounded set of the keys of the exported calls (the key of a call is computed from its arguments):
+    the least recently used keys are discarded when the maximum size is reached.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError('the memo must hold at least one key')
+
+        self.max_size = max_size
+        self.keys: Dict[Hashable, None] = OrderedDict()
+        self.lock = Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self.lock:
+            if key in self.keys:
+                self.keys.move_to_end(key)
+                return True
+
+            return False
+
+    def add(self, key: Hashable):
+        with self.lock:
+            self.keys[key] = None
+            self.keys.move_to_end(key)
+            if len(self.keys) > self.max_size:
+                self.keys.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -0,0 +1,200 @@
+"""
+Module dedicated to the replay of recorded traces (exported by the JSONLinesExporter) into other exporters,
+to produce other formats or other filtered views of a traced execution without running the code again.
+
+The recorded events are processed in a streaming fashion: the memory usage only depends on the number of functions
+and on the depth of the calls stack, not on the size of the recording.
+"""
+
+import gzip
+from contextlib import contextmanager
+from json import loads
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Sequence, TextIO
+
+from pydoctrace.callfilter import CallFilter, Preset
+from pydoctrace.doctrace import named_context_factory, tracing_context_factory
+from pydoctrace.domain.execution import CallEnd, Error
+from pydoctrace.exporters import EVENT_CLOCK, Exporter, ExportTarget
+
+# the recorded event which is not a tracing event but declares a function referred to by the following events
+FUNCTION_EVENT = 'function'
+
+
+class ReplayedCall(NamedTuple):
+    """
+    A call of the recorded calls stack, which is kept in the replay if it passes the call filter.
+    """
+
+    called: CallEnd
+    kept: bool
+
+
+@contextmanager
+def open_recording(recording_path: str) -> Iterator[TextIO]:
+    """
+    Opens a recording in text mode, decompressing it on the fly if its name ends with '.gz'.
+    """
+    if recording_path.endswith('.gz'):
+        with gzip.open(recording_path, 'rt', encoding='utf8') as recording_file:
+            yield recording_file
+    else:
+        with open(recording_path, encoding='utf8') as recording_file:
+            yield recording_file
+
+
+def recording_name(recording_path: str) -> str:
+    """
+    The name of a recording: its file name without the '.jsonl' and '.gz' extensions.
+    """
+    name = Path(recording_path).name
+    for extension in ('.gz', '.jsonl'):
+        if name.endswith(extension):
+            name = name[: -len(extension)]
+
+    return name
+
+
+def recording_export_targets(recording_path: str, export_targets: Sequence[ExportTarget]) -> List[ExportTarget]:
+    """
+    Hydrates the ${recording_name} placeholder of the templates of the export file paths with the recording name.
+    """
+    name = recording_name(recording_path)
+    return [
+        ExportTarget(exporter_class, Template(export_file_path_tpl).safe_substitute(recording_name=name))
+        for exporter_class, export_file_path_tpl in export_targets
+    ]
+
+
+def read_recorded_events(recording_lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    for recording_line in recording_lines:
+        if recording_line.strip():
+            yield loads(recording_line)
+
+
+class RecordedTraceReplayer:
+    """
+    Replays the recorded events into an exporter, applying the call filter after the fact.
+
+    The filtering mirrors the one of the ExecutionTracer: the depth of a call is the number of kept calls in the stack,
+    and the caller of a kept call is its closest kept ancestor (with the line of the call, as it was recorded).
+
+    The time at which each event was recorded is restored in the EVENT_CLOCK while the event is replayed, so that
+    the time-based exporters export the durations of the recorded execution, not the ones of the replay
+    (the recordings made before the events were timed are replayed with the current time).
+    """
+
+    def __init__(self, exporter: Exporter, call_filter: CallFilter):
+        self.exporter = exporter
+        self.call_filter = call_filter
+        self.functions_by_id: Dict[int, CallEnd] = {}
+        self.calls_stack: List[ReplayedCall] = []
+        self.kept_calls_stack: List[CallEnd] = []
+
+    def called_end(self, function_id: int, line_index: int) -> CallEnd:
+        return self.functions_by_id[function_id]._replace(line_index=line_index)
+
+    def push_call(self, called: CallEnd, caller_line: int = None):
+        kept = self.call_filter.should_trace_call(
+            called.fq_module_tuple, called.function_name, len(self.kept_calls_stack)
+        )
+        if kept:
+            if len(self.kept_calls_stack) == 0:
+                self.exporter.on_tracing_start(called)
+            else:
+                self.exporter.on_start_call(self.kept_calls_stack[-1]._replace(line_index=caller_line), called)
+            self.kept_calls_stack.append(called)
+
+        self.calls_stack.append(ReplayedCall(called, kept))
+
+    def pop_call(self) -> bool:
+        """
+        Removes the last call from the stacks, tells whether it was kept.
+        """
+        _, kept = self.calls_stack.pop()
+        if kept:
+            self.kept_calls_stack.pop()
+
+        return kept
+
+    def replay(self, events: Iterable[Dict[str, Any]]):
+        """
+        Replays the tracing events, the header and footer events are ignored
+        (the exports are initialized and finalized by the tracing context).
+        """
+        try:
+            self.replay_timed_events(events)
+        finally:
+            EVENT_CLOCK.replayed_event_ns = None
+
+    def replay_timed_events(self, events: Iterable[Dict[str, Any]]):
+        for event in events:
+            event_type = event['event']
+            EVENT_CLOCK.replayed_event_ns = event.get('ts')
+            if event_type == FUNCTION_EVENT:
+                module = event['module']
+                self.functions_by_id[event['id']] = CallEnd(module, tuple(module.split('.')), event['name'], None)
+
+            elif event_type == 'start':
+                self.push_call(self.called_end(event['called'], event['called_line']))
+
+            elif event_type == 'call':
+                self.push_call(self.called_end(event['called'], event['called_line']), event['caller_line'])
+
+            elif event_type in ('return', 'end'):
+                if self.pop_call():
+                    self.on_return_or_exit(
+                        self.called_end(event['called'], event['called_line']),
+                        event.get('caller_line'),
+                        event['value'],
+                    )
+
+            elif event_type == 'error':
+                if self.pop_call():
+                    error_called = self.called_end(event['called'], event['called_line'])
+                    error = Error(event['class'], event['message'])
+                    # the error leaves the kept calls: it is not handled in the filtered view
+                    if len(self.kept_calls_stack) == 0:
+                        self.exporter.on_unhandled_error_end(error_called, error)
+                    else:
+                        error_caller = self.kept_calls_stack[-1]._replace(line_index=event['caller_line'])
+                        self.exporter.on_error_propagation(error_called, error_caller, error)
+
+            elif event_type == 'unhandled_error':
+                if self.pop_call():
+                    self.exporter.on_unhandled_error_end(
+                        self.called_end(event['called'], event['called_line']),
+                        Error(event['class'], event['message']),
+                    )
+
+    def on_return_or_exit(self, called: CallEnd, caller_line: int, value: Any):
+        if len(self.kept_calls_stack) == 0:
+            self.exporter.on_tracing_end(called, value)
+        else:
+            caller = self.kept_calls_stack[-1]
+            # the recordings made before the caller line was recorded with the returns keep the line of the call start
+            if caller_line is not None:
+                caller = caller._replace(line_index=caller_line)
+            self.exporter.on_return(called=called, caller=caller, arg=value)
+
+
+def export_recording(recording_path: str, export_targets: Sequence[ExportTarget], filter_presets: Iterable[Preset]):
+    """
+    Exports a recorded trace with the given exporters. The templates of the export file paths are hydrated
+    with the recording name and with the module and function names of the recorded header.
+    """
+    with open_recording(recording_path) as recording_file:
+        events = read_recorded_events(recording_file)
+        header = next(events, None)
+        if header is None or header['event'] != 'header':
+            raise ValueError(f'{recording_path} is not a recorded trace: it must start with a header event')
+
+        contexts = [
+            named_context_factory(
+                header['module'], header['function'], exporter_class, export_file_path_tpl, filter_presets
+            )
+            for exporter_class, export_file_path_tpl in recording_export_targets(recording_path, export_targets)
+        ]
+        with tracing_context_factory(*contexts) as execution_tracer:
+            RecordedTraceReplayer(execution_tracer.exporter, execution_tracer.call_filter).replay(events)
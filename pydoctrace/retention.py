@@ -0,0 +1,87 @@
+"""
+Module dedicated to the retention of the export files, when their path template creates a new file
+at each execution (with the '${datetime_millis}' placeholder, for example).
+
+The retention policy is enforced with an in-process index of the written files (no directory listing):
+the files written by previous processes are not known, thus not removed.
+"""
+
+from contextlib import suppress
+from os import remove, stat
+from threading import Lock
+from time import time
+from typing import Dict, NamedTuple
+
+
+class RetentionPolicy(NamedTuple):
+    """
+    Limits applied to the files exported for a file path template, the oldest files being removed first:
+    - max_files: the maximum number of files kept
+    - max_total_bytes: the maximum size of all the kept files
+    - max_age_seconds: the maximum age of a kept file, when a new one is written
+
+    A None limit is not enforced.
+    """
+
+    max_files: int = None
+    max_total_bytes: int = None
+    max_age_seconds: float = None
+
+
+class ExportedFile(NamedTuple):
+    path: str
+    size_in_bytes: int
+    written_at: float
+
+
+class ExportedFilesIndex:
+    """
+    Thread-safe index of the files exported for a file path template, removing the files exceeding
+    the retention policy each time a new file is added.
+    """
+
+    def __init__(self, retention_policy: RetentionPolicy):
+        self.retention_policy = retention_policy
+        # the files indexed by path, from the oldest to the most recent one (dictionaries preserve insertion order)
+        self.exported_files: Dict[str, ExportedFile] = {}
+        self.total_bytes = 0
+        self.lock = Lock()
+
+    def add_exported_file(self, export_file_path: str):
+        # the file may have been removed by someone else since it was written: there is nothing to index
+        try:
+            exported_file = ExportedFile(export_file_path, stat(export_file_path).st_size, time())
+        except FileNotFoundError:
+            return
+
+        with self.lock:
+            # the file was overwritten (the path template has no dynamic part): replaces its previous entry
+            previous_file = self.exported_files.pop(export_file_path, None)
+            if previous_file is not None:
+                self.total_bytes -= previous_file.size_in_bytes
+
+            self.exported_files[export_file_path] = exported_file
+            self.total_bytes += exported_file.size_in_bytes
+
+            # the file which has just been written is always kept
+            while len(self.exported_files) > 1 and self.exceeds_retention_policy(exported_file.written_at):
+                self.remove_oldest_file()
+
+    def exceeds_retention_policy(self, now: float) -> bool:
+        max_files, max_total_bytes, max_age_seconds = self.retention_policy
+
+        return (
+            (max_files is not None and len(self.exported_files) > max_files)
+            or (max_total_bytes is not None and self.total_bytes > max_total_bytes)
+            or (max_age_seconds is not None and now - self.oldest_file().written_at > max_age_seconds)
+        )
+
+    def oldest_file(self) -> ExportedFile:
+        return next(iter(self.exported_files.values()))
+
+    def remove_oldest_file(self):
+        oldest_file = self.exported_files.pop(self.oldest_file().path)
+        self.total_bytes -= oldest_file.size_in_bytes
+        # the file may have been removed by someone else in the meantime
+        with suppress(FileNotFoundError):
+            remove(oldest_file.path)
@@ -0,0 +1,81 @@
+"""
+Module dedicated to the export settings selected by name (from the command line, for example):
+the exporters, the filtering presets and the output directory.
+"""
+
+from pathlib import Path
+from string import Template
+from typing import List, NamedTuple, Sequence
+
+from pydoctrace.callfilter import Preset
+from pydoctrace.callfilter.presets import EXCLUDE_CALL_DEPTH_PRESET_FACTORY, PRESETS_BY_NAME
+from pydoctrace.doctrace import DEFAULT_FILTERS
+from pydoctrace.exporters import ExportTarget
+from pydoctrace.exporters.chrometrace import ChromeTraceExporter
+from pydoctrace.exporters.foldedstacks import FoldedStacksExporter, FoldedStacksTimeExporter
+from pydoctrace.exporters.graphviz.component import GraphvizComponentExporter
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.exporters.plantuml.component import PlantUMLComponentExporter
+from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+from pydoctrace.exporters.profile import CallgrindExporter, PStatsExporter
+
+# the exporters by name, with the default templates of their export file paths
+EXPORT_TARGETS_BY_NAME = {
+    'sequence': ExportTarget(PlantUMLSequenceExporter, '${function_name}-sequence.puml'),
+    'component': ExportTarget(PlantUMLComponentExporter, '${function_name}-component.puml'),
+    'jsonl': ExportTarget(JSONLinesExporter, '${function_name}.jsonl'),
+    'chrome': ExportTarget(ChromeTraceExporter, '${function_name}.trace.json'),
+    'folded': ExportTarget(FoldedStacksExporter, '${function_name}.folded'),
+    'folded-time': ExportTarget(FoldedStacksTimeExporter, '${function_name}-time.folded'),
+    'pstats': ExportTarget(PStatsExporter, '${function_name}.pstats'),
+    'callgrind': ExportTarget(CallgrindExporter, 'callgrind.out.${function_name}'),
+    'dot': ExportTarget(GraphvizComponentExporter, '${function_name}-component.dot'),
+}
+
+
+class ExportSettings(NamedTuple):
+    """
+    The export settings, selected by name (it has the same attributes as the parsed command-line arguments):
+    - exporter_names: the names of the exporters (a sequence diagram if None or empty)
+    - preset_names: the names of the filtering presets (the default filters if None)
+    - max_depth: the maximum depth of the traced calls (no limit if None)
+    - output_dir: the directory of the exported files
+    """
+
+    exporter_names: Sequence[str] = None
+    preset_names: Sequence[str] = None
+    max_depth: int = None
+    output_dir: str = '.'
+
+
+def export_targets_from_settings(settings: ExportSettings) -> List[ExportTarget]:
+    exporter_names = settings.exporter_names or ['sequence']
+    return [
+        ExportTarget(exporter_class, str(Path(settings.output_dir) / export_file_path_tpl))
+        for exporter_class, export_file_path_tpl in (
+            EXPORT_TARGETS_BY_NAME[exporter_name] for exporter_name in dict.fromkeys(exporter_names)
+        )
+    ]
+
+
+def recording_export_targets_from_settings(settings: ExportSettings) -> List[ExportTarget]:
+    """
+    The export targets of recorded traces: the exported files are named after the recordings instead of the recorded
+    functions (${recording_name} placeholder), so that several recordings of a function are exported in distinct files.
+    """
+    return [
+        ExportTarget(exporter_class, Template(export_file_path_tpl).safe_substitute(function_name='${recording_name}'))
+        for exporter_class, export_file_path_tpl in export_targets_from_settings(settings)
+    ]
+
+
+def filter_presets_from_settings(settings: ExportSettings) -> Sequence[Preset]:
+    filter_presets = (
+        DEFAULT_FILTERS
+        if settings.preset_names is None
+        else tuple(PRESETS_BY_NAME[preset_name] for preset_name in settings.preset_names)
+    )
+    if settings.max_depth is not None:
+        filter_presets = (*filter_presets, EXCLUDE_CALL_DEPTH_PRESET_FACTORY(settings.max_depth))
+
+    return filter_presets
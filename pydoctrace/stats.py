@@ -0,0 +1,207 @@
+"""
+Module dedicated to the self-instrumentation of the tracing, to tell whether a slow traced execution is slow because
+of the call filter, of the exporter or of the sheer volume of tracing events.
+
+The instrumentation is opt-in (see the stats parameter of ExecutionTracer): the call filter and the exporter
+are wrapped by proxies measuring the time spent in them, the tracing functions are wrapped by the tracer itself.
+"""
+
+from time import perf_counter_ns
+from typing import Any, Dict, List, Tuple
+
+from pydoctrace.arguments import CapturedArguments
+from pydoctrace.callfilter import CallFilter
+from pydoctrace.callfilter.presets import PRESETS_BY_NAME, Preset
+from pydoctrace.domain.execution import Error, FunctionDescriptor
+from pydoctrace.exporters import Exporter, FunctionDescriptorExporter
+
+NANOSECONDS_IN_A_MILLISECOND = 1_000_000
+
+# names the well-known presets in the statistics, the other ones are named after their rank in the call filter
+PRESET_NAMES = {preset: preset_name for preset_name, preset in PRESETS_BY_NAME.items()}
+
+# the name under which are counted the calls filtered out by a call filter which does not involve presets
+CALL_FILTER_NAME = 'call filter'
+
+
+class TracingStats:
+    """
+    The statistics of a traced execution:
+    - events_by_kind: the number of events received by the tracing functions, by kind ('call', 'return', 'exception'),
+      including the ones of the calls filtered out
+    - filtered_calls_by_preset: the number of calls filtered out, by name of the preset which excluded them
+    - exporter_events_by_hook: the number of events pushed to the exporter, by name of the exporter hook
+    - tracing_ns: the time spent in the tracing functions, including the time spent in the filter and in the exporter
+    - filter_ns: the time spent in the call filter
+    - exporter_ns: the time spent in the exporter hooks
+    - peak_depth: the maximum depth of the stack of traced calls
+    """
+
+    __slots__ = (
+        'events_by_kind',
+        'filtered_calls_by_preset',
+        'exporter_events_by_hook',
+        'tracing_ns',
+        'filter_ns',
+        'exporter_ns',
+        'peak_depth',
+    )
+
+    def __init__(self):
+        self.events_by_kind: Dict[str, int] = {}
+        self.filtered_calls_by_preset: Dict[str, int] = {}
+        self.exporter_events_by_hook: Dict[str, int] = {}
+        self.tracing_ns = 0
+        self.filter_ns = 0
+        self.exporter_ns = 0
+        self.peak_depth = 0
+
+    @property
+    def tracer_ns(self) -> int:
+        """
+        The time spent in the logic of the tracer, excluding the time spent in the filter and in the exporter.
+        """
+        return self.tracing_ns - self.filter_ns - self.exporter_ns
+
+    def summary_lines(self) -> List[str]:
+        def counts_text(counts: Dict[str, int]) -> str:
+            return ', '.join(f'{name}={count}' for name, count in counts.items()) or 'none'
+
+        return [
+            f'events: {counts_text(self.events_by_kind)}',
+            f'filtered calls: {counts_text(self.filtered_calls_by_preset)}',
+            f'exporter events: {counts_text(self.exporter_events_by_hook)}',
+            f'time: tracer={self.tracer_ns / NANOSECONDS_IN_A_MILLISECOND:.3f}ms, '
+            f'filter={self.filter_ns / NANOSECONDS_IN_A_MILLISECOND:.3f}ms, '
+            f'exporter={self.exporter_ns / NANOSECONDS_IN_A_MILLISECOND:.3f}ms',
+            f'peak depth: {self.peak_depth}',
+        ]
+
+
+class InstrumentedCallFilter(CallFilter):
+    """
+    Delegates the filtering to the given call filter, measuring the time spent in it and counting the calls
+    filtered out by each preset.
+
+    The presets which excluded the filtered calls are looked up by count_filtered_calls, that the tracer calls
+    once the time spent in its tracing function is measured: the lookup is not counted in the tracing time.
+    """
+
+    def __init__(self, call_filter: CallFilter, stats: TracingStats):
+        super().__init__(call_filter.presets)
+        self.call_filter = call_filter
+        self.stats = stats
+        self.preset_names: Tuple[Tuple[Preset, str], ...] = tuple(
+            (preset, PRESET_NAMES.get(preset, f'preset {preset_rank}'))
+            for preset_rank, preset in enumerate(self.presets, 1)
+        )
+        # the calls filtered out whose excluding preset remains to be looked up
+        self.filtered_calls: List[Tuple[Tuple[str], str, int]] = []
+
+    def excluding_preset_name(self, module_parts: Tuple[str], function_name: str, call_depth: int) -> str:
+        for preset, preset_name in self.preset_names:
+            if preset.exclude_call(module_parts, function_name, call_depth) and (
+                preset.include_call is None or not preset.include_call(module_parts, function_name, call_depth)
+            ):
+                return preset_name
+
+        return CALL_FILTER_NAME
+
+    def should_trace_call(self, module_parts: Tuple[str], function_name: str, call_depth: int) -> bool:
+        start_ns = perf_counter_ns()
+        should_trace = self.call_filter.should_trace_call(module_parts, function_name, call_depth)
+        self.stats.filter_ns += perf_counter_ns() - start_ns
+
+        if not should_trace:
+            self.filtered_calls.append((module_parts, function_name, call_depth))
+
+        return should_trace
+
+    def count_filtered_calls(self):
+        """
+        Counts the calls filtered out since the previous count by the preset which excluded them.
+        """
+        if self.filtered_calls:
+            filtered_calls_by_preset = self.stats.filtered_calls_by_preset
+            for module_parts, function_name, call_depth in self.filtered_calls:
+                preset_name = self.excluding_preset_name(module_parts, function_name, call_depth)
+                filtered_calls_by_preset[preset_name] = filtered_calls_by_preset.get(preset_name, 0) + 1
+            self.filtered_calls.clear()
+
+
+class InstrumentedExporter(FunctionDescriptorExporter):
+    """
+    Forwards each tracing event to the given exporter, measuring the time spent in its hooks and counting the events.
+
+    It has no sink of its own: the exporter writes in its own sink.
+    """
+
+    def __init__(self, exporter: Exporter, stats: TracingStats):
+        super().__init__(None)
+        self.exporter = exporter
+        self.stats = stats
+
+    def count_event(self, hook_name: str, start_ns: int):
+        self.stats.exporter_ns += perf_counter_ns() - start_ns
+        exporter_events_by_hook = self.stats.exporter_events_by_hook
+        exporter_events_by_hook[hook_name] = exporter_events_by_hook.get(hook_name, 0) + 1
+
+    def on_header(self, start_module: str, start_func_name: str):
+        self.exporter.on_header(start_module, start_func_name)
+
+    def on_raw_content(self, raw_content: str):
+        self.exporter.on_raw_content(raw_content)
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        start_ns = perf_counter_ns()
+        self.exporter.on_tracing_start_at(called, called_line)
+        self.count_event('on_tracing_start', start_ns)
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        start_ns = perf_counter_ns()
+        self.exporter.on_start_call_at(caller, caller_line, called, called_line)
+        self.count_event('on_start_call', start_ns)
+
+    def on_call_arguments_at(self, called: FunctionDescriptor, called_line: int, arguments: CapturedArguments):
+        start_ns = perf_counter_ns()
+        self.exporter.on_call_arguments_at(called, called_line, arguments)
+        self.count_event('on_call_arguments', start_ns)
+
+    def on_error_propagation_at(
+        self,
+        error_called: FunctionDescriptor,
+        error_called_line: int,
+        error_caller: FunctionDescriptor,
+        error_caller_line: int,
+        error: Error,
+    ):
+        start_ns = perf_counter_ns()
+        self.exporter.on_error_propagation_at(error_called, error_called_line, error_caller, error_caller_line, error)
+        self.count_event('on_error_propagation', start_ns)
+
+    def on_return_at(
+        self, *, called: FunctionDescriptor, called_line: int, caller: FunctionDescriptor, caller_line: int, arg: Any
+    ):
+        start_ns = perf_counter_ns()
+        self.exporter.on_return_at(
+            called=called, called_line=called_line, caller=caller, caller_line=caller_line, arg=arg
+        )
+        self.count_event('on_return', start_ns)
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        start_ns = perf_counter_ns()
+        self.exporter.on_tracing_end_at(called, called_line, arg)
+        self.count_event('on_tracing_end', start_ns)
+
+    def on_unhandled_error_end_at(self, called: FunctionDescriptor, called_line: int, error: Error):
+        start_ns = perf_counter_ns()
+        self.exporter.on_unhandled_error_end_at(called, called_line, error)
+        self.count_event('on_unhandled_error_end', start_ns)
+
+    def on_tracing_stats(self, tracing_stats: TracingStats):
+        self.exporter.on_tracing_stats(tracing_stats)
+
+    def on_footer(self):
+        self.exporter.on_footer()
@@ -0,0 +1,155 @@
+"""
+Module dedicated to the global switch of the tracing, which allows to keep the tracing decorators in production code.
+
+The initial mode of the switch is read from the PYDOCTRACE_TRACING environment variable when pydoctrace is imported:
+- 'on' (default): the decorated functions are traced
+- 'paused': the decorated functions are not traced until enable_tracing() is called;
+  the decorators wrap the functions with a wrapper costing a single flag check when the tracing is disabled
+- 'off': the decorators return the functions unchanged, the tracing cannot be enabled at runtime
+
+An unsupported value of the environment variable emits a warning and the default mode is used,
+so that a typo does not crash the application importing pydoctrace.
+
+In 'paused' mode, the tracing can be armed for the next invocations of the decorated functions only,
+on demand or when the process receives a signal (see install_signal_trigger); the state in force before the arming
+is restored once the armed invocations are consumed (the tracing thus stays enabled if it was).
+"""
+
+from os import environ
+from signal import signal
+from threading import Lock
+from typing import Any, Callable, Mapping
+from warnings import warn
+
+TRACING_ENV_VAR = 'PYDOCTRACE_TRACING'
+
+TRACING_MODES = ('on', 'paused', 'off')
+
+DEFAULT_TRACING_MODE = 'on'
+
+
+class TracingSwitch:
+    """
+    Holds the state of the global switch:
+    - decorates: whether the decorators wrap the functions to trace (False in 'off' mode)
+    - enabled: whether the wrapped functions are traced when they are called
+    - remaining_invocations: the number of invocations to trace before restoring the state in force before the arming
+      (None for no limit)
+    - enabled_after_invocations: whether the tracing is enabled once the armed invocations are consumed
+    """
+
+    __slots__ = ('decorates', 'enabled', 'remaining_invocations', 'enabled_after_invocations', 'lock')
+
+    def __init__(self, tracing_mode: str):
+        if tracing_mode not in TRACING_MODES:
+            raise ValueError(
+                f'unsupported tracing mode {tracing_mode!r} in the {TRACING_ENV_VAR} environment variable, '
+                f'expected one of {", ".join(TRACING_MODES)}'
+            )
+
+        self.decorates = tracing_mode != 'off'
+        self.enabled = tracing_mode == 'on'
+        self.remaining_invocations: int = None
+        self.enabled_after_invocations = self.enabled
+        self.lock = Lock()
+
+    def consume_invocation(self) -> bool:
+        """
+        Called when a decorated function is invoked while the tracing is enabled,
+        tells whether the invocation must be traced (it is not when the armed invocations were consumed concurrently).
+        """
+        if self.remaining_invocations is None:
+            return True
+
+        with self.lock:
+            if not self.enabled:
+                return False
+            self.remaining_invocations -= 1
+            if self.remaining_invocations <= 0:
+                self.enabled = self.enabled_after_invocations
+                self.remaining_invocations = None
+
+            return True
+
+    def arm(self, invocations: int):
+        """
+        Enables the tracing for the given number of invocations; the caller is responsible for the synchronization.
+        Re-arming before the armed invocations are consumed keeps the state saved by the first arming.
+        """
+        if self.remaining_invocations is None:
+            self.enabled_after_invocations = self.enabled
+        self.remaining_invocations = invocations
+        self.enabled = True
+
+    @classmethod
+    def from_environment(cls, environment: Mapping[str, str]) -> 'TracingSwitch':
+        """
+        Creates the switch in the mode set by the environment variable, in the default mode if the value is unsupported.
+        """
+        tracing_mode = environment.get(TRACING_ENV_VAR, DEFAULT_TRACING_MODE).strip().lower()
+        if tracing_mode not in TRACING_MODES:
+            warn(
+                f'unsupported tracing mode {tracing_mode!r} in the {TRACING_ENV_VAR} environment variable, '
+                f'expected one of {", ".join(TRACING_MODES)}: {DEFAULT_TRACING_MODE!r} is used instead',
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            tracing_mode = DEFAULT_TRACING_MODE
+
+        return cls(tracing_mode)
+
+
+TRACING_SWITCH = TracingSwitch.from_environment(environ)
+
+
+def enable_tracing():
+    """
+    Enables the tracing of the decorated functions and code blocks
+    (has no effect on the functions decorated in 'off' mode, which were left unchanged).
+    """
+    with TRACING_SWITCH.lock:
+        TRACING_SWITCH.remaining_invocations = None
+        TRACING_SWITCH.enabled = True
+
+
+def disable_tracing():
+    """
+    Disables the tracing: the decorated functions and code blocks are executed without being traced.
+    """
+    with TRACING_SWITCH.lock:
+        TRACING_SWITCH.enabled = False
+        TRACING_SWITCH.remaining_invocations = None
+
+
+def is_tracing_enabled() -> bool:
+    return TRACING_SWITCH.enabled
+
+
+def arm_tracing(invocations: int = 1):
+    """
+    Enables the tracing for the given number of invocations of the decorated functions and code blocks,
+    then restores the state in force before: the tracing is disabled again if it was disabled, it stays enabled otherwise
+    (has no effect on the functions decorated in 'off' mode, which were left unchanged).
+    """
+    if invocations < 1:
+        raise ValueError('at least one invocation must be armed')
+
+    with TRACING_SWITCH.lock:
+        TRACING_SWITCH.arm(invocations)
+
+
+def install_signal_trigger(signal_number: int, invocations: int = 1) -> Callable[[int, Any], Any]:
+    """
+    Arms the tracing of the next invocations of the decorated functions each time the process receives the given signal
+    (signal.SIGUSR1 for example: 'kill -USR1 <pid>'), to capture diagrams from a running process without restarting it.
+
+    Must be called from the main thread; returns the previous handler of the signal.
+    """
+    if invocations < 1:
+        raise ValueError('at least one invocation must be armed')
+
+    def arm_tracing_on_signal(signal_number: int, frame):
+        # the lock is not used in the signal handler: it could be held by the interrupted code
+        TRACING_SWITCH.arm(invocations)
+
+    return signal(signal_number, arm_tracing_on_signal)
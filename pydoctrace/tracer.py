@@ -12,23 +12,37 @@ The tracing is based on the sys.settrace hook system, which takes:
 
 from collections import deque
 from pathlib import Path
+from reprlib import Repr
 from sys import gettrace, settrace
-from typing import Any, Callable, List, NamedTuple
+from time import perf_counter_ns
+from types import CodeType
+from typing import Any, Callable, Dict, List, NamedTuple
 
+from pydoctrace.arguments import ArgumentsCapture
 from pydoctrace.callfilter import CallFilter
-from pydoctrace.domain.execution import CallEnd, Error
+from pydoctrace.domain.execution import Error, FunctionDescriptor
 from pydoctrace.exporters import Exporter
+from pydoctrace.stats import InstrumentedCallFilter, InstrumentedExporter, TracingStats
+
+# bounds the size of the error messages: the messages are shown in the diagrams, an exception can hold a large value
+MAX_ERROR_MESSAGE_LENGTH = 200
+ERROR_MESSAGE_REPR = Repr()
+ERROR_MESSAGE_REPR.maxstring = MAX_ERROR_MESSAGE_LENGTH
+ERROR_MESSAGE_REPR.maxother = MAX_ERROR_MESSAGE_LENGTH
+ERROR_MESSAGE_TRUNCATION = '...'
 
 
 class TracedError(NamedTuple):
     """
     An error being traced by the tracer, holding metadata:
-    - error: Error: information for display purposes in the diagram
-    - line_index: int: the line at which the error entered the execution frame
     - exception: BaseException: the corresponding Python exception being traced
+    - line_index: int: the line at which the error entered the execution frame
+
+    The Error shown in the diagram is created from the exception only if the error propagates to a traced caller,
+    not when it is handled in the frame (exceptions used for control flow, like StopIteration or KeyError).
     """
 
-    error: Error
+    exception: BaseException
     line_index: int
 
 
@@ -51,13 +65,62 @@ class ExecutionTracer:
     Useful calls when implementing or debugging features (the contents are added as PlantUML comments in the exported diagram):
     self.exporter.on_raw_content(f"\n' {event} {frame=} {arg=}\n")
     self.exporter.on_raw_content(f"' {frame.f_back=}\n")
+
+    When a TracingStats instance is given, the tracer collects statistics about the tracing in it
+    (see pydoctrace.stats); the tracing is slower but the execution is not instrumented otherwise.
+
+    When an ArgumentsCapture is given, the tracer captures the arguments of the traced calls it selects
+    and pushes them to the exporter after the start of the calls (see pydoctrace.arguments).
     """
 
-    def __init__(self, exporter: Exporter, call_filter: CallFilter):
+    def __init__(
+        self,
+        exporter: Exporter,
+        call_filter: CallFilter,
+        stats: TracingStats = None,
+        arguments_capture: ArgumentsCapture = None,
+    ):
         self.exporter = exporter
         self.call_filter = call_filter
-        self.callers_stack: List[CallEnd] = deque()
+        self.callers_stack: List[FunctionDescriptor] = deque()
         self.error_to_handle_with_line: TracedError = None
+        # the last exception converted into an Error, when it propagates through several traced frames
+        self.materialized_exception: BaseException = None
+        self.materialized_error: Error = None
+        self.stats = stats
+        self.arguments_capture = arguments_capture
+        # the descriptors of the executed functions, created once per code object
+        self.descriptors_by_code: Dict[CodeType, FunctionDescriptor] = {}
+
+        # the instrumented tracing functions shadow the methods, so that they are used by sys.settrace and frame.f_trace
+        if stats is not None:
+            self.exporter = InstrumentedExporter(exporter, stats)
+            self.call_filter = InstrumentedCallFilter(call_filter, stats)
+            self.globaltrace = self.instrumented_tracing_function(ExecutionTracer.globaltrace)
+            self.localtrace = self.instrumented_tracing_function(ExecutionTracer.localtrace)
+            self.exceptiontrace = self.instrumented_tracing_function(ExecutionTracer.exceptiontrace)
+
+    def instrumented_tracing_function(self, tracing_function: Callable) -> Callable:
+        """
+        Wraps the given tracing method to measure the time spent in it, to count the tracing events by kind
+        and to track the peak depth of the stack of traced calls.
+        The calls filtered out are counted by preset once the time spent in the tracing function is measured.
+        """
+        stats = self.stats
+        events_by_kind = stats.events_by_kind
+        call_filter: InstrumentedCallFilter = self.call_filter
+
+        def instrumented_tracing(frame, event: str, arg: Any):
+            start_ns = perf_counter_ns()
+            try:
+                return tracing_function(self, frame, event, arg)
+            finally:
+                stats.tracing_ns += perf_counter_ns() - start_ns
+                events_by_kind[event] = events_by_kind.get(event, 0) + 1
+                stats.peak_depth = max(stats.peak_depth, len(self.callers_stack))
+                call_filter.count_filtered_calls()
+
+        return instrumented_tracing
 
     def runfunc(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -76,19 +139,89 @@ class ExecutionTracer:
         finally:
             settrace(tracing_function)
 
-    def on_return_or_exit(self, called_end: CallEnd, arg: Any):
+    def trace_running_frame(self, frame):
+        """
+        Starts tracing the execution of a frame which is already running (the frame of a code block),
+        the caller must then install the global tracing function with sys.settrace to trace the callees.
+        """
+        block_function = self.function_descriptor(frame)
+        self.exporter.on_tracing_start_at(block_function, frame.f_lineno)
+        self.callers_stack.append(block_function)
+
+        # traces the 'exception' events happening in the frame itself
+        frame.f_trace = self.localtrace
+
+    def untrace_running_frame(self, frame, exception: BaseException = None):
+        """
+        Ends the tracing of a frame started with trace_running_frame, when its code block is exited:
+        - normally if no exception is given
+        - because of the given unhandled exception
+        The caller must have uninstalled the global tracing function beforehand.
+        """
+        frame.f_trace = None
+        self.error_to_handle_with_line = None
+        block_function = self.callers_stack.pop()
+        if exception is None:
+            self.exporter.on_tracing_end_at(block_function, frame.f_lineno, None)
+        else:
+            self.exporter.on_unhandled_error_end_at(
+                block_function, frame.f_lineno, self.error_from_exception(exception)
+            )
+
+    def function_descriptor(self, frame) -> FunctionDescriptor:
+        """
+        Retrieves the descriptor of the function executed in the frame from the cache, or creates it and caches it.
+        """
+        code = frame.f_code
+        function = self.descriptors_by_code.get(code)
+        if function is None:
+            fq_module_text: str = frame.f_globals.get('__name__', None)
+            if fq_module_text is None:
+                fq_module_text = module_name_from_filepath(frame.f_globals.get('__file__', None))
+            function = FunctionDescriptor(fq_module_text, tuple(fq_module_text.split('.')), code.co_name)
+            self.descriptors_by_code[code] = function
+
+        return function
+
+    def on_return_or_exit(self, frame, arg: Any):
+        called = self.callers_stack.pop()
         # the calls stack is empty -> end of the tracing
         if len(self.callers_stack) == 0:
-            self.exporter.on_tracing_end(called_end, arg)
+            self.exporter.on_tracing_end_at(called, frame.f_lineno, arg)
         # normal return call
         else:
-            self.exporter.on_return(called=called_end, caller=self.callers_stack[-1], arg=arg)
+            self.exporter.on_return_at(
+                called=called,
+                called_line=frame.f_lineno,
+                caller=self.callers_stack[-1],
+                caller_line=frame.f_back.f_lineno,
+                arg=arg,
+            )
 
     def error_from_exception(self, exception: BaseException) -> Error:
+        """
+        Creates the Error shown in the diagram, with a bounded message: the first argument of the exception
+        if it is a string, the bounded representation of the argument or of the exception otherwise.
+        """
+        if exception is self.materialized_exception:
+            return self.materialized_error
+
         error_args = getattr(exception, 'args', None)
-        error_message = repr(exception) if error_args is None or len(error_args) == 0 else error_args[0]
+        if error_args is None or len(error_args) == 0:
+            error_message = ERROR_MESSAGE_REPR.repr(exception)
+        elif isinstance(error_args[0], str):
+            error_message = error_args[0]
+            if len(error_message) > MAX_ERROR_MESSAGE_LENGTH:
+                error_message = error_message[: MAX_ERROR_MESSAGE_LENGTH - len(ERROR_MESSAGE_TRUNCATION)] + (
+                    ERROR_MESSAGE_TRUNCATION
+                )
+        else:
+            error_message = ERROR_MESSAGE_REPR.repr(error_args[0])
 
-        return Error(exception.__class__.__name__, error_message)
+        self.materialized_exception = exception
+        self.materialized_error = Error(exception.__class__.__name__, error_message)
+
+        return self.materialized_error
 
     def globaltrace(self, frame, event: str, arg: Any):
         """
@@ -101,29 +234,30 @@ class ExecutionTracer:
 
         if event == 'call':
             # determines whether the call should be traced or not
-            fq_module_text: str = frame.f_globals.get('__name__', None)
-            if fq_module_text is None:
-                fq_module_text = module_name_from_filepath(frame.f_globals.get('__file__', None))
-            fq_module_parts = tuple(fq_module_text.split('.'))
-            function_name = frame.f_code.co_name
-            if not self.call_filter.should_trace_call(fq_module_parts, function_name, len(self.callers_stack)):
+            called = self.function_descriptor(frame)
+            if not self.call_filter.should_trace_call(
+                called.fq_module_tuple, called.function_name, len(self.callers_stack)
+            ):
                 return None
 
-            # constructs the call
-            line_index = frame.f_lineno
-            call = CallEnd(fq_module_text, fq_module_parts, function_name, line_index)
-
             # starts the tracing or handle an intermediary call
             if len(self.callers_stack) == 0:
-                self.exporter.on_tracing_start(call)
+                self.exporter.on_tracing_start_at(called, frame.f_lineno)
             else:
-                self.exporter.on_start_call(self.callers_stack[-1]._replace(line_index=frame.f_back.f_lineno), call)
+                self.exporter.on_start_call_at(self.callers_stack[-1], frame.f_back.f_lineno, called, frame.f_lineno)
+
+            # captures the arguments of the traced call, if it is selected by the capture
+            arguments_capture = self.arguments_capture
+            if arguments_capture is not None and arguments_capture.should_capture(called, len(self.callers_stack)):
+                arguments = arguments_capture.capture(frame)
+                if arguments is not None:
+                    self.exporter.on_call_arguments_at(called, frame.f_lineno, arguments)
 
             # unflags any error remaining from localtrace without return event
             self.error_to_handle_with_line = None
 
             # adds the call to the calls stack and returns the call tracing function to detect 'return' or 'exception' events
-            self.callers_stack.append(call)
+            self.callers_stack.append(called)
 
             return self.localtrace
 
@@ -146,9 +280,8 @@ class ExecutionTracer:
         """
 
         if event == 'exception':
-            # creates the error and flags it so that it can be handled either by the localtrace or exceptiontrace
-            error = self.error_from_exception(arg[1])
-            self.error_to_handle_with_line = TracedError(error, frame.f_lineno)
+            # flags the error so that it can be handled either by the localtrace or exceptiontrace
+            self.error_to_handle_with_line = TracedError(arg[1], frame.f_lineno)
 
             # uses the exception tracing
             return self.exceptiontrace
@@ -157,14 +290,18 @@ class ExecutionTracer:
             # classic return when the error has been handled internally (in an except block)
             if self.error_to_handle_with_line is None:
                 # end of the block code: removes the last caller from the stack
-                called_end = self.callers_stack.pop()._replace(line_index=frame.f_lineno)
-                self.on_return_or_exit(called_end, arg)
+                self.on_return_or_exit(frame, arg)
             # propagates the error to the caller
             else:
-                error, _ = self.error_to_handle_with_line
-                error_called = self.callers_stack.pop()._replace(line_index=frame.f_lineno)
-                error_caller = self.callers_stack[-1]._replace(line_index=frame.f_back.f_lineno)
-                self.exporter.on_error_propagation(error_called, error_caller, error)
+                exception, _ = self.error_to_handle_with_line
+                error_called = self.callers_stack.pop()
+                self.exporter.on_error_propagation_at(
+                    error_called,
+                    frame.f_lineno,
+                    self.callers_stack[-1],
+                    frame.f_back.f_lineno,
+                    self.error_from_exception(exception),
+                )
 
                 # unflags the error
                 self.error_to_handle_with_line = None
@@ -174,33 +311,32 @@ class ExecutionTracer:
     def exceptiontrace(self, frame, event: str, arg: Any):
         # a new exception enters the frame (re-raised, replaced or wrapped)
         if event == 'exception':
-            error = self.error_from_exception(arg[1])
-            self.error_to_handle_with_line = TracedError(error, frame.f_lineno)
+            self.error_to_handle_with_line = TracedError(arg[1], frame.f_lineno)
 
         elif event == 'return':
             # the error has been internally handled, a classic return occurs
             if self.error_to_handle_with_line is None:
-                called_end = self.callers_stack.pop()._replace(line_index=frame.f_lineno)
-                self.on_return_or_exit(called_end, arg)
+                self.on_return_or_exit(frame, arg)
             # handles the flagged error
             else:
-                error, line_number_called = self.error_to_handle_with_line
+                exception, line_number_called = self.error_to_handle_with_line
                 line_number = frame.f_lineno
 
                 # error propagation
                 if line_number == line_number_called:
-                    error_called = self.callers_stack.pop()._replace(line_index=line_number)
+                    error = self.error_from_exception(exception)
+                    error_called = self.callers_stack.pop()
                     # exits the tracing if there is no caller anymore
                     if len(self.callers_stack) == 0:
-                        self.exporter.on_unhandled_error_end(error_called, error)
+                        self.exporter.on_unhandled_error_end_at(error_called, line_number, error)
                     else:
-                        error_caller = self.callers_stack[-1]._replace(line_index=frame.f_back.f_lineno)
-                        self.exporter.on_error_propagation(error_called, error_caller, error)
+                        self.exporter.on_error_propagation_at(
+                            error_called, line_number, self.callers_stack[-1], frame.f_back.f_lineno, error
+                        )
 
                 # error was handled, normal return
                 else:
-                    called_end = self.callers_stack.pop()._replace(line_index=frame.f_lineno)
-                    self.on_return_or_exit(called_end, arg)
+                    self.on_return_or_exit(frame, arg)
 
                 # unflags the error
                 self.error_to_handle_with_line = None
@@ -0,0 +1,45 @@
+from collections import Counter
+
+from pytest import mark
+
+from pydoctrace.bench.events import SyntheticTraceShape, generate_events
+
+
+@mark.parametrize(
+    ['depth', 'fan_out', 'expected_calls_count'],
+    [
+        (1, 5, 1),
+        (2, 5, 6),
+        (3, 4, 21),
+    ],
+)
+def test_generate_events_counts(depth: int, fan_out: int, expected_calls_count: int):
+    shape = SyntheticTraceShape(depth, fan_out, modules_count=3, error_rate=0.3)
+    assert shape.calls_count() == expected_calls_count
+
+    events_counts = Counter(hook_name for hook_name, _, _ in generate_events(shape))
+    assert events_counts['on_tracing_start'] == 1
+    assert events_counts['on_tracing_end'] == 1
+    assert events_counts['on_start_call'] == expected_calls_count - 1
+    assert events_counts['on_return'] + events_counts['on_error_propagation'] == expected_calls_count - 1
+
+
+def test_generate_events_is_reproducible_and_balanced():
+    shape = SyntheticTraceShape(depth=4, fan_out=3, modules_count=2, error_rate=0.5, seed=42)
+    events = list(generate_events(shape))
+    assert events == list(generate_events(shape))
+
+    # each call is closed by a return or an error propagation, in the reverse order of the calls
+    called_stack = []
+    for hook_name, args, kwargs in events:
+        if hook_name == 'on_start_call':
+            called_stack.append(args[1].function_name)
+        elif hook_name == 'on_return':
+            assert kwargs['called'].function_name == called_stack.pop()
+        elif hook_name == 'on_error_propagation':
+            assert args[0].function_name == called_stack.pop()
+            assert args[2].class_name == 'ValueError'
+    assert called_stack == []
+
+    modules = {args[1].fq_module_text for hook_name, args, _ in events if hook_name == 'on_start_call'}
+    assert modules == {'synthetic.module_0', 'synthetic.module_1'}
@@ -0,0 +1,64 @@
+from pathlib import Path
+from sys import version_info
+from tracemalloc import start as start_tracemalloc
+from tracemalloc import stop as stop_tracemalloc
+
+from pytest import MonkeyPatch, mark
+
+from pydoctrace.bench import throughput
+from pydoctrace.bench.__main__ import main
+from pydoctrace.bench.events import SyntheticTraceShape, generate_events
+from pydoctrace.bench.throughput import measure_throughput, run_throughput_benchmarks
+
+
+def test_run_throughput_benchmarks():
+    shape = SyntheticTraceShape(depth=3, fan_out=3, error_rate=0.2)
+    results = run_throughput_benchmarks(shape, ['sequence', 'component'], repeat=1)
+
+    events_count = len(list(generate_events(shape)))
+    assert [(result.exporter, result.events) for result in results] == [
+        ('sequence', events_count),
+        ('component', events_count),
+    ]
+    for result in results:
+        assert result.events_per_second > 0
+        assert result.peak_memory_bytes > 0
+        assert result.exported_characters > 0
+
+
+@mark.skipif(version_info < (3, 9), reason='tracemalloc.reset_peak appeared in Python 3.9')
+def test_measure_throughput_resets_the_peak_of_a_running_tracemalloc():
+    events = list(generate_events(SyntheticTraceShape(depth=2, fan_out=2)))
+    start_tracemalloc()
+    try:
+        # allocates and releases a large block before the measure
+        large_block = bytearray(50_000_000)
+        del large_block
+        result = measure_throughput('sequence', events, repeat=1)
+    finally:
+        stop_tracemalloc()
+
+    # the peak comes from the export of a few events, not from the large block
+    assert 0 < result.peak_memory_bytes < 1_000_000
+
+
+def test_measure_throughput_does_not_measure_the_peak_when_it_cannot_be_reset(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(throughput, 'reset_peak', None)
+    events = list(generate_events(SyntheticTraceShape(depth=2, fan_out=2)))
+
+    start_tracemalloc()
+    try:
+        assert measure_throughput('sequence', events, repeat=1).peak_memory_bytes is None
+    finally:
+        stop_tracemalloc()
+
+    # the peak is measured when tracemalloc is started for the measure
+    assert measure_throughput('sequence', events, repeat=1).peak_memory_bytes > 0
+
+
+def test_main_benchmarks_the_exporters(tmp_path: Path):
+    report_path = tmp_path / 'throughput.json'
+    assert (
+        main(['exporters', '-e', 'component', '--depth', '2', '--fan-out', '2', '-r', '1', '-o', str(report_path)]) == 0
+    )
+    assert '"exporter": "component"' in report_path.read_text(encoding='utf8')
@@ -0,0 +1,85 @@
+from json import dump, load
+from pathlib import Path
+
+from pydoctrace.bench.__main__ import main
+from pydoctrace.bench.tracing import BenchmarkResult, benchmark_report, count_calls, find_regressions, run_benchmarks
+from pydoctrace.bench.workloads import WORKLOADS_BY_NAME
+
+from tests.modules.fibonacci import fibonacci
+
+
+def test_count_calls():
+    # fibonacci(4) calls itself 8 times
+    assert count_calls(fibonacci, (4,)) == 9
+
+
+def test_run_benchmarks_by_exporter_and_preset_set():
+    results = run_benchmarks(
+        {'call-depth': WORKLOADS_BY_NAME['call-depth']}, ['sequence', 'pstats'], ['trace-all', 'default'], repeat=1
+    )
+
+    assert [(result.exporter, result.preset_set) for result in results] == [
+        ('sequence', 'trace-all'),
+        ('sequence', 'default'),
+        ('pstats', 'trace-all'),
+        ('pstats', 'default'),
+    ]
+    assert all(result.workload == 'call-depth' and result.calls == 9 for result in results)
+    assert all(result.traced_seconds > 0 for result in results)
+
+
+def test_find_regressions_above_threshold():
+    baseline_report = benchmark_report(
+        [
+            BenchmarkResult('fibonacci', 'sequence', 'default', 10, 0.0, 0.000_001),
+            BenchmarkResult('fibonacci', 'component', 'default', 10, 0.0, 0.000_001),
+        ],
+        repeat=1,
+    )
+    report = benchmark_report(
+        [
+            BenchmarkResult('fibonacci', 'sequence', 'default', 10, 0.0, 0.000_0011),
+            BenchmarkResult('fibonacci', 'component', 'default', 10, 0.0, 0.000_0013),
+            # not in the baseline
+            BenchmarkResult('fibonacci', 'dot', 'default', 10, 0.0, 0.1),
+        ],
+        repeat=1,
+    )
+
+    regressions = find_regressions(baseline_report, report, threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0][:3] == ('fibonacci', 'component', 'default')
+    assert round(regressions[0].baseline_overhead_per_call_ns) == 100
+    assert round(regressions[0].overhead_per_call_ns) == 130
+
+
+def test_main_writes_the_report_and_compares_it(tmp_path: Path):
+    report_path = tmp_path / 'report.json'
+    bench_args = ['-w', 'call-depth', '-e', 'folded', '-p', 'default', '-r', '1', '-o', str(report_path)]
+    assert main(bench_args) == 0
+
+    with open(report_path, encoding='utf8') as report_file:
+        report = load(report_file)
+    assert report['repeat'] == 1
+    assert [(result['workload'], result['exporter'], result['preset_set']) for result in report['results']] == [
+        ('call-depth', 'folded', 'default')
+    ]
+
+    # compares the overhead with baseline ones
+    def compare_with_baseline(baseline_overhead_per_call_ns: float) -> int:
+        baseline_path = tmp_path / 'baseline.json'
+        with open(baseline_path, 'w', encoding='utf8') as baseline_file:
+            dump(
+                {'results': [{**report['results'][0], 'overhead_per_call_ns': baseline_overhead_per_call_ns}]},
+                baseline_file,
+            )
+
+        return main([*bench_args, '--compare', str(baseline_path)])
+
+    assert compare_with_baseline(1_000_000_000) == 0
+    assert compare_with_baseline(-1_000_000_000) == 1, 'the overhead is higher than the baseline one'
+
+
+def test_workloads_do_not_depend_on_the_tests_modules():
+    # the tests modules are not distributed with the package
+    assert all(not workload.function.__module__.startswith('tests.') for workload in WORKLOADS_BY_NAME.values())
@@ -0,0 +1,115 @@
+from io import StringIO
+from typing import Iterable, Tuple
+
+from pytest import fixture, mark
+
+from pydoctrace.domain.diagram import Call, Function, Interactions, Module, Raised, Return
+from pydoctrace.exporters.graphviz.component import (
+    GRAPHVIZ_COMPONENT_FORMATTER,
+    DotModuleStructureVisitor,
+    GraphvizComponentExporter,
+)
+
+
+@fixture(scope='function')
+def graphviz_exporter_and_writer() -> Tuple[GraphvizComponentExporter, StringIO]:
+    exported_contents = StringIO()
+    exporter = GraphvizComponentExporter(exported_contents)
+
+    return exporter, exported_contents
+
+
+def test_graphviz_component_formatter():
+    assert GRAPHVIZ_COMPONENT_FORMATTER.format('"{name:quoted}" {name}', name='a"b') == r'"a\"b" a"b'
+
+
+def test_graphviz_component_exporter_on_header(
+    graphviz_exporter_and_writer: Tuple[GraphvizComponentExporter, StringIO],
+):
+    exporter, contents_writer = graphviz_exporter_and_writer
+    exporter.on_header('math_cli.__main__', 'factorial')
+
+    assert contents_writer.getvalue().startswith('digraph "math_cli.__main__.factorial-component" {\n')
+
+
+@mark.parametrize(
+    ['traced_function', 'unhandled_error_class_name', 'visited_module', 'expected_dot_lines'],
+    [
+        # the root module is not drawn; the traced function is highlighted
+        (
+            Function('main', ('__main__',)),
+            None,
+            Module(None, {'__main__': Module('__main__', {}, {'main': Function('main', ('__main__',))})}, {}),
+            [
+                '  subgraph cluster_1 {\n    label="__main__"\n    style=solid\n',
+                '    "__main__.main" [label="main", style="rounded,bold", xlabel="@trace"]\n',
+                '  }\n',
+            ],
+        ),
+        # parent modules without functions are concatenated, modules are nested clusters
+        (
+            Function('trace', ('pydoctrace', 'tracing', 'tracer')),
+            'ValueError',
+            Module(
+                None,
+                {
+                    'pydoctrace': Module(
+                        'pydoctrace',
+                        {
+                            'tracing': Module(
+                                'tracing',
+                                {
+                                    'tracer': Module(
+                                        'tracer', {}, {'trace': Function('trace', ('pydoctrace', 'tracing', 'tracer'))}
+                                    )
+                                },
+                                {'start': Function('start', ('pydoctrace', 'tracing'))},
+                            )
+                        },
+                        {},
+                    )
+                },
+                {},
+            ),
+            [
+                '  subgraph cluster_1 {\n    label="pydoctrace.tracing"\n    style=solid\n',
+                '    "pydoctrace.tracing.start" [label="start"]\n',
+                '    subgraph cluster_2 {\n      label="tracer"\n      style=solid\n',
+                '      "pydoctrace.tracing.tracer.ValueError" [label="ValueError", shape=plaintext, fontcolor=darkred]\n',
+                '      "pydoctrace.tracing.tracer.trace" [label="trace", style="rounded,bold", xlabel="@trace"]\n',
+                '    }\n',
+                '  }\n',
+            ],
+        ),
+    ],
+)
+def test_dot_module_structure_visitor_visit_module(
+    traced_function: Function,
+    unhandled_error_class_name: str,
+    visited_module: Module,
+    expected_dot_lines: Iterable[str],
+):
+    module_visitor = DotModuleStructureVisitor(traced_function, unhandled_error_class_name)
+
+    assert list(module_visitor.visit_module(visited_module, (), 1)) == expected_dot_lines
+
+
+def test_graphviz_component_exporter_write_components_interactions(
+    graphviz_exporter_and_writer: Tuple[GraphvizComponentExporter, StringIO],
+):
+    exporter, contents_writer = graphviz_exporter_and_writer
+    caller_function = Function('caller', ('module_1',))
+    called_function = Function('called', ('module_2',))
+    exporter.interactions_by_call = {
+        (caller_function, called_function): Interactions(
+            [Call(rank) for rank in range(1, 14, 2)],
+            [Raised(2, 'ValueError'), Raised(4, 'ValueError'), Raised(6, 'TypeError'), Return(8)],
+        )
+    }
+
+    exporter.write_components_interactions()
+
+    assert contents_writer.getvalue().splitlines() == [
+        '  "module_1.caller" -> "module_2.called" [label="7", weight=7, penwidth=5]',
+        '  "module_2.called" -> "module_1.caller" [label="ValueError x2, TypeError", style=dashed, color=darkred, fontcolor=darkred, constraint=false]',
+    ]
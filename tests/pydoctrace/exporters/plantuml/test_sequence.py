@@ -24,6 +24,8 @@ def sequence_exporter_and_writer() -> Tuple[PlantUMLSequenceExporter, StringIO]:
         ('function {decorator}', {'decorator': '@tracer'}, 'function <U+0040>tracer'),
         # '__' occurrences are escaped only when specified by the 'dunder' format_spec
         ('{styling} {name:dunder}', {'styling': '__italic__', 'name': '__main__'}, '__italic__ ~__main~__'),
+        # line breaks are escaped so that the values do not end the statements
+        ('return {arg:dunder}', {'arg': 'HELLO\r\nWORLD'}, r'return HELLO\r\nWORLD'),
     ],
 )
 def test_plantuml_sequence_formatter(text_to_format: str, values_by_key: Dict[str, Any], formatted_text):
@@ -36,7 +38,9 @@ def test_plantuml_sequence_formatter(text_to_format: str, values_by_key: Dict[st
         (None, ''),
         ('', ''),
         ('text', 'text'),
-        (3.1426, 3.1426),
+        (3.1426, '3.1426'),
+        ('x' * 300, 'x' * 197 + '...'),
+        (list(range(100)), '[0, 1, 2, 3, 4, 5, ...]'),
     ],
 )
 def test_plantuml_sequence_exporter_format_arg_value(arg: Any, formatted_arg: Any):
@@ -144,6 +148,29 @@ note right: line 25
     )
 
 
+def test_plantuml_sequence_exporter_escapes_the_line_breaks_of_the_returned_values(
+    sequence_exporter_and_writer: Tuple[PlantUMLSequenceExporter, StringIO],
+):
+    exporter, contents_writer = sequence_exporter_and_writer
+    caller = CallEnd('greetings.__main__', ('greetings', '__main__'), 'main', 3)
+    called = CallEnd('greetings.formatting', ('greetings', 'formatting'), 'shout', 12)
+
+    exporter.on_return(caller=caller, called=called, arg='HELLO\nWORLD')
+    exporter.on_tracing_end(caller, 'HELLO\nWORLD')
+
+    assert (
+        contents_writer.getvalue()
+        == r"""
+return HELLO\nWORLD
+note right: line 12
+|||
+
+[<-- "greetings.~__main~__\nmain": HELLO\nWORLD
+note right: line 3
+"""
+    )
+
+
 def test_plantuml_sequence_exporter_on_unhandled_error_end(
     sequence_exporter_and_writer: Tuple[PlantUMLSequenceExporter, StringIO],
 ):
@@ -0,0 +1,112 @@
+from io import StringIO
+from json import loads
+from pathlib import Path
+from time import sleep
+
+from pytest import mark, raises
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER
+from pydoctrace.doctrace import trace_to_sequence_puml
+from pydoctrace.exporters import EVENT_CLOCK
+from pydoctrace.exporters.buffering import AnomalyTrigger, BufferingExporter
+from pydoctrace.exporters.chrometrace import ChromeTraceExporter
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive, factorial_recursive_check_unhandled
+
+
+def _slow_factorial(value: int) -> int:
+    sleep(0.05)
+    return factorial_recursive(value)
+
+
+def _untimed_events(jsonlines_contents: str) -> list:
+    return [
+        {key: value for key, value in loads(line).items() if key != 'ts'} for line in jsonlines_contents.splitlines()
+    ]
+
+
+def test_buffering_exporter_replays_the_events():
+    buffering_exporter = BufferingExporter(AnomalyTrigger())
+    assert ExecutionTracer(buffering_exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive, 3) == 6
+    assert not buffering_exporter.is_anomalous()
+
+    # the replayed events produce the same export as a direct tracing (except for the times of the events)
+    replayed_contents = StringIO()
+    replaying_exporter = JSONLinesExporter(replayed_contents)
+    replaying_exporter.on_header(factorial_recursive.__module__, factorial_recursive.__name__)
+    buffering_exporter.replay(replaying_exporter)
+    replaying_exporter.on_footer()
+
+    traced_contents = StringIO()
+    tracing_exporter = JSONLinesExporter(traced_contents)
+    tracing_exporter.on_header(factorial_recursive.__module__, factorial_recursive.__name__)
+    ExecutionTracer(tracing_exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive, 3)
+    tracing_exporter.on_footer()
+
+    assert _untimed_events(replayed_contents.getvalue()) == _untimed_events(traced_contents.getvalue())
+
+
+@mark.parametrize(
+    ['anomaly_trigger', 'expected_is_anomalous'],
+    [
+        (AnomalyTrigger(), True),
+        (AnomalyTrigger(on_unhandled_error=False), False),
+    ],
+)
+def test_buffering_exporter_unhandled_error_anomaly(anomaly_trigger: AnomalyTrigger, expected_is_anomalous: bool):
+    buffering_exporter = BufferingExporter(anomaly_trigger)
+    with raises(ValueError):
+        ExecutionTracer(buffering_exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive_check_unhandled, None)
+
+    assert buffering_exporter.is_anomalous() == expected_is_anomalous
+
+
+@mark.parametrize(
+    ['min_duration_seconds', 'expected_is_anomalous'],
+    [
+        (None, False),
+        (0.01, True),
+        (60, False),
+    ],
+)
+def test_buffering_exporter_duration_anomaly(min_duration_seconds: float, expected_is_anomalous: bool):
+    buffering_exporter = BufferingExporter(AnomalyTrigger(min_duration_seconds=min_duration_seconds))
+    assert ExecutionTracer(buffering_exporter, TRACE_ALL_FILTER).runfunc(_slow_factorial, 3) == 6
+
+    assert buffering_exporter.is_anomalous() == expected_is_anomalous
+
+
+def test_trace_to_sequence_puml_exports_anomalies_only(tmp_path: Path):
+    diagram_path = tmp_path / 'factorial.puml'
+    traced_factorial = trace_to_sequence_puml(
+        export_file_path_tpl=str(diagram_path), filter_presets=[], anomaly_trigger=AnomalyTrigger()
+    )(factorial_recursive_check_unhandled)
+
+    assert traced_factorial(3) == 6
+    assert not diagram_path.exists(), 'a normal execution must not be exported'
+
+    with raises(ValueError):
+        traced_factorial(None)
+    diagram_contents = diagram_path.read_text(encoding='utf8')
+    assert diagram_contents.startswith('@startuml tests.modules.factorial.factorial_recursive_check_unhandled-sequence')
+    assert 'ValueError' in diagram_contents
+
+
+def test_buffering_exporter_replays_the_events_with_their_traced_times():
+    buffering_exporter = BufferingExporter(AnomalyTrigger(min_duration_seconds=0.04))
+    assert ExecutionTracer(buffering_exporter, TRACE_ALL_FILTER).runfunc(_slow_factorial, 3) == 6
+    assert buffering_exporter.is_anomalous()
+
+    replayed_contents = StringIO()
+    chrome_trace_exporter = ChromeTraceExporter(replayed_contents)
+    chrome_trace_exporter.on_header(_slow_factorial.__module__, _slow_factorial.__name__)
+    buffering_exporter.replay(chrome_trace_exporter)
+    chrome_trace_exporter.on_footer()
+
+    # the timeline spans the duration of the execution (the sleep), not the duration of the replay
+    timestamps = [event['ts'] for event in loads(replayed_contents.getvalue()) if event['ph'] in ('B', 'E')]
+    assert timestamps[0] == 0
+    assert timestamps[-1] >= 50_000
+    assert EVENT_CLOCK.replayed_event_ns is None, 'the clock must be restored once the events are replayed'
@@ -0,0 +1,78 @@
+from io import StringIO
+from json import loads
+from typing import Tuple
+
+from pytest import fixture, raises
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER
+from pydoctrace.domain.execution import CallEnd
+from pydoctrace.exporters.chrometrace import ChromeTraceExporter
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive, factorial_recursive_check_unhandled
+
+
+@fixture(scope='function')
+def chrometrace_exporter_and_writer() -> Tuple[ChromeTraceExporter, StringIO]:
+    exported_contents = StringIO()
+    exporter = ChromeTraceExporter(exported_contents)
+
+    return exporter, exported_contents
+
+
+def test_chrometrace_exporter_timestamp_is_monotonic():
+    exporter = ChromeTraceExporter(None)
+    first_timestamp = exporter.timestamp()
+
+    assert first_timestamp >= 0
+    assert exporter.timestamp() >= first_timestamp
+
+
+def test_chrometrace_exporter_on_start_call(chrometrace_exporter_and_writer: Tuple[ChromeTraceExporter, StringIO]):
+    exporter, contents_writer = chrometrace_exporter_and_writer
+    caller = CallEnd('math_cli.controller', ('math_cli', 'controller'), 'factorial', 25)
+    called = CallEnd('math_cli.validator', ('math_cli', 'validator'), 'is_positive_int', 4)
+
+    exporter.on_start_call(caller, called)
+
+    begin_event = loads(contents_writer.getvalue()[1:])
+    assert begin_event['name'] == 'is_positive_int'
+    assert begin_event['cat'] == 'math_cli.validator'
+    assert begin_event['ph'] == 'B'
+    assert begin_event['tid'] == exporter.tid
+    assert begin_event['args'] == {'line': 4}
+
+
+def test_chrometrace_exporter_traced_execution(chrometrace_exporter_and_writer: Tuple[ChromeTraceExporter, StringIO]):
+    exporter, contents_writer = chrometrace_exporter_and_writer
+    exporter.on_header(factorial_recursive.__module__, factorial_recursive.__name__)
+    try:
+        assert ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive, 3) == 6
+    finally:
+        exporter.on_footer()
+
+    events = loads(contents_writer.getvalue())
+    assert [event['ph'] for event in events] == ['M', 'B', 'B', 'B', 'E', 'E', 'E']
+    assert events[0]['args'] == {'name': 'tests.modules.factorial.factorial_recursive'}
+
+    timestamps = [event['ts'] for event in events[1:]]
+    assert timestamps == sorted(timestamps), 'timestamps must be in chronological order'
+
+
+def test_chrometrace_exporter_traced_unhandled_error(
+    chrometrace_exporter_and_writer: Tuple[ChromeTraceExporter, StringIO],
+):
+    exporter, contents_writer = chrometrace_exporter_and_writer
+    exporter.on_header(factorial_recursive.__module__, factorial_recursive.__name__)
+    with raises(ValueError):
+        try:
+            ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive_check_unhandled, None)
+        finally:
+            exporter.on_footer()
+
+    events = loads(contents_writer.getvalue())
+    assert events[-1]['ph'] == 'E'
+    assert events[-1]['args'] == {'error': 'ValueError'}
+    begin_events_nb = sum(1 for event in events if event['ph'] == 'B')
+    end_events_nb = sum(1 for event in events if event['ph'] == 'E')
+    assert begin_events_nb == end_events_nb
@@ -0,0 +1,41 @@
+from io import StringIO
+
+from pytest import MonkeyPatch
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER
+from pydoctrace.exporters import EVENT_CLOCK
+from pydoctrace.exporters.fanout import FanOutExporter
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.exporters.plantuml.component import PlantUMLComponentExporter
+from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_with_checker
+
+
+def _trace_and_export(exporter, function_to_trace, *args):
+    exporter.on_header(function_to_trace.__module__, function_to_trace.__name__)
+    try:
+        return ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(function_to_trace, *args)
+    finally:
+        exporter.on_footer()
+
+
+def test_fan_out_exporter_forwards_events_to_all_exporters(monkeypatch: MonkeyPatch):
+    # freezes the times of the events exported as JSON lines
+    monkeypatch.setattr(EVENT_CLOCK, 'replayed_event_ns', 0)
+    fanned_out_contents = [StringIO(), StringIO(), StringIO()]
+    exporter_classes = [PlantUMLSequenceExporter, PlantUMLComponentExporter, JSONLinesExporter]
+    fan_out_exporter = FanOutExporter(
+        [
+            exporter_class(exported_contents)
+            for exporter_class, exported_contents in zip(exporter_classes, fanned_out_contents)
+        ]
+    )
+    assert _trace_and_export(fan_out_exporter, factorial_with_checker, 'not_an_int') is None
+
+    # each fanned-out export is the same as the one of a single exporter
+    for exporter_class, exported_contents in zip(exporter_classes, fanned_out_contents):
+        single_exported_contents = StringIO()
+        _trace_and_export(exporter_class(single_exported_contents), factorial_with_checker, 'not_an_int')
+        assert exported_contents.getvalue() == single_exported_contents.getvalue()
@@ -0,0 +1,52 @@
+from io import StringIO
+
+from pytest import mark, raises
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER
+from pydoctrace.exporters.foldedstacks import FoldedStacksExporter, FoldedStacksTimeExporter
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive_check_unhandled, factorial_reduce_multiply
+from tests.modules.fibonacci import fibonacci
+
+
+def _trace_and_export(exporter_class, function_to_trace, *args) -> str:
+    exported_contents = StringIO()
+    exporter = exporter_class(exported_contents)
+    exporter.on_header(function_to_trace.__module__, function_to_trace.__name__)
+    try:
+        ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(function_to_trace, *args)
+    finally:
+        exporter.on_footer()
+
+    return exported_contents.getvalue()
+
+
+def test_folded_stacks_exporter_weighted_by_calls_count():
+    assert _trace_and_export(FoldedStacksExporter, fibonacci, 4).splitlines() == [
+        'tests.modules.fibonacci.fibonacci 1',
+        'tests.modules.fibonacci.fibonacci;tests.modules.fibonacci.fibonacci 2',
+        'tests.modules.fibonacci.fibonacci;tests.modules.fibonacci.fibonacci;tests.modules.fibonacci.fibonacci 4',
+        'tests.modules.fibonacci.fibonacci;tests.modules.fibonacci.fibonacci;tests.modules.fibonacci.fibonacci;tests.modules.fibonacci.fibonacci 2',
+    ]
+
+
+def test_folded_stacks_exporter_unstacks_errors():
+    exporter = FoldedStacksExporter(StringIO())
+    with raises(ValueError):
+        ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive_check_unhandled, None)
+    assert len(exporter.frames) == 0, 'all the frames must be unstacked'
+
+
+@mark.parametrize('exporter_class', [FoldedStacksExporter, FoldedStacksTimeExporter])
+def test_folded_stacks_exporters_export_the_same_stacks(exporter_class):
+    folded_stacks = [
+        line.rsplit(' ', 1) for line in _trace_and_export(exporter_class, factorial_reduce_multiply, 3).splitlines()
+    ]
+
+    # functools.reduce is implemented in C and is not traced
+    assert [stack for stack, _ in folded_stacks] == [
+        'tests.modules.factorial.factorial_reduce_multiply',
+        'tests.modules.factorial.factorial_reduce_multiply;tests.modules.factorial.multiply',
+    ]
+    assert all(int(weight) >= 0 for _, weight in folded_stacks)
@@ -2,7 +2,12 @@ from typing import Any, Tuple
 
 from pytest import mark
 
-from pydoctrace.exporters.formatters import escape_dunder_with_tilde, replace_arobase_by_unicode
+from pydoctrace.exporters.formatters import (
+    escape_double_quotes,
+    escape_dunder_with_tilde,
+    escape_line_breaks,
+    replace_arobase_by_unicode,
+)
 
 
 @mark.parametrize(
@@ -47,3 +52,38 @@ def test_escape_dunder_with_tilde(raw_text: str, format_spec: str, formatted_tex
 )
 def test_replace_arobase_by_unicode(raw_text: Any, format_spec: str, formatted_text_and_format_spec: Tuple[Any, str]):
     assert replace_arobase_by_unicode(raw_text, format_spec) == formatted_text_and_format_spec
+
+
+@mark.parametrize(
+    ['raw_text', 'format_spec', 'formatted_text_and_format_spec'],
+    [
+        (None, None, (None, None)),
+        # the 'quoted' spec is always replaced, whatever the value to format
+        (None, 'quoted', (None, '')),
+        (1, 'quoted', (1, '')),
+        ('text', 'quoted', ('text', '')),
+        # escapes double quotes and backslashes
+        ('"text"', 'quoted', (r'\"text\"', '')),
+        (r'C:\path', 'quoted', (r'C:\\path', '')),
+        # no replacement is done if the 'quoted' format_spec is not specified
+        ('"text"', '', ('"text"', '')),
+    ],
+)
+def test_escape_double_quotes(raw_text: Any, format_spec: str, formatted_text_and_format_spec: Tuple[Any, str]):
+    assert escape_double_quotes(raw_text, format_spec) == formatted_text_and_format_spec
+
+
+@mark.parametrize(
+    ['raw_text', 'format_spec', 'formatted_text_and_format_spec'],
+    [
+        (None, None, (None, None)),
+        # this formatter does not use nor consume the format_spec
+        (0, None, (0, None)),
+        ('text', 'dunder', ('text', 'dunder')),
+        # escapes the carriage returns and the line feeds
+        ('HELLO\nWORLD', None, (r'HELLO\nWORLD', None)),
+        ('HELLO\r\nWORLD\n', '', (r'HELLO\r\nWORLD\n', '')),
+    ],
+)
+def test_escape_line_breaks(raw_text: Any, format_spec: str, formatted_text_and_format_spec: Tuple[Any, str]):
+    assert escape_line_breaks(raw_text, format_spec) == formatted_text_and_format_spec
@@ -0,0 +1,124 @@
+from io import StringIO
+from json import loads
+from typing import Any, Tuple
+
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER
+from pydoctrace.domain.execution import CallEnd, Error
+from pydoctrace.exporters import EVENT_CLOCK
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive, factorial_recursive_check_unhandled
+
+
+@fixture(scope='function')
+def jsonlines_exporter_and_writer() -> Tuple[JSONLinesExporter, StringIO]:
+    exported_contents = StringIO()
+    exporter = JSONLinesExporter(exported_contents)
+
+    return exporter, exported_contents
+
+
+@mark.parametrize(
+    ['arg', 'formatted_arg'],
+    [
+        (None, 'null'),
+        ('', '""'),
+        ('text', '"text"'),
+        ('"quoted"\n', r'"\"quoted\"\n"'),
+        (3.1426, '"3.1426"'),
+        ([1, 2], '"[1, 2]"'),
+    ],
+)
+def test_jsonlines_exporter_format_arg_value(arg: Any, formatted_arg: str):
+    assert JSONLinesExporter(None).format_arg_value(arg) == formatted_arg
+
+
+def test_jsonlines_exporter_interns_functions(
+    jsonlines_exporter_and_writer: Tuple[JSONLinesExporter, StringIO], monkeypatch: MonkeyPatch
+):
+    exporter, contents_writer = jsonlines_exporter_and_writer
+    monkeypatch.setattr(EVENT_CLOCK, 'replayed_event_ns', 1_000)
+    caller = CallEnd('math_cli.controller', ('math_cli', 'controller'), 'factorial', 25)
+    called = CallEnd('math_cli.validator', ('math_cli', 'validator'), 'is_positive_int', 4)
+
+    exporter.on_start_call(caller, called)
+    exporter.on_start_call(caller._replace(line_index=26), called)
+
+    assert contents_writer.getvalue().splitlines() == [
+        '{"event":"function","id":0,"module":"math_cli.controller","name":"factorial"}',
+        '{"event":"function","id":1,"module":"math_cli.validator","name":"is_positive_int"}',
+        '{"event":"call","ts":1000,"caller":0,"caller_line":25,"called":1,"called_line":4}',
+        '{"event":"call","ts":1000,"caller":0,"caller_line":26,"called":1,"called_line":4}',
+    ]
+
+
+def test_jsonlines_exporter_on_error_propagation(
+    jsonlines_exporter_and_writer: Tuple[JSONLinesExporter, StringIO], monkeypatch: MonkeyPatch
+):
+    exporter, contents_writer = jsonlines_exporter_and_writer
+    monkeypatch.setattr(EVENT_CLOCK, 'replayed_event_ns', 1_000)
+    caller = CallEnd('math_cli.__main__', ('math_cli', '__main__'), 'factorial', 4)
+    called = CallEnd('math_cli.validator', ('math_cli', 'validator'), 'validate_positive_int', 25)
+
+    exporter.on_error_propagation(called, caller, Error('ValueError', 'must be a "positive" integer'))
+
+    assert contents_writer.getvalue().splitlines()[-1] == (
+        '{"event":"error","ts":1000,"called":0,"called_line":25,"caller":1,"caller_line":4,'
+        r'"class":"ValueError","message":"must be a \"positive\" integer"}'
+    )
+
+
+def test_jsonlines_exporter_traced_execution(jsonlines_exporter_and_writer: Tuple[JSONLinesExporter, StringIO]):
+    exporter, contents_writer = jsonlines_exporter_and_writer
+    exporter.on_header(factorial_recursive.__module__, factorial_recursive.__name__)
+    try:
+        assert ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive, 3) == 6
+    finally:
+        exporter.on_footer()
+
+    events = [loads(line) for line in contents_writer.getvalue().splitlines()]
+    assert [event['event'] for event in events] == [
+        'header',
+        'function',
+        'start',
+        'call',
+        'call',
+        'return',
+        'return',
+        'end',
+        'footer',
+    ]
+    assert events[0] == {'event': 'header', 'module': 'tests.modules.factorial', 'function': 'factorial_recursive'}
+    assert events[1] == {
+        'event': 'function',
+        'id': 0,
+        'module': 'tests.modules.factorial',
+        'name': 'factorial_recursive',
+    }
+    assert [event['value'] for event in events[5:8]] == ['1', '2', '6']
+
+
+def test_jsonlines_exporter_traced_unhandled_error(jsonlines_exporter_and_writer: Tuple[JSONLinesExporter, StringIO]):
+    exporter, contents_writer = jsonlines_exporter_and_writer
+    with raises(ValueError):
+        ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive_check_unhandled, None)
+
+    last_event = loads(contents_writer.getvalue().splitlines()[-1])
+    assert last_event['event'] == 'unhandled_error'
+    assert last_event['class'] == 'ValueError'
+    assert last_event['message'] == 'Value must be a positive integer, got None.'
+
+
+def test_jsonlines_exporter_times_the_tracing_events(jsonlines_exporter_and_writer: Tuple[JSONLinesExporter, StringIO]):
+    exporter, contents_writer = jsonlines_exporter_and_writer
+    exporter.on_header(factorial_recursive.__module__, factorial_recursive.__name__)
+    ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive, 3)
+    exporter.on_footer()
+
+    events = [loads(line) for line in contents_writer.getvalue().splitlines()]
+    tracing_events_ns = [event['ts'] for event in events if event['event'] not in ('header', 'function', 'footer')]
+    assert len(tracing_events_ns) == 6
+    assert tracing_events_ns == sorted(tracing_events_ns)
@@ -0,0 +1,85 @@
+from io import StringIO
+from pathlib import Path
+from pstats import Stats
+
+from pytest import raises
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER
+from pydoctrace.exporters.profile import CallgrindExporter, ProfileExporter, PStatsExporter
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive_check_unhandled, factorial_reduce_multiply
+from tests.modules.fibonacci import fibonacci
+
+
+def _trace(exporter: ProfileExporter, function_to_trace, *args):
+    exporter.on_header(function_to_trace.__module__, function_to_trace.__name__)
+    try:
+        return ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(function_to_trace, *args)
+    finally:
+        exporter.on_footer()
+
+
+def test_profile_exporter_aggregates_recursive_calls():
+    exporter = PStatsExporter(None)
+    exporter.on_header(fibonacci.__module__, fibonacci.__name__)
+    assert ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(fibonacci, 4) == 3
+
+    fibonacci_key = ('tests.modules.fibonacci', 1, 'fibonacci')
+    assert list(exporter.stats_by_function.keys()) == [fibonacci_key]
+    fibonacci_stats = exporter.stats_by_function[fibonacci_key]
+    assert fibonacci_stats.calls == 9
+    assert fibonacci_stats.primitive_calls == 1, 'only the first call is not recursive'
+    assert fibonacci_stats.cumulative_ns == fibonacci_stats.inclusive_ns - sum(
+        interaction_stats.inclusive_ns for interaction_stats in exporter.stats_by_interaction.values()
+    )
+
+    recursive_interaction_stats = exporter.stats_by_interaction[fibonacci_key, fibonacci_key]
+    assert recursive_interaction_stats.calls == 8
+    assert recursive_interaction_stats.primitive_calls == 0
+    assert recursive_interaction_stats.call_line == 6
+
+
+def test_profile_exporter_unstacks_errors():
+    exporter = PStatsExporter(None)
+    with raises(ValueError):
+        ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_recursive_check_unhandled, None)
+
+    assert len(exporter.frames) == 0, 'all the frames must be unstacked'
+    assert all(active_calls == 0 for active_calls in exporter.active_calls_by_function.values())
+
+
+def test_pstats_exporter_is_loadable_by_pstats(tmp_path: Path):
+    stats_file_path = tmp_path / 'factorial.pstats'
+    with PStatsExporter.export_manager_factory(str(stats_file_path)) as exporter:
+        assert _trace(exporter, factorial_reduce_multiply, 4) == 24
+
+    stats = Stats(str(stats_file_path))
+    assert stats.total_calls == 5
+    assert stats.prim_calls == 5
+    multiply_stats = next(
+        function_stats for (_, _, function_name), function_stats in stats.stats.items() if function_name == 'multiply'
+    )
+    primitive_calls, calls, _, _, callers = multiply_stats
+    assert (primitive_calls, calls) == (4, 4)
+    assert [function_name for (_, _, function_name) in callers] == ['factorial_reduce_multiply']
+
+
+def test_callgrind_exporter():
+    exported_contents = StringIO()
+    assert _trace(CallgrindExporter(exported_contents), factorial_reduce_multiply, 4) == 24
+
+    callgrind_lines = exported_contents.getvalue().splitlines()
+    assert callgrind_lines[:5] == [
+        '# callgrind format',
+        'version: 1',
+        'creator: pydoctrace',
+        'positions: line',
+        'events: Nanoseconds',
+    ]
+    # names are compressed: declared once with their id, then referred to by their id
+    assert callgrind_lines[6:8] == ['fl=(1) tests.modules.factorial', 'fn=(1) tests.modules.factorial.multiply']
+    assert callgrind_lines[10:12] == ['fl=(1)', 'fn=(2) tests.modules.factorial.factorial_reduce_multiply']
+    assert callgrind_lines[13:16] == ['cfl=(1)', 'cfn=(1)', 'calls=4 42']
+    # the inclusive cost of the calls is expressed at the line where the calls are made
+    assert callgrind_lines[16].startswith('45 ')
@@ -0,0 +1,126 @@
+from collections import OrderedDict, defaultdict
+from io import StringIO
+from typing import Any
+
+from pytest import mark
+
+from pydoctrace.domain.execution import CallEnd
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+from pydoctrace.exporters.values import (
+    DEFAULT_VALUE_RENDERER,
+    ValueRenderer,
+    ValueRenderingPolicy,
+    with_value_rendering,
+)
+
+
+class UnprintableValue:
+    def __repr__(self) -> str:
+        raise RuntimeError('cannot be printed')
+
+
+class ExpensiveText:
+    """
+    A large object whose str() conversion builds a huge text.
+    """
+
+    def __str__(self) -> str:
+        raise AssertionError('the str() conversion must not be used')
+
+    def __repr__(self) -> str:
+        return 'ExpensiveText()'
+
+
+class Items(list):
+    pass
+
+
+@mark.parametrize(
+    ['value', 'expected_text'],
+    [
+        ('text', 'text'),
+        (3.1426, '3.1426'),
+        (True, 'True'),
+        ((1, 2), '(1, 2)'),
+        ('x' * 300, 'x' * 197 + '...'),
+        (list(range(100)), '[0, 1, 2, 3, 4, 5, ...]'),
+        ({index: index for index in range(10)}, '{0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, ...}'),
+        ([[[1]]], '[[[...]]]'),
+        (b'bytes', "b'bytes'"),
+    ],
+)
+def test_default_value_renderer_render(value: Any, expected_text: str):
+    assert DEFAULT_VALUE_RENDERER.render(value) == expected_text
+
+
+@mark.parametrize(
+    ['value', 'expected_text'],
+    [
+        # the sub-classes of the containers are rendered with the bounds of their parent container
+        (defaultdict(int, {index: index for index in range(100_000)}), '{0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, ...}'),
+        (OrderedDict((index, index) for index in range(100_000)), '{0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 5: 5, ...}'),
+        (Items(range(100_000)), '[0, 1, 2, 3, 4, 5, ...]'),
+        # the other objects are rendered with their repr(), not with their str() conversion
+        (ExpensiveText(), 'ExpensiveText()'),
+    ],
+)
+def test_default_value_renderer_renders_the_other_types_with_bounds(value: Any, expected_text: str):
+    assert DEFAULT_VALUE_RENDERER.render(value) == expected_text
+
+
+def test_value_renderer_renders_the_unprintable_values_with_their_type_name():
+    # the errors raised by repr() are caught by reprlib
+    assert DEFAULT_VALUE_RENDERER.render(UnprintableValue()).startswith('<UnprintableValue instance at 0x')
+
+    value_renderer = ValueRenderer(ValueRenderingPolicy(renderers={UnprintableValue: repr}))
+    assert value_renderer.render(UnprintableValue()) == '<UnprintableValue not rendered: RuntimeError>'
+
+
+def test_value_renderer_bounds_the_bytes():
+    rendered_bytes = ValueRenderer(ValueRenderingPolicy(max_length=30)).render(b'a' * 1000)
+
+    assert rendered_bytes.startswith("b'aaaa")
+    assert len(rendered_bytes) == 30
+
+
+def test_value_renderer_applies_the_repr_limits_per_container_type():
+    value_renderer = ValueRenderer(ValueRenderingPolicy(max_items=2, repr_limits={'maxlist': 4}))
+
+    assert value_renderer.render(list(range(10))) == '[0, 1, 2, 3, ...]'
+    assert value_renderer.render(tuple(range(10))) == '(0, 1, ...)'
+
+
+def test_value_renderer_type_name_only():
+    value_renderer = ValueRenderer(ValueRenderingPolicy(type_name_only=True))
+
+    assert value_renderer.render(list(range(10))) == 'list'
+    assert value_renderer.render(UnprintableValue()) == 'UnprintableValue'
+
+
+def test_value_renderer_uses_the_renderers_along_the_class_hierarchy():
+    value_renderer = ValueRenderer(ValueRenderingPolicy(renderers={dict: lambda value: f'dict of {len(value)}'}))
+
+    assert value_renderer.render(OrderedDict(a=1, b=2)) == 'dict of 2'
+    assert value_renderer.renderers_by_type[OrderedDict] is not None
+    assert value_renderer.render([1]) == '[1]'
+    assert value_renderer.renderers_by_type[list] is None
+
+
+def test_with_value_rendering_creates_an_exporter_class_with_the_value_renderer():
+    exporter_class = with_value_rendering(PlantUMLSequenceExporter, ValueRenderingPolicy(max_length=10))
+
+    assert issubclass(exporter_class, PlantUMLSequenceExporter)
+    assert exporter_class.__name__ == 'PlantUMLSequenceExporter'
+    assert exporter_class(None).format_arg_value('x' * 100) == 'xxxxxxx...'
+    # the rendering of the base class is unchanged
+    assert PlantUMLSequenceExporter(None).format_arg_value('x' * 100) == 'x' * 100
+
+
+def test_jsonlines_exporter_renders_the_returned_values_with_bounds():
+    contents_writer = StringIO()
+    exporter = JSONLinesExporter(contents_writer)
+
+    exporter.on_tracing_end(CallEnd('math_cli.__main__', ('math_cli', '__main__'), 'factorial', 12), list(range(100)))
+
+    assert '"[0, 1, 2, 3, 4, 5, ...]"' in contents_writer.getvalue()
@@ -0,0 +1,60 @@
+from pathlib import Path
+from threading import Thread
+
+from pytest import raises
+
+from pydoctrace.doctrace import trace_to_aggregated_component_puml
+
+from tests.modules.factorial import factorial_recursive_check_unhandled
+
+
+def test_trace_to_aggregated_component_puml(tmp_path: Path):
+    diagram_path = tmp_path / 'factorial-component.puml'
+    traced_factorial = trace_to_aggregated_component_puml(
+        export_file_path_tpl=str(diagram_path), filter_presets=[], flush_interval_seconds=None
+    )(factorial_recursive_check_unhandled)
+
+    # executions in several threads
+    factorial_threads = [Thread(target=traced_factorial, args=(3,)) for _ in range(4)]
+    for factorial_thread in factorial_threads:
+        factorial_thread.start()
+    for factorial_thread in factorial_threads:
+        factorial_thread.join()
+    with raises(ValueError):
+        traced_factorial(None)
+
+    # without a flush interval, the diagram is written on demand (or at exit)
+    assert not diagram_path.exists()
+    traced_factorial.components_accumulator.flush()
+
+    diagram_lines = diagram_path.read_text(encoding='utf8').splitlines()
+    assert "' aggregation of 5 traced executions" in diagram_lines
+    # the arrows are labelled with the numbers of interactions
+    assert (
+        '[tests.modules.factorial.factorial_recursive_check_unhandled] -> '
+        '[tests.modules.factorial.validator.is_positive_int] : x5'
+    ) in diagram_lines
+    assert (
+        '[tests.modules.factorial.factorial_recursive_check_unhandled] <. '
+        '[tests.modules.factorial.validator.is_positive_int] : x4'
+    ) in diagram_lines
+    assert (
+        '[tests.modules.factorial.factorial_recursive] -> [tests.modules.factorial.factorial_recursive] : x8'
+    ) in diagram_lines
+    assert (
+        '[tests.modules.factorial.factorial_recursive_check_unhandled] .up.> '
+        'tests.modules.factorial.UnhandledErrors #line:darkred;text:darkred : ValueError'
+    ) in diagram_lines
+
+
+def test_trace_to_aggregated_component_puml_flushes_periodically(tmp_path: Path):
+    diagram_path = tmp_path / 'factorial-component.puml'
+    traced_factorial = trace_to_aggregated_component_puml(
+        export_file_path_tpl=str(diagram_path), filter_presets=[], flush_interval_seconds=0
+    )(factorial_recursive_check_unhandled)
+
+    assert traced_factorial(2) == 2
+    assert "' aggregation of 1 traced executions" in diagram_path.read_text(encoding='utf8')
+
+    assert traced_factorial(3) == 6
+    assert "' aggregation of 2 traced executions" in diagram_path.read_text(encoding='utf8')
@@ -0,0 +1,216 @@
+import json
+from pathlib import Path
+from typing import List, Tuple
+
+from pydoctrace.arguments import ArgumentsCapture, ArgumentsCapturePolicy, CapturedArguments
+from pydoctrace.callfilter import TRACE_ALL_FILTER, call_filter_factory
+from pydoctrace.callfilter.presets import Preset
+from pydoctrace.doctrace import trace_to_sequence_puml
+from pydoctrace.domain.execution import FunctionDescriptor
+from pydoctrace.exporters import FunctionDescriptorExporter
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.exporters.values import ValueRenderingPolicy
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive, factorial_recursive_check_unhandled
+
+
+class ArgumentsRecorder(FunctionDescriptorExporter):
+    def __init__(self):
+        super().__init__(None)
+        self.arguments: List[Tuple[str, CapturedArguments]] = []
+
+    def on_tracing_start_at(self, *args):
+        pass
+
+    def on_start_call_at(self, *args):
+        pass
+
+    def on_call_arguments_at(self, called: FunctionDescriptor, called_line: int, arguments: CapturedArguments):
+        self.arguments.append((called.function_name, arguments))
+
+    def on_return_at(self, **kwargs):
+        pass
+
+    def on_tracing_end_at(self, *args):
+        pass
+
+
+class CountedCapture(ArgumentsCapture):
+    def __init__(self, policy: ArgumentsCapturePolicy):
+        super().__init__(policy)
+        self.captured_functions: List[str] = []
+
+    def capture(self, frame) -> CapturedArguments:
+        self.captured_functions.append(frame.f_code.co_name)
+        return super().capture(frame)
+
+
+class CountedRendering:
+    renderings_count = 0
+
+    def __repr__(self) -> str:
+        CountedRendering.renderings_count += 1
+        return 'rendered'
+
+
+def all_kinds_of_arguments(positional, *variadic, keyword_only=1, **keywords):
+    pass
+
+
+class Greeter:
+    def greet(self, name: str):
+        pass
+
+
+def many_arguments(a, b, c, d):
+    pass
+
+
+def shout(text: str) -> str:
+    return text.upper()
+
+
+def test_arguments_capture_labels_the_arguments_in_the_signature_order():
+    arguments_capture = ArgumentsCapture(ArgumentsCapturePolicy())
+
+    argument_names = arguments_capture.argument_names(all_kinds_of_arguments.__code__)
+    assert argument_names.names == ('positional', 'variadic', 'keyword_only', 'keywords')
+    assert argument_names.labels == ('positional', '*variadic', 'keyword_only', '**keywords')
+    assert not argument_names.has_omitted_arguments
+
+    # the argument names are computed once per code object
+    assert arguments_capture.argument_names(all_kinds_of_arguments.__code__) is argument_names
+
+
+def test_arguments_capture_ignores_the_instance_of_the_methods():
+    argument_names = ArgumentsCapture(ArgumentsCapturePolicy()).argument_names(Greeter.greet.__code__)
+
+    assert argument_names.labels == ('name',)
+
+
+def test_arguments_capture_bounds_the_number_of_arguments():
+    arguments_capture = ArgumentsCapture(ArgumentsCapturePolicy(max_arguments=2))
+    arguments_recorder = ArgumentsRecorder()
+    ExecutionTracer(arguments_recorder, TRACE_ALL_FILTER, arguments_capture=arguments_capture).runfunc(
+        many_arguments, 1, 2, 3, 4
+    )
+
+    assert [(function_name, arguments.render()) for function_name, arguments in arguments_recorder.arguments] == [
+        ('many_arguments', 'a=1, b=2, ...')
+    ]
+
+
+def test_arguments_capture_bounds_the_rendered_arguments():
+    arguments_capture = ArgumentsCapture(
+        ArgumentsCapturePolicy(max_length=40, value_rendering=ValueRenderingPolicy(max_length=10, max_items=2))
+    )
+    arguments_recorder = ArgumentsRecorder()
+    ExecutionTracer(arguments_recorder, TRACE_ALL_FILTER, arguments_capture=arguments_capture).runfunc(
+        all_kinds_of_arguments, 'x' * 100, list(range(100)), keyword_only={'a': 1, 'b': 2, 'c': 3}, extra='e' * 100
+    )
+
+    (_, arguments), *_ = arguments_recorder.arguments
+    assert arguments.render() == 'positional=xxxxxxx..., *variadic=([0,...'
+
+
+def test_captured_arguments_are_rendered_lazily_and_once():
+    arguments_recorder = ArgumentsRecorder()
+    ExecutionTracer(
+        arguments_recorder, TRACE_ALL_FILTER, arguments_capture=ArgumentsCapture(ArgumentsCapturePolicy())
+    ).runfunc(Greeter().greet, CountedRendering())
+
+    (_, arguments), *_ = arguments_recorder.arguments
+    assert CountedRendering.renderings_count == 0
+    assert str(arguments) == 'name=rendered'
+    assert arguments.render() == 'name=rendered'
+    assert CountedRendering.renderings_count == 1
+    # the references to the argument values are released once rendered
+    assert arguments.values is None
+
+
+def test_arguments_capture_is_restricted_by_its_presets():
+    # captures the arguments of the validator functions only
+    arguments_capture = CountedCapture(
+        ArgumentsCapturePolicy(
+            presets=(Preset(exclude_call=lambda module_parts, *args: module_parts[-1] != 'validator'),)
+        )
+    )
+    arguments_recorder = ArgumentsRecorder()
+    ExecutionTracer(arguments_recorder, TRACE_ALL_FILTER, arguments_capture=arguments_capture).runfunc(
+        factorial_recursive_check_unhandled, 3
+    )
+
+    assert arguments_capture.captured_functions == ['is_positive_int']
+    assert [(function_name, arguments.render()) for function_name, arguments in arguments_recorder.arguments] == [
+        ('is_positive_int', 'value=3')
+    ]
+
+
+def test_arguments_of_the_filtered_calls_are_not_inspected():
+    # traces the first call only
+    call_filter = call_filter_factory((Preset(exclude_call=lambda module_parts, function_name, depth: depth > 0),))
+    arguments_capture = CountedCapture(ArgumentsCapturePolicy())
+    arguments_recorder = ArgumentsRecorder()
+    ExecutionTracer(arguments_recorder, call_filter, arguments_capture=arguments_capture).runfunc(
+        factorial_recursive, 4
+    )
+
+    assert arguments_capture.captured_functions == ['factorial_recursive']
+    assert [(function_name, arguments.render()) for function_name, arguments in arguments_recorder.arguments] == [
+        ('factorial_recursive', 'value=4')
+    ]
+
+
+def test_trace_to_sequence_puml_shows_the_captured_arguments(tmp_path: Path):
+    diagram_path = tmp_path / 'factorial_recursive.puml'
+    traced_factorial = trace_to_sequence_puml(
+        export_file_path_tpl=str(diagram_path), filter_presets=(), capture_arguments=ArgumentsCapturePolicy()
+    )(factorial_recursive)
+
+    assert traced_factorial(2) == 2
+    diagram_contents = diagram_path.read_text(encoding='utf8')
+    assert 'note right: value=2\n' in diagram_contents
+    assert 'note right: value=1\n' in diagram_contents
+
+
+def test_trace_to_sequence_puml_escapes_the_line_breaks_of_the_captured_arguments(tmp_path: Path):
+    diagram_path = tmp_path / 'shout.puml'
+    traced_shout = trace_to_sequence_puml(
+        export_file_path_tpl=str(diagram_path), filter_presets=(), capture_arguments=ArgumentsCapturePolicy()
+    )(shout)
+
+    assert traced_shout('hello\nworld') == 'HELLO\nWORLD'
+    diagram_contents = diagram_path.read_text(encoding='utf8')
+    # the arguments note remains a one-line statement
+    assert 'note right: text=hello\\nworld\n' in diagram_contents
+    assert ': HELLO\\nWORLD\n' in diagram_contents
+
+
+def test_trace_to_sequence_puml_exports_the_captured_arguments_as_jsonlines(tmp_path: Path):
+    jsonlines_path = tmp_path / 'factorial_recursive.jsonl'
+    traced_factorial = trace_to_sequence_puml(
+        export_file_path_tpl=str(jsonlines_path),
+        exporter_class=JSONLinesExporter,
+        filter_presets=(),
+        capture_arguments=ArgumentsCapturePolicy(),
+    )(factorial_recursive)
+
+    assert traced_factorial(2) == 2
+    events = [json.loads(line) for line in jsonlines_path.read_text(encoding='utf8').splitlines()]
+    assert [
+        {key: value for key, value in event.items() if key != 'ts'} for event in events if event['event'] == 'arguments'
+    ] == [
+        {'event': 'arguments', 'called': 0, 'called_line': 6, 'arguments': 'value=2'},
+        {'event': 'arguments', 'called': 0, 'called_line': 6, 'arguments': 'value=1'},
+    ]
+
+
+def test_trace_to_sequence_puml_does_not_capture_the_arguments_by_default(tmp_path: Path):
+    diagram_path = tmp_path / 'factorial_recursive.puml'
+    traced_factorial = trace_to_sequence_puml(export_file_path_tpl=str(diagram_path), filter_presets=())(
+        factorial_recursive
+    )
+
+    assert traced_factorial(2) == 2
+    assert 'value=' not in diagram_path.read_text(encoding='utf8')
@@ -0,0 +1,119 @@
+from pathlib import Path
+from time import sleep
+from typing import List
+
+from pytest import CaptureFixture, mark
+
+from pydoctrace.batch import BatchExportResult, batch_export_recordings
+from pydoctrace.callfilter.presets import TRACE_ALL_PRESET
+from pydoctrace.cli import main
+from pydoctrace.doctrace import trace_to_sequence_puml
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.settings import ExportSettings
+
+from tests.modules.fibonacci import fibonacci
+
+
+def _record_fibonacci(recordings_dir: Path, values: List[int]) -> List[str]:
+    recording_paths = []
+    for value in values:
+        recording_path = recordings_dir / f'fibonacci-{value}.jsonl'
+        trace_to_sequence_puml(
+            export_file_path_tpl=str(recording_path),
+            exporter_class=JSONLinesExporter,
+            filter_presets=[TRACE_ALL_PRESET],
+        )(fibonacci)(value)
+        recording_paths.append(str(recording_path))
+
+    return recording_paths
+
+
+@mark.parametrize('max_workers', [1, 2])
+def test_batch_export_recordings(tmp_path: Path, max_workers: int):
+    recording_paths = _record_fibonacci(tmp_path / 'recordings', [2, 3, 4])
+    recording_paths.insert(1, str(tmp_path / 'missing.jsonl'))
+
+    reported_results: List[BatchExportResult] = []
+    export_results = batch_export_recordings(
+        recording_paths,
+        ExportSettings(exporter_names=['component'], preset_names=['trace-all'], output_dir=str(tmp_path / 'doc')),
+        max_workers,
+        reported_results.append,
+    )
+
+    # the results are reported and returned in the order of the recordings
+    assert reported_results == export_results
+    assert [export_result.recording_path for export_result in export_results] == recording_paths
+    assert [export_result.error is None for export_result in export_results] == [True, False, True, True]
+    assert export_results[1].error.startswith('FileNotFoundError: ')
+
+    # the exported files are named after the recordings
+    assert sorted(path.name for path in (tmp_path / 'doc').iterdir()) == [
+        'fibonacci-2-component.puml',
+        'fibonacci-3-component.puml',
+        'fibonacci-4-component.puml',
+    ]
+
+
+@mark.parametrize('max_workers', [1, 2])
+def test_batch_export_recordings_fails_the_recordings_exported_in_the_same_files(tmp_path: Path, max_workers: int):
+    recording_paths = [
+        *_record_fibonacci(tmp_path / 'recordings', [2, 3]),
+        *_record_fibonacci(tmp_path / 'other-recordings', [2]),
+    ]
+
+    export_results = batch_export_recordings(
+        recording_paths,
+        ExportSettings(exporter_names=['component'], preset_names=['trace-all'], output_dir=str(tmp_path / 'doc')),
+        max_workers,
+    )
+
+    assert [export_result.recording_path for export_result in export_results] == recording_paths
+    assert [export_result.error is None for export_result in export_results] == [False, True, False]
+    colliding_error = (
+        f'ValueError: {tmp_path / "doc" / "fibonacci-2-component.puml"} would be exported by '
+        f'{recording_paths[0]}, {recording_paths[2]}'
+    )
+    assert export_results[0].error == colliding_error
+    assert export_results[2].error == colliding_error
+    assert [path.name for path in (tmp_path / 'doc').iterdir()] == ['fibonacci-3-component.puml']
+
+
+def _slow_fibonacci(value: int) -> int:
+    sleep(0.05)
+    return fibonacci(value)
+
+
+@mark.parametrize('max_workers', [1, 2])
+def test_batch_export_recordings_exports_the_recorded_durations(tmp_path: Path, max_workers: int):
+    recording_path = tmp_path / 'recordings' / 'slow-fibonacci.jsonl'
+    trace_to_sequence_puml(
+        export_file_path_tpl=str(recording_path), exporter_class=JSONLinesExporter, filter_presets=[TRACE_ALL_PRESET]
+    )(_slow_fibonacci)(3)
+
+    export_results = batch_export_recordings(
+        [str(recording_path)],
+        ExportSettings(exporter_names=['folded-time'], preset_names=['trace-all'], output_dir=str(tmp_path / 'doc')),
+        max_workers,
+    )
+
+    assert export_results == [BatchExportResult(str(recording_path))]
+    # the self time of the slow function (in microseconds) is the recorded one, not the one of the replay
+    weights_by_stack = dict(
+        line.rsplit(' ', 1)
+        for line in (tmp_path / 'doc' / 'slow-fibonacci-time.folded').read_text(encoding='utf8').splitlines()
+    )
+    assert int(weights_by_stack[f'{__name__}._slow_fibonacci']) >= 50_000
+
+
+def test_export_command_reports_the_progress_and_the_failures(tmp_path: Path, capsys: CaptureFixture):
+    recording_paths = _record_fibonacci(tmp_path, [2])
+    missing_recording_path = str(tmp_path / 'missing.jsonl')
+
+    assert main(['export', '-j', '2', '-o', str(tmp_path / 'doc'), *recording_paths, missing_recording_path]) == 1
+
+    error_lines = capsys.readouterr().err.splitlines()
+    assert error_lines[0] == f'[1/2] {recording_paths[0]}: ok'
+    assert error_lines[1].startswith(f'[2/2] {missing_recording_path}: failed (FileNotFoundError: ')
+    assert error_lines[2] == '1 exported, 1 failed'
+    assert error_lines[3].startswith(f'- {missing_recording_path}: FileNotFoundError: ')
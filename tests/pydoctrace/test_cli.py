@@ -0,0 +1,113 @@
+import sys
+from json import loads
+from pathlib import Path
+
+from pytest import mark, raises
+
+from pydoctrace.callfilter.presets import EXCLUDE_STDLIB_PRESET, TRACE_ALL_PRESET
+from pydoctrace.cli import main, trace_parser_factory
+from pydoctrace.doctrace import DEFAULT_FILTERS
+from pydoctrace.settings import filter_presets_from_settings
+
+SCRIPT_CONTENTS = """import sys
+
+from tests.modules.factorial import factorial_recursive
+
+
+def compute():
+    return factorial_recursive(int(sys.argv[1]))
+
+
+if compute() != 6:
+    sys.exit(2)
+"""
+
+
+def _read_jsonlines_events(jsonlines_path: Path):
+    with open(jsonlines_path, encoding='utf8') as jsonlines_file:
+        return [loads(line) for line in jsonlines_file]
+
+
+@mark.parametrize(
+    ['argv', 'expected_presets_count'],
+    [
+        (['script.py'], len(DEFAULT_FILTERS)),
+        (['-p', 'trace-all', 'script.py'], 1),
+        (['-p', 'exclude-stdlib', '-p', 'exclude-tests', '--max-depth', '3', 'script.py'], 3),
+    ],
+)
+def test_filter_presets_from_settings(argv, expected_presets_count: int):
+    filter_presets = filter_presets_from_settings(trace_parser_factory().parse_args(argv))
+    assert len(filter_presets) == expected_presets_count
+
+
+def test_trace_parser_passes_the_remaining_arguments_to_the_target():
+    args = trace_parser_factory().parse_args(['--component', '-m', 'package.module', '--verbose', '-p', 'value'])
+    assert args.run_module
+    assert args.target == 'package.module'
+    assert args.arguments == ['--verbose', '-p', 'value']
+    assert args.exporter_names == ['component']
+    assert args.preset_names is None
+    assert filter_presets_from_settings(args) == DEFAULT_FILTERS
+
+
+def test_main_traces_a_script(tmp_path: Path):
+    script_path = tmp_path / 'compute_factorial.py'
+    script_path.write_text(SCRIPT_CONTENTS, encoding='utf8')
+    original_argv = sys.argv
+
+    output_dir = tmp_path / 'doc'
+    assert (
+        main(['--sequence', '-e', 'jsonl', '-p', 'exclude-stdlib', '-o', str(output_dir), str(script_path), '3']) == 0
+    )
+    assert sys.argv is original_argv, 'the arguments of the command must be restored'
+
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        'compute_factorial-sequence.puml',
+        'compute_factorial.jsonl',
+    ]
+    events = _read_jsonlines_events(output_dir / 'compute_factorial.jsonl')
+    assert events[0] == {'event': 'header', 'module': '__main__', 'function': 'compute_factorial'}
+    traced_function_names = {event['name'] for event in events if event['event'] == 'function'}
+    assert {'<module>', 'compute', 'factorial_recursive'} <= traced_function_names
+    assert events[-2]['event'] == 'end'
+
+
+def test_main_propagates_the_exit_of_the_script(tmp_path: Path):
+    script_path = tmp_path / 'compute_factorial.py'
+    script_path.write_text(SCRIPT_CONTENTS, encoding='utf8')
+
+    with raises(SystemExit) as system_exit:
+        main(['-e', 'jsonl', '-o', str(tmp_path), str(script_path), '4'])
+    assert system_exit.value.code == 2
+
+    # the execution is exported anyway
+    events = _read_jsonlines_events(tmp_path / 'compute_factorial.jsonl')
+    assert events[-2]['event'] == 'unhandled_error'
+    assert events[-2]['class'] == 'SystemExit'
+
+
+def test_main_traces_a_module(tmp_path: Path):
+    assert main(['-e', 'jsonl', '-p', 'trace-all', '-o', str(tmp_path), '-m', 'tests.modules.ecoindex']) == 0
+
+    events = _read_jsonlines_events(tmp_path / 'tests.modules.ecoindex.jsonl')
+    assert events[0] == {'event': 'header', 'module': '__main__', 'function': 'tests.modules.ecoindex'}
+
+
+def test_presets_by_name():
+    assert filter_presets_from_settings(trace_parser_factory().parse_args(['-p', 'trace-all', 'script.py'])) == (
+        TRACE_ALL_PRESET,
+    )
+    filter_presets = filter_presets_from_settings(
+        trace_parser_factory().parse_args(['-p', 'exclude-stdlib', '--max-depth', '2', 'script.py'])
+    )
+    assert filter_presets[0] is EXCLUDE_STDLIB_PRESET
+    assert filter_presets[1].exclude_call(('module',), 'function', 3)
+    assert not filter_presets[1].exclude_call(('module',), 'function', 2)
+
+
+def test_main_reports_the_tracing_stats(tmp_path: Path, capsys):
+    assert main(['--stats', '-p', 'trace-all', '-o', str(tmp_path), '-m', 'tests.modules.ecoindex']) == 0
+
+    assert capsys.readouterr().err.startswith('tracing statistics:\nevents: call=')
+    assert "/' tracing statistics" in (tmp_path / 'tests.modules.ecoindex-sequence.puml').read_text(encoding='utf8')
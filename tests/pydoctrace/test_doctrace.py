@@ -1,16 +1,23 @@
-from pytest import mark
+from json import loads
+from pathlib import Path
+from sys import gettrace
 
+from pytest import mark, raises
+
+from pydoctrace import trace
 from pydoctrace.callfilter import FILTER_OUT_STDLIB, TRACE_ALL_FILTER
-from pydoctrace.callfilter.presets import EXCLUDE_CALL_DEPTH_PRESET_FACTORY
-from pydoctrace.doctrace import trace_to_component_puml, trace_to_sequence_puml
+from pydoctrace.callfilter.presets import EXCLUDE_CALL_DEPTH_PRESET_FACTORY, TRACE_ALL_PRESET
+from pydoctrace.doctrace import trace_to_component_puml, trace_to_puml, trace_to_sequence_puml
+from pydoctrace.exporters import ExportTarget
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
 from pydoctrace.exporters.plantuml.component import PlantUMLComponentExporter
 from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
 from pydoctrace.tracer import ExecutionTracer
 
 from tests import TESTS_FOLDER
-from tests.integrations import integration_test
+from tests.integrations import TESTS_INTEGRATIONS_FOLDER, integration_test
 from tests.integrations.calldepth import depth_1
-from tests.modules.factorial import factorial_recursive
+from tests.modules.factorial import factorial_recursive, factorial_recursive_check_unhandled
 
 
 @mark.parametrize(
@@ -104,3 +111,103 @@ def test_tracer_component_without_stdlib_modules():
             assert result == 720
         finally:
             exporter.on_footer()
+
+
+def test_trace_to_puml_exports_one_execution_with_several_exporters(tmp_path: Path):
+    traced_factorial_recursive = trace_to_puml(
+        exporters=[
+            ExportTarget(PlantUMLSequenceExporter, str(tmp_path / '${function_name}-sequence.puml')),
+            ExportTarget(PlantUMLComponentExporter, str(tmp_path / '${function_name}-component.puml')),
+        ],
+        filter_presets=[TRACE_ALL_PRESET],
+    )(factorial_recursive)
+
+    assert traced_factorial_recursive(6) == 720
+
+    for suffix in ('sequence', 'component'):
+        expected_contents_path = (
+            TESTS_INTEGRATIONS_FOLDER / 'factorial' / f'test_factorial_recursive-6-720-{suffix}.puml'
+        )
+        assert (tmp_path / f'factorial_recursive-{suffix}.puml').read_text(encoding='utf8') == (
+            expected_contents_path.read_text(encoding='utf8')
+        )
+
+
+def test_trace_to_puml_requires_an_exporter():
+    with raises(ValueError):
+        trace_to_puml(exporters=[])
+
+
+def _read_jsonlines_events(jsonlines_path: Path):
+    with open(jsonlines_path, encoding='utf8') as jsonlines_file:
+        return [loads(line) for line in jsonlines_file]
+
+
+def test_trace_block(tmp_path: Path):
+    tracing_function = gettrace()
+
+    def compute_factorials():
+        with trace(
+            exporters=[ExportTarget(JSONLinesExporter, str(tmp_path / '${function_name}.jsonl'))],
+            filter_presets=[TRACE_ALL_PRESET],
+        ):
+            factorial_2 = factorial_recursive(2)
+
+        # not traced
+        factorial_3 = factorial_recursive(3)
+
+        return factorial_2, factorial_3
+
+    assert compute_factorials() == (2, 6)
+    assert gettrace() is tracing_function, 'the previous tracing function must be restored'
+
+    events = _read_jsonlines_events(tmp_path / 'compute_factorials.jsonl')
+    assert [event['event'] for event in events] == [
+        'header',
+        'function',
+        'start',
+        'function',
+        'call',
+        'call',
+        'return',
+        'return',
+        'end',
+        'footer',
+    ]
+    assert events[0]['function'] == 'compute_factorials'
+    assert events[1]['name'] == 'compute_factorials'
+    assert events[3]['name'] == 'factorial_recursive'
+
+
+def test_trace_block_with_unhandled_error(tmp_path: Path):
+    def compute_factorial():
+        with trace(
+            exporters=[ExportTarget(JSONLinesExporter, str(tmp_path / '${function_name}.jsonl'))],
+            filter_presets=[],
+        ):
+            return factorial_recursive_check_unhandled(None)
+
+    with raises(ValueError):
+        compute_factorial()
+
+    events = _read_jsonlines_events(tmp_path / 'compute_factorial.jsonl')
+    assert events[-2]['event'] == 'unhandled_error'
+    assert events[-2]['class'] == 'ValueError'
+    assert events[-1]['event'] == 'footer'
+
+
+def test_trace_if_predicate(tmp_path: Path):
+    diagram_path = tmp_path / 'factorial.jsonl'
+    traced_factorial = trace_to_sequence_puml(
+        export_file_path_tpl=str(diagram_path),
+        exporter_class=JSONLinesExporter,
+        filter_presets=[TRACE_ALL_PRESET],
+        trace_if=lambda value: value >= 4,
+    )(factorial_recursive)
+
+    assert traced_factorial(3) == 6
+    assert not diagram_path.exists(), 'the calls not matching the predicate must not be traced'
+
+    assert traced_factorial(4) == 24
+    events = _read_jsonlines_events(diagram_path)
+    assert len([event for event in events if event['event'] == 'call']) == 3
@@ -11,6 +11,7 @@ from pytest import fixture, mark
 from pydoctrace.callfilter.presets import TRACE_ALL_PRESET
 from pydoctrace.doctrace import context_factory, trace_to_component_puml, trace_to_sequence_puml
 from pydoctrace.exporters import Exporter
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
 
 from tests.integrations import TESTS_INTEGRATIONS_FOLDER
 from tests.integrations.calldepth import depth_1
@@ -160,3 +161,25 @@ def test_trace_with_dynamic_filename(
     ecoindex_score = decorated_ecoindex(dom_elements_nb=960, requests_nb=70, size_kb=1500)
 
     assert abs(ecoindex_score - 41.234) < 0.001
+
+
+def test_export_manager_factory_recreates_removed_directories(tmp_path: Path):
+    """
+    The directories of the export files are created once, and recreated if they were removed in the meantime.
+    """
+    export_file_path = tmp_path / 'doc' / 'depth_1.jsonl'
+    for _ in range(2):
+        with JSONLinesExporter.export_manager_factory(str(export_file_path)) as exporter:
+            exporter.on_header('tests.integrations.calldepth', 'depth_1')
+        assert export_file_path.exists()
+
+        export_file_path.unlink()
+        export_file_path.parent.rmdir()
+
+
+def test_export_manager_factory_exposes_the_resolved_export_file_path(tmp_path: Path):
+    with JSONLinesExporter.export_manager_factory(str(tmp_path / 'depth_1-${datetime_millis}.jsonl')) as exporter:
+        exporter.on_header('tests.integrations.calldepth', 'depth_1')
+
+    assert '$' not in exporter.export_file_path
+    assert [file_path.name for file_path in tmp_path.iterdir()] == [Path(exporter.export_file_path).name]
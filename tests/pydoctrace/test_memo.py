@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from pytest import raises
+
+from pydoctrace.callfilter.presets import TRACE_ALL_PRESET
+from pydoctrace.doctrace import trace_to_sequence_puml
+from pydoctrace.memo import ExportedKeysMemo
+
+from tests.modules.factorial import factorial_recursive
+
+
+def test_exported_keys_memo_discards_the_least_recently_used_keys():
+    exported_keys_memo = ExportedKeysMemo(2)
+    exported_keys_memo.add('a')
+    exported_keys_memo.add('b')
+    assert 'a' in exported_keys_memo, "'a' becomes the most recently used key"
+
+    exported_keys_memo.add('c')
+    assert len(exported_keys_memo) == 2
+    assert 'b' not in exported_keys_memo
+    assert 'a' in exported_keys_memo
+    assert 'c' in exported_keys_memo
+
+
+def test_exported_keys_memo_requires_a_size():
+    with raises(ValueError):
+        ExportedKeysMemo(0)
+
+
+def test_trace_to_sequence_puml_memoizes_the_exports(tmp_path: Path):
+    traced_factorial = trace_to_sequence_puml(
+        export_file_path_tpl=str(tmp_path / 'factorial.puml'),
+        filter_presets=[TRACE_ALL_PRESET],
+        memo_key=lambda value: value,
+    )(factorial_recursive)
+
+    exported_values = []
+    for value in (3, 3, 4, 3, 4):
+        assert traced_factorial(value) == factorial_recursive(value)
+        diagram_path = tmp_path / 'factorial.puml'
+        if diagram_path.exists():
+            exported_values.append(value)
+            diagram_path.unlink()
+
+    assert exported_values == [3, 4]
@@ -0,0 +1,159 @@
+import gzip
+from contextlib import suppress
+from io import StringIO
+from pathlib import Path
+from re import sub
+from time import sleep
+from typing import Callable, Iterable, List, Tuple, Type
+
+from pytest import mark
+
+from pydoctrace.callfilter import Preset, call_filter_factory
+from pydoctrace.callfilter.presets import EXCLUDE_CALL_DEPTH_PRESET_FACTORY, TRACE_ALL_PRESET
+from pydoctrace.cli import main
+from pydoctrace.exporters import Exporter
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.exporters.plantuml.component import PlantUMLComponentExporter
+from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+from pydoctrace.replay import RecordedTraceReplayer, read_recorded_events
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive_check_unhandled, factorial_with_checker
+from tests.modules.fibonacci import fibonacci
+
+EXCLUDE_IS_POSITIVE_INT_PRESET = Preset(
+    exclude_call=lambda module_parts, function_name, *args: function_name == 'is_positive_int'
+)
+
+
+def _trace(exporter_class: Type[Exporter], filter_presets: Iterable[Preset], function_to_trace: Callable, *args) -> str:
+    exported_contents = StringIO()
+    exporter = exporter_class(exported_contents)
+    exporter.on_header(function_to_trace.__module__, function_to_trace.__name__)
+    # some traced functions raise errors on purpose
+    with suppress(ValueError):
+        ExecutionTracer(exporter, call_filter_factory(filter_presets)).runfunc(function_to_trace, *args)
+    exporter.on_footer()
+
+    return exported_contents.getvalue()
+
+
+def _untimed(exported_contents: str) -> str:
+    """
+    Removes the times of the recorded events, which differ from a tracing to another.
+    """
+    return sub(r'"ts":\d+,', '', exported_contents)
+
+
+def _replay(recording: str, exporter_class: Type[Exporter], filter_presets: Iterable[Preset]) -> str:
+    events = read_recorded_events(recording.splitlines())
+    header = next(events)
+
+    exported_contents = StringIO()
+    exporter = exporter_class(exported_contents)
+    exporter.on_header(header['module'], header['function'])
+    RecordedTraceReplayer(exporter, call_filter_factory(filter_presets)).replay(events)
+    exporter.on_footer()
+
+    return exported_contents.getvalue()
+
+
+@mark.parametrize('exporter_class', [JSONLinesExporter, PlantUMLSequenceExporter, PlantUMLComponentExporter])
+@mark.parametrize(
+    ['filter_presets', 'function_to_trace', 'args'],
+    [
+        ([TRACE_ALL_PRESET], fibonacci, (4,)),
+        ([TRACE_ALL_PRESET], factorial_recursive_check_unhandled, (None,)),
+        ([TRACE_ALL_PRESET], factorial_with_checker, (-1,)),
+        # filtering after the fact produces the same export as filtering while tracing
+        ([EXCLUDE_CALL_DEPTH_PRESET_FACTORY(2)], fibonacci, (5,)),
+        ([EXCLUDE_IS_POSITIVE_INT_PRESET], factorial_recursive_check_unhandled, (3,)),
+        ([EXCLUDE_IS_POSITIVE_INT_PRESET], factorial_recursive_check_unhandled, (None,)),
+    ],
+)
+def test_replay_exports_like_the_tracer(
+    exporter_class: Type[Exporter], filter_presets: Iterable[Preset], function_to_trace: Callable, args: Tuple
+):
+    recording = _trace(JSONLinesExporter, [TRACE_ALL_PRESET], function_to_trace, *args)
+
+    assert _untimed(_replay(recording, exporter_class, filter_presets)) == _untimed(
+        _trace(exporter_class, filter_presets, function_to_trace, *args)
+    )
+
+
+def test_replay_restores_the_recorded_times_of_the_events():
+    recording = _trace(JSONLinesExporter, [TRACE_ALL_PRESET], factorial_with_checker, -1)
+
+    assert '"ts":' in recording
+    assert _replay(recording, JSONLinesExporter, [TRACE_ALL_PRESET]) == recording
+
+
+def _return_caller_lines(recording: str) -> List[int]:
+    return [
+        event['caller_line'] for event in read_recorded_events(recording.splitlines()) if event['event'] == 'return'
+    ]
+
+
+@mark.parametrize('filter_presets', [[TRACE_ALL_PRESET], [EXCLUDE_IS_POSITIVE_INT_PRESET]])
+def test_replay_returns_to_the_recorded_caller_lines(filter_presets: Iterable[Preset]):
+    recording = _trace(JSONLinesExporter, [TRACE_ALL_PRESET], factorial_recursive_check_unhandled, 3)
+    traced_recording = _trace(JSONLinesExporter, filter_presets, factorial_recursive_check_unhandled, 3)
+    replayed_recording = _replay(recording, JSONLinesExporter, filter_presets)
+
+    # the callers are at the lines of their calls when the callees return, not at the lines of their definitions
+    function_definition_line = factorial_recursive_check_unhandled.__code__.co_firstlineno
+    assert function_definition_line not in _return_caller_lines(traced_recording)
+    assert _return_caller_lines(replayed_recording) == _return_caller_lines(traced_recording)
+
+
+def _record(recording_path: Path):
+    recording = _trace(JSONLinesExporter, [TRACE_ALL_PRESET], fibonacci, 4)
+    if recording_path.suffix == '.gz':
+        with gzip.open(recording_path, 'wt', encoding='utf8') as recording_file:
+            recording_file.write(recording)
+    else:
+        recording_path.write_text(recording, encoding='utf8')
+
+
+@mark.parametrize('recording_filename', ['fibonacci.jsonl', 'fibonacci.jsonl.gz'])
+def test_export_command(tmp_path: Path, recording_filename: str):
+    recording_path = tmp_path / recording_filename
+    _record(recording_path)
+
+    output_dir = tmp_path / 'doc'
+    assert (
+        main(['export', '--component', '-p', 'trace-all', '-j', '1', '-o', str(output_dir), str(recording_path)]) == 0
+    )
+
+    component_diagram = (output_dir / 'fibonacci-component.puml').read_text(encoding='utf8')
+    assert component_diagram == _trace(PlantUMLComponentExporter, [TRACE_ALL_PRESET], fibonacci, 4)
+
+
+def _slow_fibonacci(value: int) -> int:
+    sleep(0.05)
+    return fibonacci(value)
+
+
+def test_export_command_exports_the_recorded_durations(tmp_path: Path):
+    recording_path = tmp_path / 'slow-fibonacci.jsonl'
+    recording_path.write_text(_trace(JSONLinesExporter, [TRACE_ALL_PRESET], _slow_fibonacci, 2), encoding='utf8')
+
+    output_dir = tmp_path / 'doc'
+    assert (
+        main(['export', '-e', 'folded-time', '-p', 'trace-all', '-j', '1', '-o', str(output_dir), str(recording_path)])
+        == 0
+    )
+
+    # the self time of the slow function (in microseconds) is the recorded one, not the one of the replay
+    weights_by_stack = dict(
+        line.rsplit(' ', 1)
+        for line in (output_dir / 'slow-fibonacci-time.folded').read_text(encoding='utf8').splitlines()
+    )
+    assert int(weights_by_stack[f'{__name__}._slow_fibonacci']) >= 50_000
+
+
+def test_export_command_requires_a_header(tmp_path: Path):
+    recording_path = tmp_path / 'no-header.jsonl'
+    recording_path.write_text('{"event":"footer"}\n', encoding='utf8')
+
+    assert main(['export', '-j', '1', '-o', str(tmp_path), str(recording_path)]) == 1
@@ -0,0 +1,90 @@
+from pathlib import Path
+from time import sleep
+
+from pydoctrace.doctrace import trace_to_sequence_puml
+from pydoctrace.retention import ExportedFilesIndex, RetentionPolicy
+
+from tests.modules.factorial import factorial_recursive
+
+
+def _write_file(file_path: Path, size_in_bytes: int) -> str:
+    file_path.write_bytes(b'.' * size_in_bytes)
+    return str(file_path)
+
+
+def test_exported_files_index_keeps_the_last_files(tmp_path: Path):
+    exported_files_index = ExportedFilesIndex(RetentionPolicy(max_files=2))
+    for file_index in range(4):
+        exported_files_index.add_exported_file(_write_file(tmp_path / f'{file_index}.puml', 10))
+
+    assert sorted(file_path.name for file_path in tmp_path.iterdir()) == ['2.puml', '3.puml']
+    assert list(exported_files_index.exported_files) == [str(tmp_path / '2.puml'), str(tmp_path / '3.puml')]
+    assert exported_files_index.total_bytes == 20
+
+
+def test_exported_files_index_limits_the_total_size(tmp_path: Path):
+    exported_files_index = ExportedFilesIndex(RetentionPolicy(max_total_bytes=25))
+    for file_index, size_in_bytes in enumerate((10, 10, 10, 30)):
+        exported_files_index.add_exported_file(_write_file(tmp_path / f'{file_index}.puml', size_in_bytes))
+
+    # the file which has just been written is kept even if it exceeds the limit on its own
+    assert [file_path.name for file_path in tmp_path.iterdir()] == ['3.puml']
+    assert exported_files_index.total_bytes == 30
+
+
+def test_exported_files_index_limits_the_age(tmp_path: Path):
+    exported_files_index = ExportedFilesIndex(RetentionPolicy(max_age_seconds=0.05))
+    exported_files_index.add_exported_file(_write_file(tmp_path / 'old.puml', 10))
+    exported_files_index.add_exported_file(_write_file(tmp_path / 'recent.puml', 10))
+    assert len(list(tmp_path.iterdir())) == 2
+
+    sleep(0.1)
+    exported_files_index.add_exported_file(_write_file(tmp_path / 'new.puml', 10))
+    assert [file_path.name for file_path in tmp_path.iterdir()] == ['new.puml']
+
+
+def test_exported_files_index_handles_overwritten_files(tmp_path: Path):
+    exported_files_index = ExportedFilesIndex(RetentionPolicy(max_files=1))
+    exported_files_index.add_exported_file(_write_file(tmp_path / 'same.puml', 10))
+    exported_files_index.add_exported_file(_write_file(tmp_path / 'same.puml', 15))
+
+    assert [file_path.name for file_path in tmp_path.iterdir()] == ['same.puml']
+    assert exported_files_index.total_bytes == 15
+
+
+def test_trace_to_sequence_puml_with_retention_policy(tmp_path: Path):
+    traced_factorial = trace_to_sequence_puml(
+        export_file_path_tpl=str(tmp_path / 'factorial-${datetime_millis}.puml'),
+        retention_policy=RetentionPolicy(max_files=2),
+    )(factorial_recursive)
+
+    for _ in range(4):
+        assert traced_factorial(3) == 6
+        # ensures distinct file names
+        sleep(0.002)
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_exported_files_index_ignores_the_removed_files(tmp_path: Path):
+    exported_files_index = ExportedFilesIndex(RetentionPolicy(max_files=1))
+    exported_files_index.add_exported_file(str(tmp_path / 'removed.puml'))
+
+    assert exported_files_index.exported_files == {}
+    assert exported_files_index.total_bytes == 0
+
+
+def test_retention_failures_do_not_mask_the_traced_function_outcome(tmp_path: Path, monkeypatch):
+    def failing_remove(file_path: str):
+        raise PermissionError(file_path)
+
+    monkeypatch.setattr('pydoctrace.retention.remove', failing_remove)
+    traced_factorial = trace_to_sequence_puml(
+        export_file_path_tpl=str(tmp_path / 'factorial-${datetime_millis}.puml'),
+        retention_policy=RetentionPolicy(max_files=1),
+    )(factorial_recursive)
+
+    for _ in range(2):
+        assert traced_factorial(3) == 6
+        # ensures distinct file names
+        sleep(0.002)
@@ -0,0 +1,118 @@
+from io import StringIO
+from pathlib import Path
+from time import sleep
+
+from pytest import MonkeyPatch, raises
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER, call_filter_factory
+from pydoctrace.callfilter.presets import EXCLUDE_TESTS_PRESET, Preset
+from pydoctrace.doctrace import trace_to_puml
+from pydoctrace.exporters import ExportTarget
+from pydoctrace.exporters.plantuml.component import PlantUMLComponentExporter
+from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+from pydoctrace.stats import InstrumentedCallFilter, TracingStats
+from pydoctrace.tracer import ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive, factorial_recursive_check_unhandled
+from tests.modules.fibonacci import fibonacci
+
+
+def test_tracer_collects_stats():
+    tracing_stats = TracingStats()
+    exporter = PlantUMLSequenceExporter(StringIO())
+    assert ExecutionTracer(exporter, TRACE_ALL_FILTER, tracing_stats).runfunc(fibonacci, 4) == 3
+
+    # fibonacci(4) calls itself 8 times
+    assert tracing_stats.events_by_kind['call'] == 9
+    assert tracing_stats.events_by_kind['return'] == 9
+    assert tracing_stats.filtered_calls_by_preset == {}
+    assert tracing_stats.exporter_events_by_hook == {
+        'on_tracing_start': 1,
+        'on_start_call': 8,
+        'on_return': 8,
+        'on_tracing_end': 1,
+    }
+    assert tracing_stats.peak_depth == 4
+    assert tracing_stats.tracing_ns >= tracing_stats.filter_ns + tracing_stats.exporter_ns
+    assert tracing_stats.exporter_ns > 0
+
+
+def test_tracer_collects_stats_of_unhandled_errors():
+    tracing_stats = TracingStats()
+    with raises(ValueError):
+        ExecutionTracer(PlantUMLComponentExporter(StringIO()), TRACE_ALL_FILTER, tracing_stats).runfunc(
+            factorial_recursive_check_unhandled, None
+        )
+
+    assert tracing_stats.events_by_kind['exception'] > 0
+    assert tracing_stats.exporter_events_by_hook['on_unhandled_error_end'] == 1
+
+
+def test_tracer_counts_filtered_calls_by_preset():
+    exclude_deep_calls_preset = Preset(exclude_call=lambda module_parts, function_name, call_depth: call_depth >= 2)
+    tracing_stats = TracingStats()
+    ExecutionTracer(
+        PlantUMLSequenceExporter(StringIO()), call_filter_factory((exclude_deep_calls_preset,)), tracing_stats
+    ).runfunc(factorial_recursive, 4)
+    assert tracing_stats.filtered_calls_by_preset == {'preset 1': 2}
+    assert tracing_stats.exporter_events_by_hook['on_start_call'] == 1
+
+    tracing_stats = TracingStats()
+    ExecutionTracer(
+        PlantUMLSequenceExporter(StringIO()), call_filter_factory((EXCLUDE_TESTS_PRESET,)), tracing_stats
+    ).runfunc(factorial_recursive, 4)
+    assert tracing_stats.filtered_calls_by_preset == {'exclude-tests': 4}
+    assert tracing_stats.exporter_events_by_hook == {}
+
+
+def test_tracer_looks_the_excluding_presets_up_out_of_the_tracing_time(monkeypatch: MonkeyPatch):
+    original_excluding_preset_name = InstrumentedCallFilter.excluding_preset_name
+
+    def slow_excluding_preset_name(*args) -> str:
+        sleep(0.02)
+        return original_excluding_preset_name(*args)
+
+    monkeypatch.setattr(InstrumentedCallFilter, 'excluding_preset_name', slow_excluding_preset_name)
+    tracing_stats = TracingStats()
+    ExecutionTracer(
+        PlantUMLSequenceExporter(StringIO()), call_filter_factory((EXCLUDE_TESTS_PRESET,)), tracing_stats
+    ).runfunc(factorial_recursive, 4)
+
+    assert tracing_stats.filtered_calls_by_preset == {'exclude-tests': 4}
+    # the lookups of the 4 filtered calls (80ms) are not counted in the tracing time
+    assert tracing_stats.tracing_ns < 20_000_000
+
+
+def test_plantuml_exporters_write_the_stats_before_the_footer():
+    tracing_stats = TracingStats()
+    tracing_stats.events_by_kind['call'] = 3
+    tracing_stats.peak_depth = 2
+
+    for exporter_class in (PlantUMLSequenceExporter, PlantUMLComponentExporter):
+        exported_contents = StringIO()
+        exporter = exporter_class(exported_contents)
+        exporter.on_header('tests.modules.fibonacci', 'fibonacci')
+        exporter.on_tracing_stats(tracing_stats)
+        exporter.on_footer()
+
+        exported_text = exported_contents.getvalue()
+        stats_comment = exported_text[exported_text.index("/' tracing statistics") : exported_text.index("'/")]
+        assert 'events: call=3\n' in stats_comment
+        assert 'peak depth: 2\n' in stats_comment
+        assert exported_text.index("'/") < exported_text.index('@enduml')
+
+
+def test_trace_to_puml_writes_the_tracing_stats(tmp_path: Path):
+    @trace_to_puml(
+        exporters=[ExportTarget(PlantUMLSequenceExporter, str(tmp_path / '${function_name}-sequence.puml'))],
+        filter_presets=[],
+        tracing_stats=True,
+    )
+    def traced_fibonacci(index: int) -> int:
+        return fibonacci(index)
+
+    assert traced_fibonacci(3) == 2
+
+    exported_text = (tmp_path / 'traced_fibonacci-sequence.puml').read_text(encoding='utf8')
+    assert "/' tracing statistics\nevents: call=6, " in exported_text
+    assert '\npeak depth: 4\n' in exported_text
@@ -0,0 +1,168 @@
+import signal
+from os import getpid, kill
+from pathlib import Path
+from sys import gettrace
+from typing import Callable, Iterator
+
+from pytest import fixture, mark, raises, warns
+
+from pydoctrace import arm_tracing, disable_tracing, enable_tracing, install_signal_trigger, is_tracing_enabled, trace
+from pydoctrace.doctrace import trace_to_aggregated_component_puml, trace_to_sequence_puml
+from pydoctrace.exporters import ExportTarget
+from pydoctrace.exporters.plantuml.sequence import PlantUMLSequenceExporter
+from pydoctrace.switch import TRACING_SWITCH, TracingSwitch
+
+from tests.modules.factorial import factorial_recursive
+
+
+@fixture(scope='function')
+def restore_tracing_switch() -> Iterator[TracingSwitch]:
+    decorates, enabled, remaining_invocations, enabled_after_invocations = (
+        TRACING_SWITCH.decorates,
+        TRACING_SWITCH.enabled,
+        TRACING_SWITCH.remaining_invocations,
+        TRACING_SWITCH.enabled_after_invocations,
+    )
+    yield TRACING_SWITCH
+    (
+        TRACING_SWITCH.decorates,
+        TRACING_SWITCH.enabled,
+        TRACING_SWITCH.remaining_invocations,
+        TRACING_SWITCH.enabled_after_invocations,
+    ) = (decorates, enabled, remaining_invocations, enabled_after_invocations)
+
+
+@mark.parametrize(
+    ['tracing_mode', 'expected_decorates', 'expected_enabled'],
+    [
+        ('on', True, True),
+        ('paused', True, False),
+        ('off', False, False),
+    ],
+)
+def test_tracing_switch_modes(tracing_mode: str, expected_decorates: bool, expected_enabled: bool):
+    tracing_switch = TracingSwitch(tracing_mode)
+    assert tracing_switch.decorates == expected_decorates
+    assert tracing_switch.enabled == expected_enabled
+
+
+def test_tracing_switch_rejects_unsupported_modes():
+    with raises(ValueError, match='PYDOCTRACE_TRACING'):
+        TracingSwitch('maybe')
+
+
+@mark.parametrize(
+    ['environment', 'expected_decorates', 'expected_enabled'],
+    [
+        ({}, True, True),
+        ({'PYDOCTRACE_TRACING': ' Paused '}, True, False),
+        ({'PYDOCTRACE_TRACING': 'off'}, False, False),
+    ],
+)
+def test_tracing_switch_from_environment(environment: dict, expected_decorates: bool, expected_enabled: bool):
+    tracing_switch = TracingSwitch.from_environment(environment)
+    assert tracing_switch.decorates == expected_decorates
+    assert tracing_switch.enabled == expected_enabled
+
+
+def test_tracing_switch_from_environment_falls_back_to_the_default_mode():
+    with warns(RuntimeWarning, match="unsupported tracing mode 'of'"):
+        tracing_switch = TracingSwitch.from_environment({'PYDOCTRACE_TRACING': 'of'})
+
+    assert tracing_switch.decorates
+    assert tracing_switch.enabled
+
+
+def test_runtime_switch(tmp_path: Path, restore_tracing_switch: TracingSwitch):
+    diagram_path = tmp_path / 'factorial.puml'
+    traced_factorial = trace_to_sequence_puml(export_file_path_tpl=str(diagram_path))(factorial_recursive)
+
+    disable_tracing()
+    assert not is_tracing_enabled()
+    assert traced_factorial(3) == 6
+    assert not diagram_path.exists(), 'no diagram must be exported when the tracing is disabled'
+
+    enable_tracing()
+    assert is_tracing_enabled()
+    assert traced_factorial(3) == 6
+    assert diagram_path.exists()
+
+
+def test_switched_off_decorators_return_the_functions_unchanged(restore_tracing_switch: TracingSwitch):
+    restore_tracing_switch.decorates = False
+    restore_tracing_switch.enabled = False
+
+    assert trace_to_sequence_puml(factorial_recursive) is factorial_recursive
+    assert trace_to_aggregated_component_puml(factorial_recursive) is factorial_recursive
+
+
+def test_disabled_trace_block(tmp_path: Path, restore_tracing_switch: TracingSwitch):
+    tracing_function = gettrace()
+    disable_tracing()
+    with trace(exporters=[ExportTarget(PlantUMLSequenceExporter, str(tmp_path / 'block.puml'))]) as tracer:
+        assert tracer is None
+        assert gettrace() is tracing_function
+
+    assert not (tmp_path / 'block.puml').exists()
+
+
+def _count_traced_invocations(traced_function: Callable, diagram_path: Path, invocations: int) -> int:
+    traced_invocations = 0
+    for _ in range(invocations):
+        traced_function(3)
+        if diagram_path.exists():
+            traced_invocations += 1
+            diagram_path.unlink()
+
+    return traced_invocations
+
+
+def test_arm_tracing(tmp_path: Path, restore_tracing_switch: TracingSwitch):
+    diagram_path = tmp_path / 'factorial.puml'
+    traced_factorial = trace_to_sequence_puml(export_file_path_tpl=str(diagram_path))(factorial_recursive)
+    disable_tracing()
+
+    arm_tracing(2)
+    assert is_tracing_enabled()
+    assert _count_traced_invocations(traced_factorial, diagram_path, 4) == 2
+    assert not is_tracing_enabled(), 'the tracing must be disabled once the armed invocations are consumed'
+
+
+def test_arm_tracing_keeps_an_enabled_tracing_enabled(tmp_path: Path, restore_tracing_switch: TracingSwitch):
+    diagram_path = tmp_path / 'factorial.puml'
+    traced_factorial = trace_to_sequence_puml(export_file_path_tpl=str(diagram_path))(factorial_recursive)
+    enable_tracing()
+
+    arm_tracing(2)
+    # re-arming before the armed invocations are consumed keeps the state in force before the first arming
+    arm_tracing(1)
+    assert _count_traced_invocations(traced_factorial, diagram_path, 3) == 3
+    assert is_tracing_enabled(), 'the tracing must stay enabled once the armed invocations are consumed'
+    assert TRACING_SWITCH.remaining_invocations is None
+
+
+def test_arm_tracing_requires_invocations():
+    with raises(ValueError):
+        arm_tracing(0)
+
+
+@mark.skipif(not hasattr(signal, 'SIGUSR1'), reason='SIGUSR1 is not supported on this platform')
+def test_install_signal_trigger(tmp_path: Path, restore_tracing_switch: TracingSwitch):
+    diagram_path = tmp_path / 'factorial.puml'
+    traced_factorial = trace_to_sequence_puml(export_file_path_tpl=str(diagram_path))(factorial_recursive)
+    disable_tracing()
+
+    previous_handler = install_signal_trigger(signal.SIGUSR1, invocations=1)
+    try:
+        assert _count_traced_invocations(traced_factorial, diagram_path, 2) == 0
+
+        kill(getpid(), signal.SIGUSR1)
+        assert _count_traced_invocations(traced_factorial, diagram_path, 2) == 1
+
+        # the signal does not switch an enabled tracing off once the armed invocations are consumed
+        enable_tracing()
+        kill(getpid(), signal.SIGUSR1)
+        assert _count_traced_invocations(traced_factorial, diagram_path, 3) == 3
+        assert is_tracing_enabled()
+    finally:
+        signal.signal(signal.SIGUSR1, previous_handler)
@@ -0,0 +1,170 @@
+from io import BytesIO, StringIO
+from typing import Any, List, Type
+
+from pytest import MonkeyPatch, mark, raises
+
+from pydoctrace.callfilter import TRACE_ALL_FILTER
+from pydoctrace.domain.execution import CallEnd, Error, FunctionDescriptor
+from pydoctrace.exporters import Exporter, FunctionDescriptorExporter
+from pydoctrace.exporters.chrometrace import ChromeTraceExporter
+from pydoctrace.exporters.foldedstacks import FoldedStacksExporter, FoldedStacksTimeExporter
+from pydoctrace.exporters.jsonlines import JSONLinesExporter
+from pydoctrace.exporters.profile import CallgrindExporter, PStatsExporter
+from pydoctrace.tracer import MAX_ERROR_MESSAGE_LENGTH, ExecutionTracer
+
+from tests.modules.factorial import factorial_recursive, factorial_with_checker
+from tests.modules.fibonacci import fibonacci
+
+
+class DescriptorsRecorder(FunctionDescriptorExporter):
+    def __init__(self):
+        super().__init__(None)
+        self.called_functions: List[FunctionDescriptor] = []
+        self.return_lines: List[int] = []
+
+    def on_tracing_start_at(self, called: FunctionDescriptor, called_line: int):
+        self.called_functions.append(called)
+
+    def on_start_call_at(
+        self, caller: FunctionDescriptor, caller_line: int, called: FunctionDescriptor, called_line: int
+    ):
+        self.called_functions.append(called)
+
+    def on_return_at(self, *, called_line: int, **kwargs):
+        self.return_lines.append(called_line)
+
+    def on_tracing_end_at(self, called: FunctionDescriptor, called_line: int, arg: Any):
+        self.return_lines.append(called_line)
+
+
+class CallEndsRecorder(Exporter):
+    """
+    An exporter implementing the hooks receiving CallEnds only.
+    """
+
+    def __init__(self):
+        super().__init__(None)
+        self.events = []
+
+    def on_tracing_start(self, called: CallEnd):
+        self.events.append(('start', called))
+
+    def on_start_call(self, caller: CallEnd, called: CallEnd):
+        self.events.append(('call', caller, called))
+
+    def on_error_propagation(self, error_called: CallEnd, error_caller: CallEnd, error: Error):
+        self.events.append(('error', error_called, error_caller, error))
+
+    def on_return(self, *, called: CallEnd, caller: CallEnd, arg: Any):
+        self.events.append(('return', called, caller))
+
+    def on_tracing_end(self, called: CallEnd, arg: Any):
+        self.events.append(('end', called))
+
+    def on_unhandled_error_end(self, called: CallEnd, error: Error):
+        self.events.append(('unhandled_error', called, error))
+
+
+def test_tracer_creates_one_descriptor_per_function():
+    descriptors_recorder = DescriptorsRecorder()
+    assert ExecutionTracer(descriptors_recorder, TRACE_ALL_FILTER).runfunc(fibonacci, 4) == 3
+
+    # fibonacci(4) calls itself 8 times
+    assert len(descriptors_recorder.called_functions) == 9
+    fibonacci_function = descriptors_recorder.called_functions[0]
+    assert fibonacci_function == FunctionDescriptor(
+        'tests.modules.fibonacci', ('tests', 'modules', 'fibonacci'), 'fibonacci'
+    )
+    assert all(called_function is fibonacci_function for called_function in descriptors_recorder.called_functions)
+    assert len(descriptors_recorder.return_lines) == 9
+
+
+@mark.parametrize(
+    'exporter_class',
+    [
+        JSONLinesExporter,
+        ChromeTraceExporter,
+        FoldedStacksExporter,
+        FoldedStacksTimeExporter,
+        PStatsExporter,
+        CallgrindExporter,
+    ],
+)
+def test_streaming_exporters_do_not_create_call_ends(monkeypatch: MonkeyPatch, exporter_class: Type[Exporter]):
+    def fail_at_line(*args):
+        raise AssertionError('no CallEnd must be created')
+
+    monkeypatch.setattr(FunctionDescriptor, 'at_line', fail_at_line)
+    exporter = exporter_class(BytesIO() if exporter_class.binary_export else StringIO())
+    exporter.on_header('tests.modules.factorial', 'factorial_with_checker')
+
+    # the errors raised by the checker are propagated then handled
+    assert ExecutionTracer(exporter, TRACE_ALL_FILTER).runfunc(factorial_with_checker, -1) is None
+    exporter.on_footer()
+
+
+def test_tracer_pushes_call_ends_to_the_exporters_handling_them():
+    call_ends_recorder = CallEndsRecorder()
+    assert ExecutionTracer(call_ends_recorder, TRACE_ALL_FILTER).runfunc(factorial_recursive, 2) == 2
+
+    fq_module_text, fq_module_tuple = 'tests.modules.factorial', ('tests', 'modules', 'factorial')
+    start_event, call_event, *_, return_event, end_event = call_ends_recorder.events
+    assert start_event == ('start', CallEnd(fq_module_text, fq_module_tuple, 'factorial_recursive', 6))
+    assert call_event[0] == 'call'
+    caller, called = call_event[1:]
+    assert caller.function_name == called.function_name == 'factorial_recursive'
+    assert caller.line_index > called.line_index, 'the recursive call is made in the body of the function'
+    assert return_event[0] == 'return'
+    assert return_event[2].line_index == caller.line_index, 'the caller resumes where the call was made'
+    assert end_event[0] == 'end'
+    assert end_event[1].line_index > start_event[1].line_index
+
+
+class CountedRepr:
+    repr_calls = 0
+
+    def __repr__(self) -> str:
+        CountedRepr.repr_calls += 1
+        return 'CountedRepr()'
+
+
+def _raise_value_error(error_argument: Any):
+    raise ValueError(error_argument)
+
+
+def _handle_value_error(error_argument: Any) -> bool:
+    try:
+        _raise_value_error(error_argument)
+    except ValueError:
+        return True
+
+
+def _propagate_value_error(error_argument: Any):
+    _raise_value_error(error_argument)
+
+
+def test_tracer_materializes_the_propagated_errors_only():
+    CountedRepr.repr_calls = 0
+    call_ends_recorder = CallEndsRecorder()
+    assert ExecutionTracer(call_ends_recorder, TRACE_ALL_FILTER).runfunc(_handle_value_error, CountedRepr()) is True
+    assert CountedRepr.repr_calls == 1, 'the error propagated from _raise_value_error to _handle_value_error only'
+
+    CountedRepr.repr_calls = 0
+    with raises(ValueError):
+        ExecutionTracer(CallEndsRecorder(), TRACE_ALL_FILTER).runfunc(_propagate_value_error, CountedRepr())
+    assert CountedRepr.repr_calls == 1, 'the error is materialized once, even if it propagates through several frames'
+
+
+def test_tracer_bounds_the_error_messages():
+    call_ends_recorder = CallEndsRecorder()
+    ExecutionTracer(call_ends_recorder, TRACE_ALL_FILTER).runfunc(_handle_value_error, 'x' * 1000)
+
+    _, _, _, error = next(event for event in call_ends_recorder.events if event[0] == 'error')
+    assert error.class_name == 'ValueError'
+    assert len(error.message) == MAX_ERROR_MESSAGE_LENGTH
+    assert error.message.endswith('...')
+
+    call_ends_recorder = CallEndsRecorder()
+    ExecutionTracer(call_ends_recorder, TRACE_ALL_FILTER).runfunc(_handle_value_error, list(range(1000)))
+    _, _, _, error = next(event for event in call_ends_recorder.events if event[0] == 'error')
+    assert error.message == '[0, 1, 2, 3, 4, 5, ...]'